@@ -8,37 +8,396 @@ Flask microservice for:
 - OpenAI integration (optional)
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g, Response, stream_with_context
+from werkzeug.wsgi import get_input_stream
 from flask_cors import CORS
 import os
+import gc
+import json
+import time
+from collections import deque
 from dotenv import load_dotenv
 import traceback
 
+# Load environment variables (before the modules below read them)
+load_dotenv()
+
 # Import custom modules
 from resume_parser import ResumeParser
 from skill_matcher import SkillMatcher
+from skill_similarity import SkillSimilarity
 from openai_service import OpenAIService
+from batch_processor import ResumeBatchProcessor
+from eligibility_calculator import EligibilityCalculator, StudentColumns
+from result_cache import ResultCache
+from document_extractor import DocumentExtractor, UnsupportedDocumentError
+from student_index import StudentIndex, QuerySyntaxError
+from resume_index import ResumeIndex
+from incremental_eligibility import IncrementalEligibility
+from nlp_model import nlp as nlp_model
+from metrics import registry as metrics_registry, stage_timer, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from route_limits import RouteLimiter, web_workers
+from profiling import RequestProfiling
 
-# Load environment variables
-load_dotenv()
+# Load the spaCy model now (SPACY_PRELOAD=1, e.g. in a pre-forking master so
+# workers share it copy-on-write). Otherwise the first request starts loading
+# it in the background so that /health is reachable while it loads; no thread
+# is started at import time, since a process that forks afterwards would hand
+# its children a model lock that no thread will ever release
+if os.getenv('SPACY_PRELOAD', '0') == '1':
+    nlp_model.load()
+    gc.freeze()
 
 app = Flask(__name__)
 CORS(app)
 
+# Reject request bodies larger than this many bytes with 413
+app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_CONTENT_LENGTH', 32 * 1024 * 1024))
+
 # Initialize services
 resume_parser = ResumeParser()
 skill_matcher = SkillMatcher()
-openai_service = OpenAIService(api_key=os.getenv('OPENAI_API_KEY'))
+# Graded skill matching, once a matrix is built with skill_similarity.py
+SKILL_SIMILARITY_PATH = os.getenv('SKILL_SIMILARITY_PATH', './models/skill_similarity.npy')
+if os.path.exists(SKILL_SIMILARITY_PATH):
+    skill_matcher.skill_similarity = SkillSimilarity.load(SKILL_SIMILARITY_PATH, skill_matcher.skill_aliases)
+result_cache = ResultCache()
+openai_service = OpenAIService(api_key=os.getenv('OPENAI_API_KEY'), cache=result_cache)
+batch_processor = ResumeBatchProcessor()
+document_extractor = DocumentExtractor()
+student_index = StudentIndex(aliases=skill_matcher.skill_aliases)
+resume_index = ResumeIndex()
+request_profiling = RequestProfiling()
+eligibility_calculator = EligibilityCalculator()
+incremental_eligibility = IncrementalEligibility(eligibility_calculator)
+
+# Concurrency limits per route group (per process); unlisted routes such as
+# /health, /ready, /metrics and /match-skills are never limited
+route_limiter = RouteLimiter(
+    limits={'nlp': 4, 'batch': 1},
+    routes={
+        '/parse-resume': 'nlp',
+        '/parse-resume-file': 'nlp',
+        '/analyze-resume': 'nlp',
+        '/suggest-improvements': 'nlp',
+        '/parse-resume/batch': 'batch',
+        '/parse-resume/stream': 'batch',
+        '/calculate-eligibility/batch': 'batch',
+        '/match-skills/cohort': 'batch',
+        '/eligibility/students': 'batch',
+        '/resumes/index': 'batch'
+    }
+)
+
+# Request metrics (per route template, so /metrics stays bounded in size)
+REQUESTS_TOTAL = metrics_registry.counter(
+    'http_requests_total', 'HTTP requests handled.', ['route', 'method', 'status']
+)
+REQUEST_SECONDS = metrics_registry.histogram(
+    'http_request_duration_seconds', 'HTTP request latency.', ['route', 'method']
+)
+metrics_registry.counter(
+    'result_cache_lookups_total', 'Result cache lookups by outcome.', ['outcome']
+).set_function(lambda: {
+    (outcome,): result_cache.stats()[key]
+    for outcome, key in (('memory_hit', 'memoryHits'), ('disk_hit', 'diskHits'), ('miss', 'misses'))
+})
+metrics_registry.gauge(
+    'result_cache_hit_ratio', 'Fraction of result cache lookups served from cache.'
+).set_function(lambda: result_cache.stats()['hitRatio'])
+metrics_registry.gauge(
+    'result_cache_entries', 'Entries in the in-memory result cache.'
+).set_function(lambda: result_cache.stats()['memoryEntries'])
+metrics_registry.gauge(
+    'route_requests_in_flight', 'Requests in progress per concurrency-limited route group.', ['group']
+).set_function(lambda: {(group,): stats['inFlight'] for group, stats in route_limiter.stats().items()})
+metrics_registry.counter(
+    'route_rejections_total', 'Requests rejected with 503 because their route group was full.', ['group']
+).set_function(lambda: {(group,): stats['rejected'] for group, stats in route_limiter.stats().items()})
+metrics_registry.gauge(
+    'nlp_model_ready', '1 once the spaCy model is loaded.'
+).set_function(lambda: 1 if nlp_model.ready else 0)
+metrics_registry.gauge(
+    'skill_taxonomy_info', 'Skill taxonomy version in use (value is always 1).', ['version']
+).set_function(lambda: {(skill_matcher.taxonomy.version,): 1})
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.before_request
+def start_model_loading():
+    if not nlp_model.ready:
+        nlp_model.load_in_background()
+
+# Routes that read their body incrementally and are exempt from MAX_CONTENT_LENGTH
+STREAMING_ROUTES = {'/parse-resume/stream'}
+
+@app.before_request
+def reject_large_body():
+    # Checked up front so the routes' generic error handling cannot turn it into a 500
+    if request.url_rule is not None and request.url_rule.rule in STREAMING_ROUTES:
+        return None
+    if request.content_length is not None and request.content_length > app.config['MAX_CONTENT_LENGTH']:
+        return request_too_large(None)
+    return None
+
+# These routes keep their state (indexes, tracked students) in this process's
+# memory. Under several gunicorn workers each worker would hold a different
+# part of it and answers would depend on which worker took the request, so
+# they are refused unless the service runs a single worker, the default.
+# The count is read per request: gunicorn.conf.py only exports it once a
+# preloaded app has been imported
+PER_PROCESS_STATE_ROUTES = {
+    '/students/index',
+    '/students/index/<student_id>',
+    '/students/search',
+    '/resumes/index',
+    '/resumes/index/<resume_id>',
+    '/rank-resumes',
+    '/eligibility/students',
+    '/eligibility/students/<student_id>',
+    '/eligibility/jobs/<job_id>',
+    '/eligibility/scores'
+}
+
+if web_workers() > 1:
+    app.logger.warning(
+        'Running %d workers: %s are disabled (they need WEB_WORKERS=1)',
+        web_workers(), ', '.join(sorted(PER_PROCESS_STATE_ROUTES))
+    )
+
+@app.before_request
+def require_single_worker():
+    if request.url_rule is None or request.url_rule.rule not in PER_PROCESS_STATE_ROUTES or web_workers() <= 1:
+        return None
+    return jsonify({
+        'success': False,
+        'error': f'{request.url_rule.rule} keeps per-process state and requires a single worker (WEB_WORKERS=1)'
+    }), 503
+
+@app.before_request
+def acquire_route_slot():
+    group = route_limiter.group_for(request.url_rule.rule if request.url_rule is not None else None)
+    if group is None:
+        return None
+    if not route_limiter.acquire(group):
+        response = jsonify({
+            'success': False,
+            'error': 'Service is busy, please retry shortly'
+        })
+        response.status_code = 503
+        response.headers['Retry-After'] = '1'
+        return response
+    g.route_limit_group = group
+    return None
+
+@app.teardown_request
+def release_route_slot(exception=None):
+    group = g.pop('route_limit_group', None)
+    if group is not None:
+        route_limiter.release(group)
+
+# Profiling: an admin asks with ?profile=1 or an X-Profile: 1 header plus
+# X-Admin-Token, or the request is the 1 in PROFILE_SAMPLE_RATE picked for
+# continuous profiling; the stored profile's ID comes back in X-Profile-Id
+@app.before_request
+def start_request_profiler():
+    requested = request.args.get('profile') or request.headers.get('X-Profile')
+    if requested and requested != '0':
+        if not request_profiling.is_admin(request.headers.get('X-Admin-Token')):
+            return jsonify({
+                'success': False,
+                'error': 'Profiling requires a valid admin token'
+            }), 403
+        g.profile_reason = 'requested'
+    elif request_profiling.sampled():
+        g.profile_reason = 'sampled'
+    else:
+        return None
+    g.profile_started_at = time.time()
+    g.request_profiler = request_profiling.start()
+    return None
+
+@app.after_request
+def store_request_profile(response):
+    profiler = g.pop('request_profiler', None)
+    if profiler is not None:
+        profile = profiler.stop()
+        profile_id = request_profiling.store.add({
+            'route': request.url_rule.rule if request.url_rule is not None else request.path,
+            'method': request.method,
+            'status': response.status_code,
+            'reason': g.pop('profile_reason', None),
+            'startedAt': g.pop('profile_started_at', None),
+            'durationMs': round(profile.duration * 1000, 3)
+        }, profile)
+        response.headers['X-Profile-Id'] = profile_id
+    return response
+
+@app.teardown_request
+def stop_request_profiler(exception=None):
+    # Only still running when the request failed before after_request
+    profiler = g.pop('request_profiler', None)
+    if profiler is not None:
+        profiler.stop()
+
+@app.errorhandler(413)
+def request_too_large(error):
+    return jsonify({
+        'success': False,
+        'error': f"Request body exceeds {app.config['MAX_CONTENT_LENGTH']} bytes"
+    }), 413
+
+@app.after_request
+def record_request_metrics(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        REQUEST_SECONDS.observe(time.perf_counter() - started, route=route, method=request.method)
+        REQUESTS_TOTAL.inc(route=route, method=request.method, status=str(response.status_code))
+    return response
+
+# Upper bound on resumes accepted by one batch request
+MAX_BATCH_RESUMES = int(os.getenv('BATCH_MAX_RESUMES', 1000))
+
+# Upper bound on candidates accepted by one batch eligibility request
+MAX_BATCH_CANDIDATES = int(os.getenv('BATCH_MAX_CANDIDATES', 100000))
 
 @app.route('/health', methods=['GET'])
 def health_check():
-    """Health check endpoint"""
+    """Health check endpoint (liveness: the process is up and serving)"""
     return jsonify({
         'status': 'healthy',
         'service': 'AI Resume Parser',
         'version': '1.0.0'
     })
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus metrics for this process"""
+    return Response(metrics_registry.render(), content_type=METRICS_CONTENT_TYPE)
+
+@app.route('/profiles', methods=['GET'])
+def list_profiles():
+    """Recently stored request profiles (admin token in X-Admin-Token)"""
+    if not request_profiling.is_admin(request.headers.get('X-Admin-Token')):
+        return jsonify({
+            'success': False,
+            'error': 'A valid admin token is required'
+        }), 403
+    return jsonify({
+        'success': True,
+        'sampleRate': request_profiling.sample_rate,
+        'profiles': request_profiling.store.list()
+    })
+
+@app.route('/profiles/<profile_id>', methods=['GET'])
+def get_profile(profile_id):
+    """
+    One stored profile (admin token in X-Admin-Token)
+    
+    Query parameters: format=speedscope (default, JSON for speedscope.app)
+    or format=collapsed (text, one 'outer;...;inner count' line per stack)
+    """
+    if not request_profiling.is_admin(request.headers.get('X-Admin-Token')):
+        return jsonify({
+            'success': False,
+            'error': 'A valid admin token is required'
+        }), 403
+    
+    stored = request_profiling.store.get(profile_id)
+    if stored is None:
+        return jsonify({
+            'success': False,
+            'error': f'Profile {profile_id} not found'
+        }), 404
+    
+    info, profile = stored
+    if request.args.get('format') == 'collapsed':
+        return Response(profile.to_collapsed(), mimetype='text/plain')
+    return jsonify(profile.to_speedscope(f"{info['method']} {info['route']}"))
+
+@app.route('/ready', methods=['GET'])
+def readiness_check():
+    """Readiness endpoint: 200 once the NLP model is loaded, 503 until then"""
+    status = nlp_model.status()
+    return jsonify({
+        'ready': nlp_model.ready,
+        'nlp': status,
+        'skillTaxonomy': {
+            'version': skill_matcher.taxonomy.version,
+            'dictionaryVersion': skill_matcher.dictionary_version
+        }
+    }), 200 if nlp_model.ready else 503
+
+# Add resumes parsed with a resumeId to the /rank-resumes index (off by
+# default, and never under several workers: each would index only the
+# resumes it happened to parse)
+INDEX_PARSED_RESUMES = os.getenv('RESUME_INDEX_ON_PARSE', '0') == '1'
+
+def _index_parsed_resume(resume_id, text):
+    """Add a parsed resume to the ranking index (skipped without a resumeId)."""
+    if INDEX_PARSED_RESUMES and resume_id and web_workers() <= 1:
+        resume_index.add(str(resume_id), text)
+
+def _json_number(data, key, kind=int, minimum=None):
+    """
+    Optional numeric field of a JSON body: data[key] as kind, or None if absent.
+    
+    Raises:
+        ValueError: if the value is not a JSON number (an integer for kind
+            int) or is below minimum
+    """
+    value = data.get(key)
+    if value is None:
+        return None
+    accepted = (int,) if kind is int else (int, float)
+    if isinstance(value, bool) or not isinstance(value, accepted):
+        raise ValueError(f"{key} must be {'an integer' if kind is int else 'a number'}")
+    if minimum is not None and value < minimum:
+        raise ValueError(f'{key} must be at least {minimum}')
+    return kind(value)
+
+def _is_string_list(value):
+    """Whether a JSON value is a list of strings."""
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+def _is_cacheable_parse(result):
+    """Parse results cut short by the NLP time budget are not cached (a retry may finish)."""
+    degraded = result['structuredData'].get('degraded')
+    return degraded is None or degraded['reason'] != 'time'
+
+def _parse_resume_text(text):
+    """Parse, extract skills and analyze one resume (the cached unit of /parse-resume)."""
+    # Run the NLP pipeline once and share it across extractors
+    document = resume_parser.process(text)
+    
+    # Parse resume
+    parsed_data = resume_parser.parse(text, document)
+    
+    # Extract skills
+    with stage_timer('skills'):
+        skills = skill_matcher.extract_skills(text)
+    
+    # Generate analysis
+    with stage_timer('analysis'):
+        analysis = resume_parser.analyze_resume(text, skills, document)
+    
+    return {
+        'structuredData': parsed_data,
+        'skills': skills,
+        'analysis': analysis
+    }
+
+@app.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    """Result cache hit/miss counters"""
+    return jsonify({
+        'success': True,
+        'cache': result_cache.stats()
+    })
+
 @app.route('/parse-resume', methods=['POST'])
 def parse_resume():
     """
@@ -68,23 +427,105 @@ def parse_resume():
                 'error': 'Resume text is empty'
             }), 400
         
-        # Parse resume
-        parsed_data = resume_parser.parse(text)
+        cache_key = result_cache.make_key(
+            'parse-resume', text, resume_parser.VERSION, skill_matcher.dictionary_version
+        )
+        result = result_cache.get_or_compute(cache_key, lambda: _parse_resume_text(text), _is_cacheable_parse)
+        _index_parsed_resume(resume_id, text)
         
-        # Extract skills
-        skills = skill_matcher.extract_skills(text)
+        return jsonify({
+            'success': True,
+            'resumeId': resume_id,
+            **result
+        })
         
-        # Generate analysis
-        analysis = resume_parser.analyze_resume(text, skills)
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/parse-resume-file', methods=['POST'])
+def parse_resume_file():
+    """
+    Extract text from a PDF or DOCX resume and parse it
+    
+    Accepts one of:
+    - multipart/form-data with a "file" part (and optional "resumeId" field)
+    - the raw file as the request body (any non-JSON content type), with
+      optional ?filename=...&resumeId=... query parameters
+    - JSON {"path": "relative/to/FILE_INGEST_ROOT.pdf", "resumeId": "..."}
+      for batch jobs reading local files
+    
+    Returns the /parse-resume response plus "rawText" and "extraction"
+    (file type, page counts, truncation and per-page timeouts/failures).
+    """
+    try:
+        if request.is_json:
+            data = request.get_json() or {}
+            resume_id = data.get('resumeId')
+            if not data.get('path'):
+                return jsonify({
+                    'success': False,
+                    'error': 'A file or a path is required'
+                }), 400
+            extraction = document_extractor.extract_path(data['path'])
+        else:
+            upload = request.files.get('file')
+            if upload is not None:
+                content = upload.read()
+                filename = upload.filename or ''
+                resume_id = request.form.get('resumeId')
+            else:
+                content = request.get_data()
+                filename = request.args.get('filename', '')
+                resume_id = request.args.get('resumeId')
+            
+            if not content:
+                return jsonify({
+                    'success': False,
+                    'error': 'A file or a path is required'
+                }), 400
+            extraction = document_extractor.extract_bytes(content, filename)
+        
+        text = extraction.pop('text')
+        if not text.strip():
+            return jsonify({
+                'success': False,
+                'error': 'No text could be extracted from the file',
+                'extraction': extraction
+            }), 422
+        
+        cache_key = result_cache.make_key(
+            'parse-resume', text, resume_parser.VERSION, skill_matcher.dictionary_version
+        )
+        result = result_cache.get_or_compute(cache_key, lambda: _parse_resume_text(text), _is_cacheable_parse)
+        _index_parsed_resume(resume_id, text)
         
         return jsonify({
             'success': True,
             'resumeId': resume_id,
-            'structuredData': parsed_data,
-            'skills': skills,
-            'analysis': analysis
+            'rawText': text,
+            'extraction': extraction,
+            **result
         })
         
+    except UnsupportedDocumentError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 415
+    except PermissionError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 403
+    except FileNotFoundError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 404
     except Exception as e:
         traceback.print_exc()
         return jsonify({
@@ -92,6 +533,180 @@ def parse_resume():
             'error': str(e)
         }), 500
 
+@app.route('/parse-resume/batch', methods=['POST'])
+def parse_resume_batch():
+    """
+    Parse many resumes in one request using the worker process pool
+    
+    Expected JSON body:
+    {
+        "resumes": [
+            {"text": "Resume text content", "resumeId": "MongoDB resume ID (optional)"}
+        ],
+        "batchSize": 32 (optional),
+        "nProcess": 4 (optional)
+    }
+    
+    Results are returned in input order; a resume that fails to parse gets
+    its own error entry without failing the rest of the batch.
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or not isinstance(data.get('resumes'), list):
+            return jsonify({
+                'success': False,
+                'error': 'A list of resumes is required'
+            }), 400
+        
+        resumes = data['resumes']
+        if len(resumes) > MAX_BATCH_RESUMES:
+            return jsonify({
+                'success': False,
+                'error': f'At most {MAX_BATCH_RESUMES} resumes can be parsed per request'
+            }), 400
+        batch_size = _json_number(data, 'batchSize', int, minimum=1)
+        n_process = _json_number(data, 'nProcess', int, minimum=1)
+        
+        results = [None] * len(resumes)
+        texts = []
+        positions = []
+        
+        for i, resume in enumerate(resumes):
+            text = resume.get('text', '') if isinstance(resume, dict) else ''
+            if not isinstance(text, str) or not text.strip():
+                results[i] = {
+                    'success': False,
+                    'error': 'Resume text is empty'
+                }
+                continue
+            texts.append(text)
+            positions.append(i)
+        
+        parsed = batch_processor.parse(
+            texts,
+            batch_size=batch_size,
+            n_process=n_process,
+            parser=resume_parser,
+            matcher=skill_matcher
+        )
+        for i, text, result in zip(positions, texts, parsed):
+            results[i] = result
+            if result.get('success'):
+                _index_parsed_resume(resumes[i].get('resumeId'), text)
+        
+        for resume, result in zip(resumes, results):
+            result['resumeId'] = resume.get('resumeId') if isinstance(resume, dict) else None
+        
+        return jsonify({
+            'success': True,
+            'results': results
+        })
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/parse-resume/stream', methods=['POST'])
+def parse_resume_stream():
+    """
+    Parse a stream of resumes, reading and answering NDJSON incrementally
+    
+    Request body (application/x-ndjson), one record per line:
+        {"text": "Resume text content", "resumeId": "MongoDB resume ID (optional)"}
+    
+    Query parameters (optional): window (records in flight, capped at
+    STREAM_WINDOW), batchSize, nProcess
+    
+    The response is chunked NDJSON with one line per record, written as soon
+    as it is ready:
+        {"line": 1, "resumeId": "...", "success": true, "structuredData": ..., ...}
+    Results come in input order; malformed records get an error line
+    ({"line": n, "success": false, "error": "..."}) without ending the stream.
+    """
+    try:
+        window = min(request.args.get('window', batch_processor.stream_window, type=int), batch_processor.stream_window)
+        batch_size = request.args.get('batchSize', type=int)
+        n_process = request.args.get('nProcess', type=int)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    # Read the body directly: it may exceed MAX_CONTENT_LENGTH, memory is
+    # bounded by the window instead
+    body = get_input_stream(request.environ, max_content_length=None)
+    
+    def generate():
+        submitted = deque()  # (line, resumeId, text) of records handed to the parser
+        errors = deque()     # error lines waiting to be written, at most window
+        lines = enumerate(body, 1)
+        paused = False
+        
+        def texts():
+            # Stops early once window error lines are waiting; they can only
+            # be written in order after the records read before them
+            nonlocal paused
+            for line_number, line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    text = record.get('text', '') if isinstance(record, dict) else ''
+                    if not isinstance(text, str) or not text.strip():
+                        raise ValueError('Resume text is empty')
+                except ValueError as e:
+                    errors.append({'line': line_number, 'success': False, 'error': str(e)})
+                    if len(errors) >= window:
+                        paused = True
+                        return
+                    continue
+                submitted.append((line_number, record.get('resumeId'), text))
+                yield text
+        
+        try:
+            while True:
+                paused = False
+                for result in batch_processor.parse_stream(
+                    texts(),
+                    window=window,
+                    batch_size=batch_size,
+                    n_process=n_process,
+                    parser=resume_parser,
+                    matcher=skill_matcher
+                ):
+                    line_number, resume_id, text = submitted.popleft()
+                    if result.get('success'):
+                        _index_parsed_resume(resume_id, text)
+                    while errors and errors[0]['line'] < line_number:
+                        yield json.dumps(errors.popleft()) + '\n'
+                    yield json.dumps({'line': line_number, 'resumeId': resume_id, **result}) + '\n'
+                
+                # Every record read so far is answered: write the waiting
+                # errors, then read on if texts() stopped early
+                while errors:
+                    yield json.dumps(errors.popleft()) + '\n'
+                if not paused:
+                    break
+        except Exception as e:
+            traceback.print_exc()
+            errors.append({'success': False, 'error': str(e)})
+        
+        while errors:
+            yield json.dumps(errors.popleft()) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 @app.route('/extract-skills', methods=['POST'])
 def extract_skills():
     """
@@ -160,6 +775,77 @@ def match_skills():
             'error': str(e)
         }), 500
 
+@app.route('/match-skills/cohort', methods=['POST'])
+def match_skills_cohort():
+    """
+    Match many candidates against one set of job requirements, with
+    similarity-graded scores when a skill similarity matrix is loaded
+    
+    Expected JSON body:
+    {
+        "candidates": [
+            {"studentId": "...", "skills": ["python", "pytorch"]}
+        ],
+        "requiredSkills": {
+            "mandatory": ["python", "tensorflow"],
+            "preferred": ["docker"]
+        }
+    }
+    """
+    try:
+        data = request.get_json()
+        
+        candidates = data.get('candidates')
+        if not isinstance(candidates, list):
+            return jsonify({
+                'success': False,
+                'error': 'A list of candidates is required'
+            }), 400
+        
+        if len(candidates) > MAX_BATCH_CANDIDATES:
+            return jsonify({
+                'success': False,
+                'error': f'At most {MAX_BATCH_CANDIDATES} candidates can be scored per request'
+            }), 400
+        
+        for i, candidate in enumerate(candidates):
+            if not isinstance(candidate, dict):
+                raise ValueError(f'Candidate {i}: expected an object')
+            if not _is_string_list(candidate.get('skills', [])):
+                raise ValueError(f'Candidate {i}: skills must be a list of strings')
+        
+        required_skills = data.get('requiredSkills', {})
+        if not isinstance(required_skills, dict) or not all(
+            _is_string_list(required_skills.get(kind, [])) for kind in ('mandatory', 'preferred')
+        ):
+            raise ValueError('requiredSkills must hold mandatory and preferred lists of strings')
+        
+        results = skill_matcher.match_cohort(
+            [candidate.get('skills', []) for candidate in candidates],
+            required_skills
+        )
+        
+        for candidate, result in zip(candidates, results):
+            result['studentId'] = candidate.get('studentId')
+        
+        return jsonify({
+            'success': True,
+            'graded': skill_matcher.skill_similarity is not None,
+            'results': results
+        })
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/analyze-resume', methods=['POST'])
 def analyze_resume():
     """
@@ -183,13 +869,21 @@ def analyze_resume():
         text = data.get('text', '')
         resume_id = data.get('resumeId')
         
-        # Try OpenAI analysis if available
+        def local_analysis(text):
+            cache_key = result_cache.make_key(
+                'analyze-resume:local', text, resume_parser.VERSION, skill_matcher.dictionary_version
+            )
+            return result_cache.get_or_compute(
+                cache_key,
+                lambda: resume_parser.analyze_resume(text, skill_matcher.extract_skills(text))
+            )
+        
+        # Try OpenAI analysis if available (it caches successful responses
+        # itself and falls back to local analysis on failure or timeout)
         if openai_service.is_available():
-            analysis = openai_service.analyze_resume(text)
+            analysis = openai_service.analyze_resume(text, fallback=local_analysis)
         else:
-            # Fallback to local analysis
-            skills = skill_matcher.extract_skills(text)
-            analysis = resume_parser.analyze_resume(text, skills)
+            analysis = local_analysis(text)
         
         return jsonify({
             'success': True,
@@ -313,6 +1007,508 @@ def calculate_eligibility():
             'error': str(e)
         }), 500
 
+def _read_eligibility_batch():
+    """
+    Read a batch eligibility request body.
+    
+    JSON bodies carry the job, options and a "candidates" list. NDJSON bodies
+    (application/x-ndjson) carry the job and options on the first line and
+    one candidate per following line, so callers can stream candidates
+    without building one large JSON document; each candidate line is folded
+    straight into StudentColumns.
+    
+    Returns:
+        (options dict, StudentColumns), or (options dict, None) if the
+        candidates are not a list
+        
+    Raises:
+        ValueError: If an NDJSON line is not a JSON object (with its line number)
+    """
+    if request.mimetype == 'application/x-ndjson':
+        data = {}
+        lines = enumerate(request.stream, 1)
+        for number, line in lines:
+            line = line.strip()
+            if line:
+                try:
+                    data = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f'Line {number}: invalid JSON ({e})') from e
+                if not isinstance(data, dict):
+                    raise ValueError(f'Line {number}: expected a JSON object')
+                break
+        
+        # Candidate lines are decoded as they are read; track the current
+        # line for error messages
+        current = [0]
+        
+        def candidate_lines():
+            for number, line in lines:
+                current[0] = number
+                yield line
+        
+        try:
+            return data, StudentColumns.from_json_lines(candidate_lines(), limit=MAX_BATCH_CANDIDATES + 1)
+        except (ValueError, TypeError, AttributeError) as e:
+            raise ValueError(f'Line {current[0]}: invalid candidate ({e})') from e
+    
+    data = request.get_json() or {}
+    candidates = data.get('candidates', [])
+    if not isinstance(candidates, list):
+        return data, None
+    return data, StudentColumns.from_dicts(candidates[:MAX_BATCH_CANDIDATES + 1])
+
+@app.route('/calculate-eligibility/batch', methods=['POST'])
+def calculate_eligibility_batch():
+    """
+    Score many candidates against one job with EligibilityCalculator
+    
+    Expected JSON body:
+    {
+        "job": {
+            "requiredBranches": ["cse", "it"],
+            "minCGPA": 7.0,
+            "maxBacklogs": 0,
+            "minExperienceMonths": 0,
+            "mandatorySkills": ["python"],
+            "preferredSkills": ["docker"]
+        },
+        "candidates": [
+            {"studentId": "...", "name": "...", "branch": "cse", "cgpa": 8.1, "skills": ["python"], ...}
+        ],
+        "topK": 50 (optional),
+        "minScore": 60 (optional)
+    }
+    
+    Candidates may instead be streamed as NDJSON, see _read_eligibility_batch.
+    """
+    try:
+        data, candidates = _read_eligibility_batch()
+        job = data.get('job')
+        
+        if not isinstance(job, dict) or candidates is None:
+            return jsonify({
+                'success': False,
+                'error': 'A job and a list of candidates are required'
+            }), 400
+        
+        if len(candidates) > MAX_BATCH_CANDIDATES:
+            return jsonify({
+                'success': False,
+                'error': f'At most {MAX_BATCH_CANDIDATES} candidates can be scored per request'
+            }), 400
+        
+        top_k = data.get('topK')
+        min_score = data.get('minScore')
+        
+        results = eligibility_calculator.rank_candidates(
+            candidates,
+            job,
+            top_k=int(top_k) if top_k is not None else None,
+            min_score=float(min_score) if min_score is not None else None
+        )
+        
+        for result in results:
+            result['studentId'] = candidates.ids[result['index']]
+        
+        return jsonify({
+            'success': True,
+            'totalCandidates': len(candidates),
+            'results': results
+        })
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/students/index', methods=['POST'])
+def index_students():
+    """
+    Add or replace students in the reverse-lookup skill index
+    
+    Expected JSON body:
+    {
+        "students": [
+            {
+                "studentId": "...",
+                "skills": ["python", "docker"] or an /extract-skills "skills" object,
+                "cgpa": 8.1 (optional),
+                "branch": "cse" (optional),
+                "backlogs": 0 (optional)
+            }
+        ]
+    }
+    """
+    try:
+        data = request.get_json() or {}
+        students = data.get('students')
+        
+        if not isinstance(students, list):
+            return jsonify({
+                'success': False,
+                'error': 'A list of students is required'
+            }), 400
+        
+        indexed = student_index.add_many(students)
+        
+        return jsonify({
+            'success': True,
+            'indexed': indexed,
+            'index': student_index.stats()
+        })
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/students/index/<student_id>', methods=['DELETE'])
+def remove_indexed_student(student_id):
+    """Remove a student from the skill index"""
+    removed = student_index.remove(student_id)
+    return jsonify({
+        'success': removed,
+        'studentId': student_id
+    }), 200 if removed else 404
+
+@app.route('/students/search', methods=['POST'])
+def search_students():
+    """
+    Find students by boolean skill query and numeric filters
+    
+    Expected JSON body:
+    {
+        "query": "python AND (docker OR kubernetes) AND cgpa >= 7",
+        "minCgpa": 7.0 (optional),
+        "branches": ["cse", "it"] (optional),
+        "maxBacklogs": 0 (optional),
+        "limit": 100 (optional)
+    }
+    
+    Query terms are skills (multi-word skills may be quoted), combined with
+    AND / OR / NOT and parentheses; cgpa and backlogs can be compared with
+    >=, <=, >, <, =, != and branch with = and !=.
+    """
+    try:
+        data = request.get_json() or {}
+        
+        query = data.get('query')
+        if query is not None and not isinstance(query, str):
+            raise ValueError('query must be a string')
+        branches = data.get('branches')
+        if branches is not None and (
+            not isinstance(branches, list) or not all(isinstance(branch, str) for branch in branches)
+        ):
+            raise ValueError('branches must be a list of strings')
+        
+        total, student_ids = student_index.query(
+            query,
+            min_cgpa=_json_number(data, 'minCgpa', float),
+            branches=branches,
+            max_backlogs=_json_number(data, 'maxBacklogs', int),
+            limit=_json_number(data, 'limit', int, minimum=0)
+        )
+        
+        return jsonify({
+            'success': True,
+            'total': total,
+            'studentIds': student_ids
+        })
+        
+    except QuerySyntaxError as e:
+        return jsonify({
+            'success': False,
+            'error': f'Invalid query: {e}'
+        }), 400
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/resumes/index', methods=['POST'])
+def index_resumes():
+    """
+    Add or replace resume texts in the /rank-resumes index
+    
+    Expected JSON body:
+    {
+        "resumes": [
+            {"resumeId": "...", "text": "Resume text content"}
+        ]
+    }
+    
+    Resumes parsed with a resumeId are also indexed when
+    RESUME_INDEX_ON_PARSE=1; this is for loading stored resumes, e.g.
+    after a restart.
+    """
+    try:
+        data = request.get_json() or {}
+        resumes = data.get('resumes')
+        
+        if not isinstance(resumes, list):
+            return jsonify({
+                'success': False,
+                'error': 'A list of resumes is required'
+            }), 400
+        
+        pairs = []
+        for resume in resumes:
+            if not isinstance(resume, dict) or not resume.get('resumeId') or not isinstance(resume.get('text'), str):
+                return jsonify({
+                    'success': False,
+                    'error': 'Every resume needs a resumeId and a text'
+                }), 400
+            pairs.append((str(resume['resumeId']), resume['text']))
+        
+        indexed = resume_index.add_many(pairs)
+        
+        return jsonify({
+            'success': True,
+            'indexed': indexed,
+            'index': resume_index.stats()
+        })
+        
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/resumes/index/<resume_id>', methods=['DELETE'])
+def remove_indexed_resume(resume_id):
+    """Remove a resume from the ranking index"""
+    removed = resume_index.remove(resume_id)
+    return jsonify({
+        'success': removed,
+        'resumeId': resume_id
+    }), 200 if removed else 404
+
+@app.route('/rank-resumes', methods=['POST'])
+def rank_resumes():
+    """
+    Rank every indexed resume against a job description (BM25)
+    
+    Expected JSON body:
+    {
+        "jobDescription": "We are hiring a backend engineer: Python, Django, ...",
+        "topK": 10 (optional),
+        "minScore": 0 (optional)
+    }
+    """
+    try:
+        data = request.get_json() or {}
+        job_description = data.get('jobDescription')
+        
+        if not isinstance(job_description, str) or not job_description.strip():
+            return jsonify({
+                'success': False,
+                'error': 'A job description is required'
+            }), 400
+        
+        top_k = _json_number(data, 'topK', int, minimum=0)
+        min_score = _json_number(data, 'minScore', float)
+        
+        ranking = resume_index.search(
+            job_description,
+            top_k=10 if top_k is None else top_k,
+            min_score=min_score or 0.0
+        )
+        
+        return jsonify({
+            'success': True,
+            'totalResumes': len(resume_index),
+            'totalMatched': ranking['total'],
+            'results': ranking['results']
+        })
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/eligibility/students', methods=['POST'])
+def upsert_eligibility_students():
+    """
+    Add or replace students in the incremental eligibility engine
+    
+    Expected JSON body:
+    {
+        "students": [
+            {"studentId": "...", "name": "...", "branch": "cse", "cgpa": 8.1, "skills": ["python"], ...}
+        ]
+    }
+    
+    Replaced students are diffed against their last profile and only the
+    affected score components are recomputed, for every registered job.
+    """
+    try:
+        data = request.get_json() or {}
+        students = data.get('students')
+        
+        if not isinstance(students, list):
+            return jsonify({
+                'success': False,
+                'error': 'A list of students is required'
+            }), 400
+        
+        report = incremental_eligibility.upsert_students(students)
+        
+        return jsonify({'success': True, **report})
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/eligibility/students/<student_id>', methods=['PATCH', 'DELETE'])
+def change_eligibility_student(student_id):
+    """
+    Apply a student delta (PATCH) or drop the student (DELETE)
+    
+    PATCH JSON body: the changed profile fields only, e.g.
+    {"skills": ["python", "docker"]} or {"cgpa": 8.4}
+    """
+    try:
+        if request.method == 'DELETE':
+            removed = incremental_eligibility.remove_student(student_id)
+            return jsonify({
+                'success': removed,
+                'studentId': student_id
+            }), 200 if removed else 404
+        
+        changes = request.get_json() or {}
+        report = incremental_eligibility.update_student(student_id, changes)
+        
+        return jsonify({'success': True, **report})
+        
+    except KeyError:
+        return jsonify({
+            'success': False,
+            'error': f'Unknown student: {student_id}'
+        }), 404
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/eligibility/jobs/<job_id>', methods=['PUT', 'PATCH', 'DELETE'])
+def change_eligibility_job(job_id):
+    """
+    Register or replace a job (PUT), apply a job delta (PATCH) or drop it (DELETE)
+    
+    PUT JSON body: the full job, as for /calculate-eligibility/batch
+    PATCH JSON body: the changed fields only, e.g. {"minCGPA": 7.5}
+    
+    Responses list the (student, job) pairs whose eligibility level changed
+    under "transitions".
+    """
+    try:
+        if request.method == 'DELETE':
+            removed = incremental_eligibility.remove_job(job_id)
+            return jsonify({
+                'success': removed,
+                'jobId': job_id
+            }), 200 if removed else 404
+        
+        data = request.get_json() or {}
+        if request.method == 'PUT':
+            report = incremental_eligibility.upsert_job(job_id, data)
+        else:
+            report = incremental_eligibility.update_job(job_id, data)
+        
+        return jsonify({'success': True, **report})
+        
+    except KeyError:
+        return jsonify({
+            'success': False,
+            'error': f'Unknown job: {job_id}'
+        }), 404
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/eligibility/scores', methods=['GET'])
+def get_eligibility_scores():
+    """
+    Current eligibility from the incremental engine
+    
+    Query parameters: studentId and/or jobId (at least one), limit (optional)
+    """
+    student_id = request.args.get('studentId')
+    job_id = request.args.get('jobId')
+    
+    if student_id is None and job_id is None:
+        return jsonify({
+            'success': False,
+            'error': 'studentId or jobId is required'
+        }), 400
+    
+    try:
+        results = incremental_eligibility.get_scores(
+            student_id=student_id,
+            job_id=job_id,
+            limit=request.args.get('limit', type=int)
+        )
+        
+        return jsonify({
+            'success': True,
+            'results': results
+        })
+        
+    except KeyError as e:
+        return jsonify({
+            'success': False,
+            'error': f'Unknown student or job: {e.args[0]}'
+        }), 404
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/suggest-improvements', methods=['POST'])
 def suggest_improvements():
     """
@@ -349,8 +1545,9 @@ def suggest_improvements():
         }), 500
 
 if __name__ == '__main__':
+    # Development server only; use serve.py (gunicorn) in production
     port = int(os.getenv('PORT', 5001))
-    debug = os.getenv('FLASK_ENV', 'development') == 'development'
+    debug = os.getenv('FLASK_ENV', 'production') == 'development'
     
     print(f"""
     ╔═══════════════════════════════════════════════════════════╗
@@ -0,0 +1,242 @@
+"""
+Batch Processor Module
+
+Parses many resumes per request by fanning them out over a pool of
+worker processes, each of which loads the spaCy model once and runs
+nlp.pipe over its share of the batch. Unbounded streams of resumes are
+parsed chunk by chunk with a bounded number of records in flight.
+"""
+
+import math
+import multiprocessing
+import os
+import traceback
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from route_limits import web_workers
+
+# Per-process services, created once by the pool initializer
+_worker_parser = None
+_worker_matcher = None
+
+
+def _init_worker():
+    """Load the parser (and with it the spaCy model) once per worker."""
+    global _worker_parser, _worker_matcher
+    from resume_parser import ResumeParser
+    from skill_matcher import SkillMatcher
+
+    _worker_parser = ResumeParser()
+    _worker_matcher = SkillMatcher()
+
+
+def parse_chunk(parser, matcher, texts: List[str], batch_size: int) -> List[Dict[str, Any]]:
+    """
+    Parse a list of resume texts in one nlp.pipe stream.
+
+    Args:
+        parser: ResumeParser instance
+        matcher: SkillMatcher instance
+        texts: Non-empty resume texts
+        batch_size: spaCy batch size
+
+    Returns:
+        One result dict per text, in input order
+    """
+    results = []
+
+    for text, document in zip(texts, parser.process_many(texts, batch_size=batch_size)):
+        try:
+            skills = matcher.extract_skills(text)
+            results.append({
+                'success': True,
+                'structuredData': parser.parse(text, document),
+                'skills': skills,
+                'analysis': parser.analyze_resume(text, skills, document)
+            })
+        except Exception as e:
+            traceback.print_exc()
+            results.append({
+                'success': False,
+                'error': str(e)
+            })
+
+    return results
+
+
+def _chunked(texts: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Consume texts lazily in lists of at most size items."""
+    iterator = iter(texts)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def default_processes() -> int:
+    """
+    Pool size for one web worker: the host's CPUs split across the
+    web_workers() gunicorn workers, at least 1.
+
+    Every web worker has its own pool and every pool process loads its own
+    spaCy model, so WEB_WORKERS x pool size model copies can be resident
+    at once; sizing the pools per host keeps that at about one per CPU.
+    """
+    return max(1, (os.cpu_count() or 1) // web_workers())
+
+
+def _parse_chunk_in_worker(args: Tuple[List[str], int]) -> List[Dict[str, Any]]:
+    """Pool task: parse one chunk with this worker's services."""
+    texts, batch_size = args
+    return parse_chunk(_worker_parser, _worker_matcher, texts, batch_size)
+
+
+class ResumeBatchProcessor:
+    """
+    Parse batches of resumes across a multiprocessing pool.
+
+    The pool is created lazily on first use so that importing the service
+    (and forking web workers) does not start extra processes. Its size is
+    BATCH_N_PROCESS if set, else default_processes().
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        start_method: Optional[str] = None
+    ):
+        self.processes = processes or int(os.getenv('BATCH_N_PROCESS', 0)) or default_processes()
+        self.batch_size = batch_size or int(os.getenv('BATCH_SIZE', 32))
+        self.start_method = start_method or os.getenv('BATCH_START_METHOD', 'spawn')
+        self.stream_window = int(os.getenv('STREAM_WINDOW', 256))
+        self._pool = None
+
+    def _get_pool(self):
+        """Create the worker pool on first use."""
+        if self._pool is None:
+            context = multiprocessing.get_context(self.start_method)
+            self._pool = context.Pool(self.processes, initializer=_init_worker)
+        return self._pool
+
+    def parse(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+        parser=None,
+        matcher=None
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse resume texts, preserving input order.
+
+        Args:
+            texts: Non-empty resume texts
+            batch_size: spaCy batch size (defaults to BATCH_SIZE)
+            n_process: Maximum worker processes to spread this batch over;
+                1 parses in the calling process with parser/matcher
+            parser: ResumeParser used when running in-process
+            matcher: SkillMatcher used when running in-process
+
+        Returns:
+            One result dict per text
+        """
+        if not texts:
+            return []
+
+        batch_size = max(1, batch_size or self.batch_size)
+        n_process = min(max(1, n_process or self.processes), self.processes)
+
+        if n_process == 1 and parser is not None and matcher is not None:
+            return parse_chunk(parser, matcher, texts, batch_size)
+
+        # Split into at most n_process contiguous chunks so that results can be
+        # concatenated back in order and no more than n_process workers are busy
+        chunk_count = min(n_process, math.ceil(len(texts) / batch_size))
+        chunk_size = math.ceil(len(texts) / chunk_count)
+        chunks = [
+            (texts[i:i + chunk_size], batch_size)
+            for i in range(0, len(texts), chunk_size)
+        ]
+
+        results = []
+        for chunk_results in self._get_pool().imap(_parse_chunk_in_worker, chunks):
+            results.extend(chunk_results)
+
+        return results
+
+    def parse_stream(
+        self,
+        texts: Iterable[str],
+        window: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+        parser=None,
+        matcher=None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parse a (possibly unbounded) iterable of resume texts lazily.
+
+        Texts are read in chunks of batch_size and handed to the pool as soon
+        as they arrive; once window records are in flight, the oldest chunk
+        is awaited before more input is read, so memory stays bounded by the
+        window however long the stream is.
+
+        Args:
+            texts: Non-empty resume texts, consumed lazily
+            window: Maximum records read but not yet yielded (defaults to STREAM_WINDOW)
+            batch_size: Records per chunk / spaCy batch (defaults to BATCH_SIZE)
+            n_process: 1 parses in the calling process with parser/matcher
+            parser: ResumeParser used when running in-process
+            matcher: SkillMatcher used when running in-process
+
+        Yields:
+            One result dict per text, in input order; a failed chunk yields
+            an error result for each of its records
+        """
+        window = max(1, window or self.stream_window)
+        batch_size = min(max(1, batch_size or self.batch_size), window)
+        n_process = min(max(1, n_process or self.processes), self.processes)
+
+        if n_process == 1 and parser is not None and matcher is not None:
+            for chunk in _chunked(texts, batch_size):
+                yield from parse_chunk(parser, matcher, chunk, batch_size)
+            return
+
+        pool = self._get_pool()
+        pending = deque()
+        in_flight = 0
+
+        for chunk in _chunked(texts, batch_size):
+            pending.append((pool.apply_async(_parse_chunk_in_worker, ((chunk, batch_size),)), len(chunk)))
+            in_flight += len(chunk)
+            while in_flight >= window:
+                in_flight -= yield from self._collect(pending)
+
+        while pending:
+            yield from self._collect(pending)
+
+    @staticmethod
+    def _collect(pending: deque):
+        """Yield the results of the oldest pending chunk; returns its size."""
+        result, size = pending.popleft()
+        try:
+            yield from result.get()
+        except Exception as e:
+            traceback.print_exc()
+            for _ in range(size):
+                yield {
+                    'success': False,
+                    'error': str(e)
+                }
+        return size
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
@@ -0,0 +1,7 @@
+"""
+Benchmarks for the AI service hot paths.
+
+Run from the ai-service directory:
+    python -m benchmarks.run --output benchmarks/results/latest.json
+    python -m benchmarks.run --baseline benchmarks/results/baseline.json
+"""
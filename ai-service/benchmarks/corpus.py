@@ -0,0 +1,187 @@
+"""
+Synthetic Corpus Module
+
+Seeded generators for resumes, job postings and student cohorts. The same
+seed always produces the same corpus, so benchmark runs are comparable.
+"""
+
+import random
+from typing import Dict, List
+
+FIRST_NAMES = ['Aarav', 'Priya', 'Rohan', 'Ananya', 'Vikram', 'Sneha', 'Arjun', 'Kavya', 'Rahul', 'Meera']
+LAST_NAMES = ['Sharma', 'Patel', 'Iyer', 'Reddy', 'Gupta', 'Nair', 'Singh', 'Das', 'Joshi', 'Kulkarni']
+COMPANIES = ['Infosys Ltd', 'Tata Consultancy Services', 'Acme Labs', 'Globex Corp', 'Zoho Corporation', 'Flipkart']
+TITLES = ['Software Engineer Intern', 'Backend Developer', 'Data Analyst', 'Frontend Developer', 'ML Engineer']
+INSTITUTES = ['Indian Institute of Technology Bombay', 'NIT Trichy', 'Pune University', 'VIT Vellore']
+DEGREES = ['B.Tech in Computer Science', 'B.E. in Information Technology', 'M.Tech in Data Science', 'B.Sc Computer Science']
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+SKILLS = [
+    'python', 'java', 'javascript', 'typescript', 'c++', 'go', 'react', 'node.js', 'express', 'django',
+    'flask', 'spring boot', 'mongodb', 'postgresql', 'mysql', 'redis', 'docker', 'kubernetes', 'aws',
+    'azure', 'gcp', 'terraform', 'git', 'jenkins', 'tensorflow', 'pytorch', 'pandas', 'numpy',
+    'scikit-learn', 'machine learning', 'sql', 'graphql', 'rest', 'linux', 'kafka', 'spark', 'tableau'
+]
+SOFT_SKILLS = ['communication', 'leadership', 'teamwork', 'problem solving', 'time management']
+BRANCHES = ['cse', 'computer science', 'it', 'ece', 'electrical', 'mechanical', 'civil']
+FILLER = (
+    'Developed and implemented scalable services used by 500 users, improved latency by 25% '
+    'and collaborated with cross functional teams on design reviews and testing. '
+)
+
+# Resume size classes: (experience entries, projects, filler sentences per entry)
+RESUME_SIZES = {
+    'short': (1, 1, 1),
+    'typical': (3, 3, 3),
+    'long': (12, 10, 25)
+}
+
+
+def generate_resume(rng: random.Random, size: str = 'typical') -> str:
+    """Generate one resume text of the given size class."""
+    experiences, projects, filler = RESUME_SIZES[size]
+    name = f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+    handle = name.lower().replace(' ', '')
+
+    lines = [
+        name,
+        f'{handle}@example.com | +91 98{rng.randint(10000000, 99999999)} | '
+        f'linkedin.com/in/{handle} | github.com/{handle}',
+        '',
+        'Summary',
+        f'Motivated engineer skilled in {", ".join(rng.sample(SKILLS, 3))}. {FILLER}',
+        '',
+        'Experience'
+    ]
+    for _ in range(experiences):
+        start_year = rng.randint(2015, 2023)
+        lines += [
+            rng.choice(TITLES),
+            rng.choice(COMPANIES),
+            f'{rng.choice(MONTHS)} {start_year} - {rng.choice(MONTHS + ["Present"])} {start_year + 1}',
+            f'Worked with {", ".join(rng.sample(SKILLS, 4))}. ' + FILLER * filler,
+            ''
+        ]
+
+    lines += [
+        'Education',
+        rng.choice(DEGREES),
+        rng.choice(INSTITUTES),
+        f'{rng.uniform(6, 10):.2f} CGPA',
+        '',
+        'Projects'
+    ]
+    for i in range(projects):
+        lines += [
+            f'Project {i + 1}',
+            f'Built with {", ".join(rng.sample(SKILLS, 3))}. ' + FILLER * filler,
+            ''
+        ]
+
+    lines += [
+        'Certifications',
+        'AWS Certified Cloud Practitioner',
+        '',
+        'Skills',
+        ', '.join(rng.sample(SKILLS, rng.randint(6, 15)) + rng.sample(SOFT_SKILLS, 2))
+    ]
+    return '\n'.join(lines)
+
+
+# Repeating units of pathological text (as in PDF dumps of tables) that
+# make backtracking regular expressions for contact, date and grade
+# extraction super-linear
+ADVERSARIAL_UNITS = {
+    'word-run': 'a',
+    'dotted-words': 'a.',
+    'at-signs': 'a@',
+    'digit-table': '1234x',
+    'digits-and-punctuation': '1.2.3 (4) 5-6 ',
+    'decimal-run': '1.',
+    'month-run': 'jan',
+    'range-separators': 'to',
+    'digit-run': '1'
+}
+
+
+def generate_adversarial(kind: str, length: int) -> str:
+    """length characters of one ADVERSARIAL_UNITS pattern."""
+    unit = ADVERSARIAL_UNITS[kind]
+    return (unit * (length // len(unit) + 1))[:length]
+
+
+def generate_adversarial_resume(kind: str, length: int) -> str:
+    """A short resume whose education and experience lines carry adversarial text."""
+    junk = generate_adversarial(kind, length // 2)
+    return '\n'.join([
+        'Priya Sharma',
+        'Education',
+        'B.Tech in Computer Science',
+        junk,
+        'Experience',
+        'Jan 2020 ' + junk,
+        'Skills',
+        'python, sql'
+    ])
+
+
+def generate_long_document(seed: int, length: int) -> str:
+    """Catalog-style dump: many resumes concatenated into one text of length characters."""
+    block = '\n\n'.join(generate_resumes(seed, 'long', 20))
+    return (block * (length // len(block) + 1))[:length]
+
+
+def generate_resumes(seed: int, size: str, count: int) -> List[str]:
+    """Generate count resumes of one size class."""
+    rng = random.Random(f'{seed}:resume:{size}')
+    return [generate_resume(rng, size) for _ in range(count)]
+
+
+def generate_job(seed: int) -> Dict:
+    """Generate a job posting in EligibilityCalculator's input format."""
+    rng = random.Random(f'{seed}:job')
+    skills = rng.sample(SKILLS, 8)
+    return {
+        'title': 'Software Engineer',
+        'company': rng.choice(COMPANIES),
+        'requiredBranches': ['cse', 'it', 'ece'],
+        'minCGPA': 7.0,
+        'minTenth': 60,
+        'minTwelfth': 60,
+        'maxBacklogs': 1,
+        'minExperienceMonths': 0,
+        'mandatorySkills': skills[:3],
+        'preferredSkills': skills[3:]
+    }
+
+
+def generate_students(seed: int, count: int) -> List[Dict]:
+    """Generate a cohort of student profiles."""
+    rng = random.Random(f'{seed}:students:{count}')
+    students = []
+    for i in range(count):
+        students.append({
+            'studentId': f'S{i:06d}',
+            'name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'email': f'student{i}@example.com',
+            'branch': rng.choice(BRANCHES),
+            'cgpa': round(rng.uniform(5.5, 10), 2),
+            'skills': rng.sample(SKILLS, rng.randint(2, 12)),
+            'experienceMonths': rng.choice([0, 0, 0, 2, 3, 6, 12]),
+            'backlogs': rng.choice([0, 0, 0, 0, 1, 2]),
+            'tenthPercentage': round(rng.uniform(55, 99), 1),
+            'twelfthPercentage': round(rng.uniform(55, 99), 1)
+        })
+    return students
+
+
+def generate_requirements(seed: int, count: int) -> List[Dict]:
+    """Generate (candidate skills, required skills) pairs for match_skills."""
+    rng = random.Random(f'{seed}:requirements:{count}')
+    pairs = []
+    for _ in range(count):
+        required = rng.sample(SKILLS, 8)
+        pairs.append({
+            'candidateSkills': rng.sample(SKILLS, rng.randint(3, 15)),
+            'requiredSkills': {'mandatory': required[:4], 'preferred': required[4:]}
+        })
+    return pairs
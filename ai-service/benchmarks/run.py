@@ -0,0 +1,491 @@
+"""
+Benchmark Runner
+
+Microbenchmarks of the service hot paths plus end-to-end runs through the
+Flask test client, reported as throughput, p50/p95/p99 latency and peak RSS
+in JSON. With --baseline, results are compared against a stored run and the
+exit code is non-zero when any benchmark regressed beyond --threshold.
+
+Usage (from the ai-service directory):
+    python -m benchmarks.run [--suite micro|e2e|all] [--quick]
+                             [--output results.json]
+                             [--baseline baseline.json] [--threshold 0.15]
+                             [--openai-stub]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from benchmarks import corpus
+
+DEFAULT_SEED = 1234
+COHORT_SIZES = [100, 1000, 10000, 100000]
+QUICK_COHORT_SIZES = [100, 1000]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KB on Linux and bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def measure(fn: Callable[[Any], Any], inputs: List[Any], calls: int, warmup: int = 2, items_per_call: int = 1) -> Dict:
+    """
+    Time fn over inputs (cycled) and summarize per-call latencies.
+
+    Args:
+        fn: Function under test, called with one input
+        inputs: Inputs to cycle through
+        calls: Number of timed calls
+        warmup: Untimed calls made first
+        items_per_call: Items processed per call, for item throughput
+
+    Returns:
+        Summary statistics for the benchmark
+    """
+    for i in range(warmup):
+        fn(inputs[i % len(inputs)])
+
+    latencies = []
+    started = time.perf_counter()
+    for i in range(calls):
+        call_started = time.perf_counter()
+        fn(inputs[i % len(inputs)])
+        latencies.append(time.perf_counter() - call_started)
+    total = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'calls': calls,
+        'totalSeconds': round(total, 4),
+        'callsPerSecond': round(calls / total, 2) if total else None,
+        'itemsPerSecond': round(calls * items_per_call / total, 2) if total else None,
+        'p50Ms': round(percentile(latencies, 0.50) * 1000, 4),
+        'p95Ms': round(percentile(latencies, 0.95) * 1000, 4),
+        'p99Ms': round(percentile(latencies, 0.99) * 1000, 4),
+        'maxMs': round(latencies[-1] * 1000, 4),
+        'peakRssMb': peak_rss_mb()
+    }
+
+
+def retained_bytes(build: Callable[[Any], Any], value: Any) -> int:
+    """Bytes allocated by build(value) that are still held by its result."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build(value)
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained
+
+
+def measure_loader(build: Callable[[Any], Any], value: Any, items: int, calls: int) -> Dict:
+    """measure() for a bulk loader, plus the memory its result holds per item."""
+    stats = measure(build, [value], calls, warmup=1, items_per_call=items)
+    stats['retainedBytesPerItem'] = round(retained_bytes(build, value) / items, 1)
+    return stats
+
+
+def measure_growth(fn: Callable[[str], Any], make_input: Callable[[int], str], small: int, large: int, calls: int) -> Dict:
+    """
+    measure() on a large input, plus how p50 grew from a small input.
+
+    For linear-time code growth stays close to large / small; quadratic
+    code grows with its square.
+    """
+    stats = measure(fn, [make_input(large)], calls, warmup=1, items_per_call=large)
+    small_p50 = measure(fn, [make_input(small)], calls, warmup=1)['p50Ms']
+    stats['growth'] = round(stats['p50Ms'] / small_p50, 2) if small_p50 else None
+    stats['sizeRatio'] = round(large / small, 2)
+    return stats
+
+
+def extract_all_fields(text: str) -> None:
+    """Run every contact/date/grade extractor over text."""
+    import text_extractors
+
+    text_extractors.find_email(text)
+    text_extractors.find_phone(text)
+    text_extractors.find_linkedin(text)
+    text_extractors.find_github(text)
+    text_extractors.find_date_ranges(text)
+    text_extractors.find_grade(text)
+    text_extractors.has_quantified_impact(text)
+
+
+def micro_benchmarks(seed: int, quick: bool) -> Dict[str, Callable[[], Dict]]:
+    """Per-function benchmarks, keyed by name (built lazily)."""
+    from resume_parser import ResumeParser
+    from skill_matcher import SkillMatcher
+    from eligibility_calculator import EligibilityCalculator, StudentColumns
+    from student_index import StudentIndex
+    from skill_similarity import SkillSimilarity
+    from resume_index import ResumeIndex
+    from skill_taxonomy import SkillTaxonomy, compile_taxonomy, load_source
+
+    parser = ResumeParser()
+    matcher = SkillMatcher()
+    calculator = EligibilityCalculator()
+    job = corpus.generate_job(seed)
+    scale = 1 if quick else 4
+
+    benchmarks = {}
+
+    for size in corpus.RESUME_SIZES:
+        texts = corpus.generate_resumes(seed, size, 20)
+        calls = {'short': 50, 'typical': 30, 'long': 5}[size] * scale
+        benchmarks[f'ResumeParser.parse[{size}]'] = (
+            lambda texts=texts, calls=calls: measure(parser.parse, texts, calls)
+        )
+        benchmarks[f'SkillMatcher.extract_skills[{size}]'] = (
+            lambda texts=texts, calls=calls: measure(matcher.extract_skills, texts, calls * 4)
+        )
+
+    # Worst-case inputs: time must grow linearly with the input size
+    adversarial_length = 50000 if quick else 200000
+    for kind in corpus.ADVERSARIAL_UNITS:
+        benchmarks[f'TextExtractors.adversarial[{kind}]'] = (
+            lambda kind=kind: measure_growth(
+                extract_all_fields,
+                lambda length: corpus.generate_adversarial(kind, length),
+                adversarial_length // 4,
+                adversarial_length,
+                3 * scale
+            )
+        )
+        benchmarks[f'ResumeParser.parse[adversarial-{kind}]'] = (
+            lambda kind=kind: measure(
+                parser.parse,
+                [corpus.generate_adversarial_resume(kind, 20000)],
+                3 * scale,
+                warmup=1
+            )
+        )
+
+    # Very long texts: the NLP pass is windowed and capped, so time must
+    # grow far slower than the input
+    def parse_document(text: str) -> None:
+        parser.parse(text, parser.process(text))
+
+    benchmarks['ResumeParser.parse[long-document]'] = lambda: measure_growth(
+        parse_document,
+        lambda length: corpus.generate_long_document(seed, length),
+        100000,
+        400000 if quick else 2000000,
+        3
+    )
+
+    pairs = corpus.generate_requirements(seed, 500)
+    benchmarks['SkillMatcher.match_skills'] = lambda: measure(
+        lambda pair: matcher.match_skills(pair['candidateSkills'], pair['requiredSkills']),
+        pairs,
+        500 * scale
+    )
+
+    # Worker startup: mapping the compiled taxonomy vs compiling it
+    taxonomy_source = load_source(matcher.source_path)
+    benchmarks['SkillTaxonomy.compile'] = lambda: measure(compile_taxonomy, [taxonomy_source], 10 * scale, warmup=1)
+    benchmarks['SkillTaxonomy.load'] = lambda: measure(SkillTaxonomy.load, [matcher.taxonomy_path], 10 * scale, warmup=1)
+
+    # Graded matching: one gather + max-reduce per cohort, with a matrix
+    # built from the synthetic students' skills
+    similarity = SkillSimilarity.build(
+        (student['skills'] for student in corpus.generate_students(seed, 5000)),
+        sorted(matcher.all_technical_skills),
+        matcher.skill_aliases
+    )
+    required = job['mandatorySkills'] + job['preferredSkills']
+    for count in (QUICK_COHORT_SIZES if quick else COHORT_SIZES):
+        benchmarks[f'SkillSimilarity.grade_cohort[{count}]'] = (
+            lambda count=count: measure(
+                lambda skills: similarity.grade_cohort(skills, required),
+                [[student['skills'] for student in corpus.generate_students(seed, count)]],
+                max(3, min(50, 100000 // count)),
+                warmup=1,
+                items_per_call=count
+            )
+        )
+
+    # Job description against an index of count resumes (templates made
+    # distinct by a few resume-specific tokens)
+    def build_resume_index(count: int) -> ResumeIndex:
+        index = ResumeIndex()
+        texts = corpus.generate_resumes(seed, 'typical', 200)
+        for number in range(count):
+            index.add(f'resume-{number}', f'{texts[number % len(texts)]} ref{number} batch{number % 97}')
+        index.compact()
+        return index
+
+    job_description = ' '.join(job['mandatorySkills'] + job['preferredSkills']) + (
+        ' software engineer with strong problem solving, communication and teamwork'
+    )
+    for count in (QUICK_COHORT_SIZES if quick else COHORT_SIZES[:3] + [30000]):
+        benchmarks[f'ResumeIndex.search[{count}]'] = (
+            lambda count=count: measure(
+                lambda index: index.search(job_description, top_k=20),
+                [build_resume_index(count)],
+                50 if quick else 20,
+                warmup=1
+            )
+        )
+
+    for count in (QUICK_COHORT_SIZES if quick else COHORT_SIZES):
+        calls = max(1, min(20, 100000 // count)) if quick else max(3, min(50, 200000 // count))
+        benchmarks[f'EligibilityCalculator.batch_calculate[{count}]'] = (
+            lambda count=count, calls=calls: measure(
+                lambda students: calculator.batch_calculate(students, job),
+                [corpus.generate_students(seed, count)],
+                calls,
+                warmup=1,
+                items_per_call=count
+            )
+        )
+        benchmarks[f'EligibilityCalculator.rank_candidates[{count}]'] = (
+            lambda count=count, calls=calls: measure(
+                lambda students: calculator.rank_candidates(students, job, top_k=50),
+                [corpus.generate_students(seed, count)],
+                calls,
+                warmup=1,
+                items_per_call=count
+            )
+        )
+
+    # Student loaders, all from the same JSON lines: plain dicts (what the
+    # batch endpoints used to hold), StudentProfile objects and StudentColumns
+    cohort = corpus.generate_students(seed, 1000 if quick else 50000)
+    lines = [json.dumps(student) for student in cohort]
+    loader_calls = 10 if quick else 3
+    benchmarks[f'StudentLoad.dicts[{len(lines)}]'] = lambda: measure_loader(
+        lambda lines: [json.loads(line) for line in lines],
+        lines,
+        len(lines),
+        loader_calls
+    )
+    benchmarks[f'StudentLoad.StudentProfile[{len(lines)}]'] = lambda: measure_loader(
+        lambda lines: [calculator._parse_student(json.loads(line)) for line in lines],
+        lines,
+        len(lines),
+        loader_calls
+    )
+    benchmarks[f'StudentLoad.StudentColumns.from_json_lines[{len(lines)}]'] = lambda: measure_loader(
+        StudentColumns.from_json_lines,
+        lines,
+        len(lines),
+        loader_calls
+    )
+    benchmarks[f'StudentLoad.StudentColumns.from_dicts[{len(cohort)}]'] = lambda: measure(
+        StudentColumns.from_dicts,
+        [cohort],
+        loader_calls,
+        warmup=1,
+        items_per_call=len(cohort)
+    )
+
+    campus = corpus.generate_students(seed, 1000 if quick else 50000)
+    student_index = StudentIndex(aliases=matcher.skill_aliases)
+    benchmarks[f'StudentIndex.add_many[{len(campus)}]'] = lambda: measure(
+        lambda students: StudentIndex(aliases=matcher.skill_aliases).add_many(students),
+        [campus],
+        3,
+        warmup=0,
+        items_per_call=len(campus)
+    )
+    benchmarks[f'StudentIndex.query[{len(campus)}]'] = lambda: (
+        student_index.add_many(campus),
+        measure(
+            lambda query: student_index.query(query, min_cgpa=6.5, limit=100),
+            [
+                'python AND (docker OR kubernetes) AND cgpa >= 7',
+                'NOT java AND branch = cse',
+                '"machine learning" OR tensorflow OR pytorch',
+                'react AND node.js AND backlogs <= 0'
+            ],
+            200 * scale
+        )
+    )[1]
+
+    return benchmarks
+
+
+def e2e_benchmarks(seed: int, quick: bool, openai_stub: bool) -> Dict[str, Callable[[], Dict]]:
+    """End-to-end benchmarks through the Flask test client (result cache disabled)."""
+    os.environ['RESULT_CACHE_SIZE'] = '0'
+    os.environ['RESULT_CACHE_PATH'] = ''
+    os.environ['SPACY_PRELOAD'] = '1'
+
+    if openai_stub:
+        from benchmarks.stub_openai import start_stub_server
+        server, _ = start_stub_server(delay=float(os.getenv('STUB_OPENAI_DELAY', 0.2)))
+        os.environ['OPENAI_API_KEY'] = 'stub-key'
+        os.environ['OPENAI_BASE_URL'] = server.base_url
+    else:
+        os.environ['OPENAI_API_KEY'] = ''
+
+    from app import app
+
+    client = app.test_client()
+    scale = 1 if quick else 4
+    texts = corpus.generate_resumes(seed, 'typical', 20)
+    pairs = corpus.generate_requirements(seed, 200)
+    job = corpus.generate_job(seed)
+    cohort = corpus.generate_students(seed, 1000)
+
+    def post(path):
+        def call(body):
+            response = client.post(path, json=body)
+            if response.status_code != 200:
+                raise RuntimeError(f'{path} returned {response.status_code}: {response.get_data(as_text=True)[:200]}')
+        return call
+
+    benchmarks = {
+        'POST /parse-resume': lambda: measure(
+            post('/parse-resume'), [{'text': t} for t in texts], 20 * scale
+        ),
+        'POST /extract-skills': lambda: measure(
+            post('/extract-skills'), [{'text': t} for t in texts], 100 * scale
+        ),
+        'POST /match-skills': lambda: measure(
+            post('/match-skills'), pairs, 200 * scale
+        ),
+        'POST /calculate-eligibility/batch[1000]': lambda: measure(
+            post('/calculate-eligibility/batch'),
+            [{'job': job, 'candidates': cohort, 'topK': 50}],
+            10 * scale,
+            warmup=1,
+            items_per_call=len(cohort)
+        ),
+        'POST /analyze-resume': lambda: measure(
+            post('/analyze-resume'), [{'text': t} for t in texts], 20 * scale
+        )
+    }
+    return benchmarks
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[Dict]:
+    """
+    Compare results with a baseline run.
+
+    A benchmark regresses when its p50 latency grew, or its throughput fell,
+    by more than threshold (a fraction, e.g. 0.15 for 15%).
+    """
+    rows = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or 'error' in current or 'error' in previous:
+            continue
+
+        p50_change = (current['p50Ms'] - previous['p50Ms']) / previous['p50Ms'] if previous['p50Ms'] else 0.0
+        throughput_change = 0.0
+        if previous.get('callsPerSecond') and current.get('callsPerSecond'):
+            throughput_change = (current['callsPerSecond'] - previous['callsPerSecond']) / previous['callsPerSecond']
+
+        rows.append({
+            'benchmark': name,
+            'baselineP50Ms': previous['p50Ms'],
+            'p50Ms': current['p50Ms'],
+            'p50Change': round(p50_change, 4),
+            'throughputChange': round(throughput_change, 4),
+            'regressed': p50_change > threshold or throughput_change < -threshold
+        })
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the AI service hot paths.')
+    parser.add_argument('--suite', choices=['micro', 'e2e', 'all'], default='all')
+    parser.add_argument('--quick', action='store_true', help='fewer calls and cohorts up to 1000 students')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this text')
+    parser.add_argument('--output', help='write results JSON to this path')
+    parser.add_argument('--baseline', help='compare against a results JSON from an earlier run')
+    parser.add_argument('--threshold', type=float, default=0.15, help='allowed relative slowdown (default 0.15)')
+    parser.add_argument('--openai-stub', action='store_true', help='serve /analyze-resume via a local stub OpenAI server')
+    args = parser.parse_args(argv)
+
+    benchmarks = {}
+    if args.suite in ('micro', 'all'):
+        benchmarks.update(micro_benchmarks(args.seed, args.quick))
+    if args.suite in ('e2e', 'all'):
+        benchmarks.update(e2e_benchmarks(args.seed, args.quick, args.openai_stub))
+
+    results = {}
+    for name, run in benchmarks.items():
+        if args.filter and args.filter not in name:
+            continue
+        try:
+            results[name] = run()
+        except Exception as e:
+            results[name] = {'error': str(e)}
+        stats = results[name]
+        if 'error' in stats:
+            print(f'{name:55s} ERROR {stats["error"]}')
+        else:
+            print(f'{name:55s} p50 {stats["p50Ms"]:10.3f} ms  p99 {stats["p99Ms"]:10.3f} ms  '
+                  f'{stats["callsPerSecond"]:10.1f} calls/s  rss {stats["peakRssMb"]} MB'
+                  + (f'  {stats["retainedBytesPerItem"]} B/item' if 'retainedBytesPerItem' in stats else '')
+                  + (f'  growth x{stats["growth"]} for x{stats["sizeRatio"]} input' if 'growth' in stats else ''))
+
+    report = {
+        'meta': {
+            'seed': args.seed,
+            'quick': args.quick,
+            'suite': args.suite,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        },
+        'results': results
+    }
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        comparison = compare(results, baseline, args.threshold)
+        report['comparison'] = comparison
+        regressions = [row for row in comparison if row['regressed']]
+        print(f'\n{len(regressions)} regression(s) against {args.baseline} (threshold {args.threshold:.0%})')
+        for row in regressions:
+            print(f'  {row["benchmark"]}: p50 {row["baselineP50Ms"]} -> {row["p50Ms"]} ms '
+                  f'({row["p50Change"]:+.1%}), throughput {row["throughputChange"]:+.1%}')
+        if regressions:
+            exit_code = 1
+
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Stub OpenAI Server Module
+
+Minimal local stand-in for the chat completions API, so OpenAIService can
+be exercised (latency, deadlines, coalescing) without network access or an
+API key. Point the service at it with OPENAI_BASE_URL.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+
+class StubOpenAIServer(ThreadingHTTPServer):
+    """HTTP server answering POST /v1/chat/completions after a fixed delay."""
+
+    daemon_threads = True
+
+    def __init__(self, delay: float = 0.2, port: int = 0):
+        super().__init__(('127.0.0.1', port), _StubHandler)
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self.server_port}/v1'
+
+    def record_call(self) -> None:
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def record_done(self) -> None:
+        with self._lock:
+            self.active -= 1
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length) or b'{}')
+        self.server.record_call()
+        try:
+            time.sleep(self.server.delay)
+        finally:
+            self.server.record_done()
+
+        payload = json.dumps({
+            'id': 'chatcmpl-stub',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'stub'),
+            'choices': [{
+                'index': 0,
+                'finish_reason': 'stop',
+                'message': {'role': 'assistant', 'content': 'Stub summary: python, sql, docker.'}
+            }],
+            'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0}
+        }).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(delay: float = 0.2, port: int = 0) -> Tuple[StubOpenAIServer, threading.Thread]:
+    """Start a stub server on a background thread."""
+    server = StubOpenAIServer(delay=delay, port=port)
+    thread = threading.Thread(target=server.serve_forever, name='stub-openai', daemon=True)
+    thread.start()
+    return server, thread
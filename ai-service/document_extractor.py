@@ -0,0 +1,462 @@
+"""
+Document Extractor Module
+
+Extracts plain text from PDF and DOCX resumes. PDFs are opened, counted
+and extracted page by page in worker processes with a per-page timeout and
+a page cap, so one pathological file cannot hold a web worker for long.
+A request checks workers out for itself, so a page that times out only
+fails that request: its worker is killed and replaced, and the other
+requests' pages keep running. DOCX files are read in-process with
+python-docx.
+
+Uses pdfplumber, falling back to PyPDF2, and python-docx; all are optional
+and only imported when a file of that type is extracted.
+"""
+
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import traceback
+from multiprocessing.connection import wait
+from typing import Any, Dict, List, Optional, Tuple
+
+# Per-worker cache of the PDF last opened, as (path, mtime, document, library)
+_worker_document = None
+
+# Magic bytes of the supported formats
+PDF_MAGIC = b'%PDF'
+ZIP_MAGIC = b'PK\x03\x04'
+
+
+class UnsupportedDocumentError(ValueError):
+    """The file is not a PDF or DOCX document."""
+
+
+def detect_file_type(data: bytes, filename: str = '') -> str:
+    """
+    Identify a resume file as 'pdf' or 'docx' from its content (or name).
+
+    Raises:
+        UnsupportedDocumentError: for any other format (including legacy .doc)
+    """
+    if data.startswith(PDF_MAGIC):
+        return 'pdf'
+    if data.startswith(ZIP_MAGIC) and b'word/' in data[:65536]:
+        return 'docx'
+
+    extension = os.path.splitext(filename.lower())[1]
+    if extension == '.pdf' and PDF_MAGIC in data[:1024]:
+        return 'pdf'
+    raise UnsupportedDocumentError('Only PDF and DOCX files are supported')
+
+
+def _open_pdf(path: str):
+    """Open a PDF with pdfplumber, or PyPDF2 if pdfplumber is not installed."""
+    try:
+        import pdfplumber
+        return pdfplumber.open(path), 'pdfplumber'
+    except ImportError:
+        pass
+    try:
+        from PyPDF2 import PdfReader
+        return PdfReader(path), 'pypdf2'
+    except ImportError:
+        raise RuntimeError(
+            'PDF extraction requires pdfplumber or PyPDF2. Install with: pip install pdfplumber'
+        )
+
+
+def _close_pdf(document, library: str) -> None:
+    if library == 'pdfplumber':
+        document.close()
+
+
+def count_pdf_pages(path: str) -> int:
+    """Number of pages in a PDF."""
+    document, library = _open_pdf(path)
+    try:
+        return len(document.pages)
+    finally:
+        _close_pdf(document, library)
+
+
+def extract_pdf_page(path: str, page_number: int) -> str:
+    """
+    Text of one PDF page (0-based), reusing this process's open document.
+
+    Args:
+        path: PDF file path
+        page_number: Page index
+
+    Returns:
+        Extracted page text ('' for pages without a text layer)
+    """
+    global _worker_document
+    mtime = os.path.getmtime(path)
+
+    if _worker_document is None or _worker_document[:2] != (path, mtime):
+        if _worker_document is not None:
+            _close_pdf(_worker_document[2], _worker_document[3])
+            _worker_document = None
+        document, library = _open_pdf(path)
+        _worker_document = (path, mtime, document, library)
+
+    page = _worker_document[2].pages[page_number]
+    return page.extract_text() or ''
+
+
+def _page_worker_main(conn) -> None:
+    """
+    Page worker process: answer (path, page_number) tasks until sent None
+    or the connection closes. page_number None asks for the page count.
+    Replies are (True, result) or (False, error message).
+    """
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        path, page_number = task
+        try:
+            if page_number is None:
+                reply = (True, count_pdf_pages(path))
+            else:
+                reply = (True, extract_pdf_page(path, page_number))
+        except Exception as e:
+            traceback.print_exc()
+            reply = (False, f'{type(e).__name__}: {e}')
+        conn.send(reply)
+
+
+class _PageWorker:
+    """One page worker process and the parent's end of its connection."""
+
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_page_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.deadline = 0.0
+        self.page_number = None
+
+    def send(self, path: str, page_number: Optional[int], timeout: float) -> bool:
+        """Start a task; False (and the worker killed) if the worker is gone."""
+        self.page_number = page_number
+        self.deadline = time.monotonic() + timeout
+        try:
+            self.conn.send((path, page_number))
+            return True
+        except OSError:
+            self.kill()
+            return False
+
+    def receive(self) -> Tuple[bool, Any]:
+        """Reply to the current task; a worker that died is killed and reports a failure."""
+        try:
+            return self.conn.recv()
+        except (EOFError, OSError):
+            self.kill()
+            return False, 'page worker exited'
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        # Forked workers hold copies of the parent's connections, so
+        # closing ours is not enough to end them
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.conn.close()
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+
+def extract_docx_text(path: str) -> str:
+    """Text of a DOCX document: paragraphs, then table cells row by row."""
+    try:
+        import docx
+    except ImportError:
+        raise RuntimeError('DOCX extraction requires python-docx. Install with: pip install python-docx')
+
+    document = docx.Document(path)
+    lines = [paragraph.text for paragraph in document.paragraphs]
+    for table in document.tables:
+        for row in table.rows:
+            cells = []
+            for cell in row.cells:
+                text = cell.text.strip()
+                # Merged cells repeat across the row
+                if text and (not cells or cells[-1] != text):
+                    cells.append(text)
+            if cells:
+                lines.append(' | '.join(cells))
+    return '\n'.join(lines)
+
+
+class DocumentExtractor:
+    """
+    Extract text from uploaded or local resume files.
+
+    Configuration (environment):
+    - FILE_EXTRACT_PROCESSES: PDF page worker processes (0 = in-process)
+    - FILE_PAGE_TIMEOUT: seconds allowed per PDF page, and for counting
+      the pages
+    - FILE_MAX_PAGES: pages extracted at most; later pages are skipped
+    - FILE_INGEST_ROOT: directory that local paths must lie under
+      (path ingestion is disabled when unset)
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        page_timeout: Optional[float] = None,
+        max_pages: Optional[int] = None,
+        ingest_root: Optional[str] = None,
+        start_method: Optional[str] = None
+    ):
+        self.processes = int(processes if processes is not None else os.getenv('FILE_EXTRACT_PROCESSES', 2))
+        self.page_timeout = float(page_timeout if page_timeout is not None else os.getenv('FILE_PAGE_TIMEOUT', 10))
+        self.max_pages = int(max_pages if max_pages is not None else os.getenv('FILE_MAX_PAGES', 20))
+        root = ingest_root if ingest_root is not None else os.getenv('FILE_INGEST_ROOT', '')
+        self.ingest_root = os.path.realpath(root) if root else ''
+        self.start_method = start_method or os.getenv('BATCH_START_METHOD', 'spawn')
+        self._idle: List[_PageWorker] = []
+        self._started = 0
+        self._workers_changed = threading.Condition()
+
+    def _acquire_workers(self, wanted: int) -> List[_PageWorker]:
+        """
+        Check out between 1 and `wanted` page workers for one request,
+        waiting for the first one if all are busy and starting workers up
+        to FILE_EXTRACT_PROCESSES on demand.
+        """
+        wanted = max(wanted, 1)
+        with self._workers_changed:
+            while not self._idle and self._started >= self.processes:
+                self._workers_changed.wait()
+            workers = self._idle[-wanted:]
+            del self._idle[-wanted:]
+            starting = min(wanted - len(workers), self.processes - self._started)
+            self._started += starting
+
+        context = multiprocessing.get_context(self.start_method)
+        try:
+            for started in range(starting):
+                workers.append(_PageWorker(context))
+        except Exception:
+            self._release_workers(workers)
+            self._forget_workers(starting - started)
+            raise
+        return workers
+
+    def _release_workers(self, workers: List[_PageWorker]) -> None:
+        """Return idle page workers for other requests."""
+        with self._workers_changed:
+            self._idle.extend(workers)
+            self._workers_changed.notify_all()
+
+    def _forget_workers(self, count: int) -> None:
+        """Free the slots of workers that were killed or never started."""
+        with self._workers_changed:
+            self._started -= count
+            self._workers_changed.notify_all()
+
+    def resolve_path(self, path: str) -> str:
+        """
+        Resolve a local path for ingestion, confined to FILE_INGEST_ROOT.
+
+        Raises:
+            PermissionError: if path ingestion is disabled or the path
+                (after resolving symlinks) lies outside the root
+            FileNotFoundError: if the file does not exist
+        """
+        if not self.ingest_root:
+            raise PermissionError('Path ingestion is disabled (FILE_INGEST_ROOT is not set)')
+
+        resolved = os.path.realpath(os.path.join(self.ingest_root, path))
+        if os.path.commonpath([resolved, self.ingest_root]) != self.ingest_root:
+            raise PermissionError('Path is outside FILE_INGEST_ROOT')
+        if not os.path.isfile(resolved):
+            raise FileNotFoundError(f'File not found: {path}')
+        return resolved
+
+    def extract_bytes(self, data: bytes, filename: str = '') -> Dict[str, Any]:
+        """
+        Extract text from file content.
+
+        Args:
+            data: File bytes
+            filename: Original file name (used as a type hint only)
+
+        Returns:
+            Dict with text, fileType, pageCount, pagesExtracted and
+            per-page problems (see extract_path)
+        """
+        file_type = detect_file_type(data, filename)
+
+        # Workers open the document themselves, so hand them a file
+        handle, path = tempfile.mkstemp(suffix=f'.{file_type}')
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                f.write(data)
+            return self._extract(path, file_type)
+        finally:
+            os.remove(path)
+
+    def extract_path(self, path: str) -> Dict[str, Any]:
+        """
+        Extract text from a file under FILE_INGEST_ROOT.
+
+        Args:
+            path: File path, relative to FILE_INGEST_ROOT or absolute within it
+
+        Returns:
+            Dict with:
+            - text: extracted text, pages separated by blank lines
+            - fileType: 'pdf' or 'docx'
+            - pageCount: pages in the document (None for DOCX, or if
+              counting them timed out)
+            - pagesExtracted: pages whose text was extracted
+            - truncated: True if pages beyond FILE_MAX_PAGES were skipped
+            - timedOutPages / failedPages: 1-based page numbers
+        """
+        resolved = self.resolve_path(path)
+        with open(resolved, 'rb') as f:
+            head = f.read(65536)
+        return self._extract(resolved, detect_file_type(head, resolved))
+
+    def _extract(self, path: str, file_type: str) -> Dict[str, Any]:
+        if file_type == 'docx':
+            return {
+                'text': extract_docx_text(path),
+                'fileType': 'docx',
+                'pageCount': None,
+                'pagesExtracted': None,
+                'truncated': False,
+                'timedOutPages': [],
+                'failedPages': []
+            }
+
+        if self.processes <= 0:
+            page_count = count_pdf_pages(path)
+            texts, timed_out, failed = self._extract_pdf_pages_in_process(path, min(page_count, self.max_pages))
+        else:
+            workers = self._acquire_workers(self.max_pages)
+            try:
+                page_count, texts, timed_out, failed = self._extract_pdf_pages(path, workers)
+            finally:
+                alive = [worker for worker in workers if worker.process.is_alive()]
+                self._release_workers(alive)
+                self._forget_workers(len(workers) - len(alive))
+
+        pages = len(texts)
+        return {
+            'text': '\n\n'.join(text for text in texts if text),
+            'fileType': 'pdf',
+            'pageCount': page_count,
+            'pagesExtracted': pages - len(timed_out) - len(failed),
+            'truncated': page_count is not None and page_count > pages,
+            'timedOutPages': timed_out,
+            'failedPages': failed
+        }
+
+    def _extract_pdf_pages_in_process(self, path: str, pages: int) -> Tuple[List[str], List[int], List[int]]:
+        """Extract pages [0, pages) -> (texts, timed out pages, failed pages)."""
+        texts = [''] * pages
+        failed = []
+        for page_number in range(pages):
+            try:
+                texts[page_number] = extract_pdf_page(path, page_number)
+            except Exception:
+                traceback.print_exc()
+                failed.append(page_number + 1)
+        return texts, [], failed
+
+    def _extract_pdf_pages(
+        self,
+        path: str,
+        workers: List[_PageWorker]
+    ) -> Tuple[Optional[int], List[str], List[int], List[int]]:
+        """
+        Count and extract the pages of a PDF on this request's workers.
+
+        The first worker counts the pages (workers beyond the page count
+        are handed back right away), then each worker takes the next page
+        as soon as it is free; every task gets page_timeout. A worker that
+        times out is killed and dropped and the other workers take the
+        remaining pages; once none is left they are reported as timed out.
+
+        Returns:
+            (page count, texts, timed out pages, failed pages); the page
+            count is None and there are no texts if counting timed out
+        """
+        counter = workers[0]
+        if counter.send(path, None, self.page_timeout) and not counter.conn.poll(self.page_timeout):
+            counter.kill()
+            return None, [], [], []
+        ok, page_count = counter.receive()
+        if not ok:
+            raise RuntimeError(f'Could not read the PDF: {page_count}')
+
+        pages = min(page_count, self.max_pages)
+        if len(workers) > max(pages, 1):
+            self._release_workers(workers[max(pages, 1):])
+            del workers[max(pages, 1):]
+
+        texts = [''] * pages
+        timed_out = []
+        failed = []
+        next_page = 0
+        free = list(workers)
+        busy = {}
+
+        while next_page < pages or busy:
+            while free and next_page < pages:
+                worker = free.pop()
+                if worker.send(path, next_page, self.page_timeout):
+                    busy[worker.conn] = worker
+                    next_page += 1
+            if not busy:
+                # Every worker of this request was killed
+                timed_out.extend(range(next_page + 1, pages + 1))
+                break
+
+            timeout = max(0.0, min(worker.deadline for worker in busy.values()) - time.monotonic())
+            for conn in wait(list(busy), timeout):
+                worker = busy.pop(conn)
+                ok, result = worker.receive()
+                if ok:
+                    texts[worker.page_number] = result
+                else:
+                    failed.append(worker.page_number + 1)
+                if worker.process.is_alive():
+                    free.append(worker)
+
+            # A stuck worker cannot be interrupted: kill it (no other
+            # request is using it) and carry on without it
+            now = time.monotonic()
+            for conn, worker in list(busy.items()):
+                if worker.deadline <= now:
+                    del busy[conn]
+                    worker.kill()
+                    timed_out.append(worker.page_number + 1)
+
+        return page_count, texts, sorted(timed_out), sorted(failed)
+
+    def close(self):
+        """Shut down the idle page workers (busy ones finish their request first)."""
+        with self._workers_changed:
+            workers, self._idle = self._idle, []
+            self._started -= len(workers)
+        for worker in workers:
+            worker.stop()
@@ -5,10 +5,12 @@ Calculates student eligibility scores for job postings using
 the formula: (Skill Match × 0.4) + (CGPA × 0.3) + (Branch Match × 0.2) + (Experience × 0.1)
 """
 
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+import json
+from typing import Dict, Iterable, List, Optional, Union
 from enum import Enum
 
+import numpy as np
+
 
 class EligibilityLevel(Enum):
     """Eligibility classification levels."""
@@ -18,33 +20,271 @@ class EligibilityLevel(Enum):
     NOT_ELIGIBLE = "not_eligible"
 
 
-@dataclass
-class StudentProfile:
+class _SlotsRecord:
+    """Base for small fixed-field records: no per-instance __dict__."""
+    __slots__ = ()
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+    
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+
+class StudentProfile(_SlotsRecord):
     """Student profile data structure."""
-    name: str
-    email: str
-    branch: str
-    cgpa: float
-    skills: List[str]
-    experience_months: int
-    backlogs: int = 0
-    tenth_percentage: float = 0.0
-    twelfth_percentage: float = 0.0
+    __slots__ = (
+        'name', 'email', 'branch', 'cgpa', 'skills', 'experience_months',
+        'backlogs', 'tenth_percentage', 'twelfth_percentage'
+    )
+    
+    def __init__(
+        self,
+        name: str,
+        email: str,
+        branch: str,
+        cgpa: float,
+        skills: List[str],
+        experience_months: int,
+        backlogs: int = 0,
+        tenth_percentage: float = 0.0,
+        twelfth_percentage: float = 0.0
+    ):
+        self.name = name
+        self.email = email
+        self.branch = branch
+        self.cgpa = cgpa
+        self.skills = skills
+        self.experience_months = experience_months
+        self.backlogs = backlogs
+        self.tenth_percentage = tenth_percentage
+        self.twelfth_percentage = twelfth_percentage
 
 
-@dataclass
-class JobRequirements:
+class JobRequirements(_SlotsRecord):
     """Job requirements data structure."""
-    title: str
-    company: str
-    required_branches: List[str]
-    min_cgpa: float
-    min_tenth: float
-    min_twelfth: float
-    max_backlogs: int
-    min_experience_months: int
-    mandatory_skills: List[str]
-    preferred_skills: List[str]
+    __slots__ = (
+        'title', 'company', 'required_branches', 'min_cgpa', 'min_tenth', 'min_twelfth',
+        'max_backlogs', 'min_experience_months', 'mandatory_skills', 'preferred_skills'
+    )
+    
+    def __init__(
+        self,
+        title: str,
+        company: str,
+        required_branches: List[str],
+        min_cgpa: float,
+        min_tenth: float,
+        min_twelfth: float,
+        max_backlogs: int,
+        min_experience_months: int,
+        mandatory_skills: List[str],
+        preferred_skills: List[str]
+    ):
+        self.title = title
+        self.company = company
+        self.required_branches = required_branches
+        self.min_cgpa = min_cgpa
+        self.min_tenth = min_tenth
+        self.min_twelfth = min_twelfth
+        self.max_backlogs = max_backlogs
+        self.min_experience_months = min_experience_months
+        self.mandatory_skills = mandatory_skills
+        self.preferred_skills = preferred_skills
+
+
+class SkillVocabulary:
+    """Interns lowercase skill names to dense integer IDs."""
+    
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self.skills: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.skills)
+    
+    def intern(self, skill: str) -> int:
+        """ID of a skill name (case-insensitive), assigning one if new."""
+        skill_id = self._ids.get(skill)
+        if skill_id is None:
+            key = skill.lower()
+            skill_id = self._ids.get(key)
+            if skill_id is None:
+                skill_id = self._ids[key] = len(self.skills)
+                self.skills.append(key)
+            self._ids[skill] = skill_id
+        return skill_id
+
+
+class StudentColumns:
+    """
+    Struct-of-arrays view of many students.
+    
+    Numeric fields are NumPy columns, branches are interned to codes and
+    skills are stored CSR-style as interned IDs: the skills of student i are
+    skill_ids[skill_offsets[i]:skill_offsets[i + 1]]. Only names, emails and
+    IDs (needed verbatim in results) remain Python objects, so a cohort
+    costs a few dozen bytes per student plus its strings instead of a dict
+    or object per student and a list of skill strings each.
+    """
+    
+    __slots__ = (
+        'vocabulary', 'ids', 'names', 'emails', 'branches', 'branch_codes',
+        'cgpa', 'backlogs', 'tenth', 'twelfth', 'experience_months',
+        'skill_offsets', 'skill_ids'
+    )
+    
+    def __init__(self, vocabulary: Optional[SkillVocabulary] = None):
+        self.vocabulary = vocabulary if vocabulary is not None else SkillVocabulary()
+        self.ids: List = []
+        self.names: List[str] = []
+        self.emails: List[str] = []
+        # Distinct branch strings as given; branch_codes index into this
+        self.branches: List[str] = []
+        self.branch_codes = np.zeros(0, dtype=np.int32)
+        self.cgpa = np.zeros(0, dtype=np.float64)
+        self.backlogs = np.zeros(0, dtype=np.int32)
+        self.tenth = np.zeros(0, dtype=np.float64)
+        self.twelfth = np.zeros(0, dtype=np.float64)
+        self.experience_months = np.zeros(0, dtype=np.int32)
+        self.skill_offsets = np.zeros(1, dtype=np.int64)
+        self.skill_ids = np.zeros(0, dtype=np.int32)
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    @classmethod
+    def from_dicts(
+        cls,
+        students: Iterable[Dict],
+        vocabulary: Optional[SkillVocabulary] = None
+    ) -> 'StudentColumns':
+        """
+        Load student profile dicts (the calculate_eligibility input format).
+        
+        Args:
+            students: Student profile dicts
+            vocabulary: Skill vocabulary to intern into (shared across loads
+                so IDs stay comparable); a new one by default
+            
+        Returns:
+            StudentColumns with one row per student, in input order
+        """
+        columns = cls(vocabulary)
+        intern = columns.vocabulary.intern
+        branch_codes = {}
+        
+        ids = columns.ids
+        names = columns.names
+        emails = columns.emails
+        codes = []
+        cgpa = []
+        backlogs = []
+        tenth = []
+        twelfth = []
+        experience = []
+        skill_ids = []
+        skill_offsets = [0]
+        
+        # One pass over the dicts; everything after this is array work
+        for student in students:
+            ids.append(student.get('studentId', student.get('id')))
+            names.append(student.get('name', ''))
+            emails.append(student.get('email', ''))
+            
+            branch = student.get('branch', '')
+            code = branch_codes.get(branch)
+            if code is None:
+                code = branch_codes[branch] = len(branch_codes)
+            codes.append(code)
+            
+            cgpa.append(student.get('cgpa', 0))
+            backlogs.append(student.get('backlogs', 0))
+            tenth.append(student.get('tenthPercentage', student.get('tenth_percentage', 0)))
+            twelfth.append(student.get('twelfthPercentage', student.get('twelfth_percentage', 0)))
+            experience.append(student.get('experienceMonths', student.get('experience_months', 0)))
+            
+            for skill in student.get('skills', ()):
+                skill_ids.append(intern(skill))
+            skill_offsets.append(len(skill_ids))
+        
+        columns.branches = list(branch_codes)
+        columns.branch_codes = np.array(codes, dtype=np.int32)
+        columns.cgpa = np.array(cgpa, dtype=np.float64)
+        columns.backlogs = np.array(backlogs, dtype=np.float64).astype(np.int32)
+        columns.tenth = np.array(tenth, dtype=np.float64)
+        columns.twelfth = np.array(twelfth, dtype=np.float64)
+        columns.experience_months = np.array(experience, dtype=np.float64).astype(np.int32)
+        columns.skill_offsets = np.array(skill_offsets, dtype=np.int64)
+        columns.skill_ids = np.array(skill_ids, dtype=np.int32)
+        return columns
+    
+    @classmethod
+    def from_json_lines(
+        cls,
+        lines: Iterable,
+        vocabulary: Optional[SkillVocabulary] = None,
+        limit: Optional[int] = None
+    ) -> 'StudentColumns':
+        """
+        Load students from JSON lines (one student dict per line).
+        
+        Each line is decoded and folded into the columns straight away, so
+        the dicts are never held all at once.
+        
+        Args:
+            lines: Iterable of str or bytes lines (e.g. an open file); blank
+                lines are skipped
+            vocabulary: Skill vocabulary to intern into (optional)
+            limit: Stop after this many students (optional)
+            
+        Returns:
+            StudentColumns with one row per line
+        """
+        def records():
+            count = 0
+            for line in lines:
+                if limit is not None and count >= limit:
+                    return
+                line = line.strip()
+                if line:
+                    count += 1
+                    yield json.loads(line)
+        
+        return cls.from_dicts(records(), vocabulary)
+    
+    def skills_of(self, index: int) -> List[str]:
+        """Lowercase skill names of one student."""
+        skills = self.vocabulary.skills
+        start, end = self.skill_offsets[index], self.skill_offsets[index + 1]
+        return [skills[skill_id] for skill_id in self.skill_ids[start:end].tolist()]
+    
+    def profile(self, index: int) -> StudentProfile:
+        """Materialize one student as a StudentProfile."""
+        return StudentProfile(
+            name=self.names[index],
+            email=self.emails[index],
+            branch=self.branches[self.branch_codes[index]].lower(),
+            cgpa=float(self.cgpa[index]),
+            skills=self.skills_of(index),
+            experience_months=int(self.experience_months[index]),
+            backlogs=int(self.backlogs[index]),
+            tenth_percentage=float(self.tenth[index]),
+            twelfth_percentage=float(self.twelfth[index])
+        )
+    
+    def nbytes(self) -> int:
+        """Bytes held by the NumPy columns (excluding Python strings)."""
+        return sum(
+            getattr(self, name).nbytes
+            for name in (
+                'branch_codes', 'cgpa', 'backlogs', 'tenth', 'twelfth',
+                'experience_months', 'skill_offsets', 'skill_ids'
+            )
+        )
 
 
 class EligibilityCalculator:
@@ -91,10 +331,19 @@ class EligibilityCalculator:
         Returns:
             Detailed eligibility analysis
         """
-        # Parse inputs
-        student_profile = self._parse_student(student)
-        job_requirements = self._parse_job(job)
-        
+        return self._evaluate(
+            self._parse_student(student),
+            self._parse_job(job),
+            skill_match_percentage
+        )
+    
+    def _evaluate(
+        self,
+        student_profile: StudentProfile,
+        job_requirements: JobRequirements,
+        skill_match_percentage: Optional[float] = None
+    ) -> Dict:
+        """Score an already parsed student against already parsed requirements."""
         # Check hard requirements (disqualifiers)
         disqualifiers = self._check_disqualifiers(student_profile, job_requirements)
         
@@ -495,31 +744,238 @@ class EligibilityCalculator:
     
     def batch_calculate(
         self,
-        students: List[Dict],
+        students: Union[List[Dict], StudentColumns],
         job: Dict
     ) -> List[Dict]:
         """
         Calculate eligibility for multiple students.
         
         Args:
-            students: List of student profiles
+            students: List of student profiles, or StudentColumns
             job: Job requirements
             
         Returns:
             List of eligibility results, sorted by score
         """
         results = []
+        job_requirements = self._parse_job(job)
         
-        for student in students:
-            result = self.calculate_eligibility(student, job)
-            result['student'] = {
-                'name': student.get('name', ''),
-                'email': student.get('email', ''),
-                'branch': student.get('branch', '')
-            }
-            results.append(result)
+        if isinstance(students, StudentColumns):
+            for i in range(len(students)):
+                result = self._evaluate(students.profile(i), job_requirements)
+                result['student'] = {
+                    'name': students.names[i],
+                    'email': students.emails[i],
+                    'branch': students.branches[students.branch_codes[i]]
+                }
+                results.append(result)
+        else:
+            for student in students:
+                result = self._evaluate(self._parse_student(student), job_requirements)
+                result['student'] = {
+                    'name': student.get('name', ''),
+                    'email': student.get('email', ''),
+                    'branch': student.get('branch', '')
+                }
+                results.append(result)
         
         # Sort by total score (descending)
         results.sort(key=lambda x: x['totalScore'], reverse=True)
         
         return results
+    
+    def rank_candidates(
+        self,
+        students: Union[List[Dict], StudentColumns],
+        job: Dict,
+        top_k: Optional[int] = None,
+        min_score: Optional[float] = None
+    ) -> List[Dict]:
+        """
+        Score many students against one job with column-wise array operations.
+        
+        Produces the same scores and levels as calculate_eligibility, but parses
+        the job once, evaluates every student in NumPy and only builds compact
+        result dicts (no analysis text or suggestions) for the students returned.
+        
+        Args:
+            students: List of student profiles, or StudentColumns (e.g. loaded
+                once and ranked against many jobs)
+            job: Job requirements
+            top_k: Return only the K highest scoring students (optional)
+            min_score: Drop students scoring below this total (optional)
+            
+        Returns:
+            Compact eligibility results, sorted by score (descending)
+        """
+        if not isinstance(students, StudentColumns):
+            students = StudentColumns.from_dicts(students)
+        count = len(students)
+        if not count:
+            return []
+        
+        job_requirements = self._parse_job(job)
+        branch_eligible, branch_scores = self._branch_columns(students, job_requirements)
+        
+        # Hard requirements
+        cgpa_fail = students.cgpa < job_requirements.min_cgpa
+        backlog_fail = students.backlogs > job_requirements.max_backlogs
+        tenth_fail = np.zeros(count, dtype=bool)
+        if job_requirements.min_tenth > 0:
+            tenth_fail = students.tenth < job_requirements.min_tenth
+        twelfth_fail = np.zeros(count, dtype=bool)
+        if job_requirements.min_twelfth > 0:
+            twelfth_fail = students.twelfth < job_requirements.min_twelfth
+        branch_fail = np.zeros(count, dtype=bool)
+        if 'all' not in job_requirements.required_branches:
+            branch_fail = ~branch_eligible
+        disqualified = cgpa_fail | backlog_fail | tenth_fail | twelfth_fail | branch_fail
+        
+        # Component scores (0-100)
+        skill_scores = self._skill_match_scores(self._skill_hits(students, job_requirements), job_requirements)
+        cgpa_scores = self._cgpa_scores(students.cgpa, job_requirements.min_cgpa)
+        experience_scores = self._experience_scores(
+            students.experience_months.astype(np.int64),
+            job_requirements.min_experience_months
+        )
+        
+        total = (
+            skill_scores * self.weights['skill_match'] +
+            cgpa_scores * self.weights['cgpa'] +
+            branch_scores * self.weights['branch_match'] +
+            experience_scores * self.weights['experience']
+        )
+        total = np.where(disqualified, 0.0, total)
+        
+        # Select survivors, then the top K without sorting everyone
+        candidates = np.arange(count)
+        if min_score is not None:
+            candidates = candidates[total[candidates] >= min_score]
+        if top_k is not None and 0 <= top_k < len(candidates):
+            if top_k == 0:
+                return []
+            partition = np.argpartition(-total[candidates], top_k - 1)[:top_k]
+            candidates = candidates[partition]
+        candidates = candidates[np.lexsort((candidates, -total[candidates]))]
+        
+        failures = (
+            ('cgpa', cgpa_fail),
+            ('backlogs', backlog_fail),
+            ('tenth_percentage', tenth_fail),
+            ('twelfth_percentage', twelfth_fail),
+            ('branch', branch_fail)
+        )
+        
+        results = []
+        for i in candidates.tolist():
+            score = float(total[i])
+            level = self._determine_level(score)
+            
+            if disqualified[i]:
+                scores = {}
+            else:
+                scores = {
+                    'skillMatch': round(float(skill_scores[i]), 2),
+                    'cgpa': round(float(cgpa_scores[i]), 2),
+                    'branchMatch': round(float(branch_scores[i]), 2),
+                    'experience': round(float(experience_scores[i]), 2)
+                }
+            
+            results.append({
+                'index': i,
+                'student': {
+                    'name': students.names[i],
+                    'email': students.emails[i],
+                    'branch': students.branches[students.branch_codes[i]]
+                },
+                'isEligible': level != EligibilityLevel.NOT_ELIGIBLE.value,
+                'eligibilityLevel': level,
+                'totalScore': round(score, 2),
+                'scores': scores,
+                'disqualifiers': [name for name, failed in failures if failed[i]]
+            })
+        
+        return results
+    
+    def _branch_columns(self, students: StudentColumns, job: JobRequirements):
+        """Per-student (branch eligible, branch score), computed once per distinct branch."""
+        branch_eligible = np.zeros(len(students.branches), dtype=bool)
+        branch_score = np.zeros(len(students.branches), dtype=np.float64)
+        for code, branch in enumerate(students.branches):
+            branch = branch.lower()
+            branch_eligible[code] = self._is_branch_match(branch, job.required_branches)
+            branch_score[code] = self._calculate_branch_match(branch, job.required_branches)
+        return branch_eligible[students.branch_codes], branch_score[students.branch_codes]
+    
+    def _skill_hits(self, students: StudentColumns, job: JobRequirements) -> np.ndarray:
+        """
+        (students x job skills) boolean matrix of matched job skills.
+        
+        Each vocabulary skill a student uses is matched against the job once;
+        per-student rows are then OR-reductions over the CSR skill segments.
+        """
+        job_skills = job.mandatory_skills + job.preferred_skills
+        skill_hits = np.zeros((len(students), len(job_skills)), dtype=bool)
+        if not job_skills or not len(students.skill_ids):
+            return skill_hits
+        
+        used = np.unique(students.skill_ids)
+        vocabulary_hits = np.zeros((len(students.vocabulary), len(job_skills)), dtype=bool)
+        skills = students.vocabulary.skills
+        for skill_id in used.tolist():
+            skill = skills[skill_id]
+            vocabulary_hits[skill_id] = [
+                skill == job_skill or job_skill in skill or skill in job_skill
+                for job_skill in job_skills
+            ]
+        
+        # Segments of students without skills are empty; reduceat over the
+        # remaining starts covers each non-empty segment exactly
+        starts = students.skill_offsets[:-1]
+        has_skills = students.skill_offsets[1:] > starts
+        skill_hits[has_skills] = np.logical_or.reduceat(
+            vocabulary_hits[students.skill_ids], starts[has_skills], axis=0
+        )
+        return skill_hits
+    
+    def _skill_match_scores(self, skill_hits: np.ndarray, job: JobRequirements) -> np.ndarray:
+        """Vectorized _calculate_skill_match."""
+        mandatory_count = len(job.mandatory_skills)
+        preferred_count = len(job.preferred_skills)
+        
+        if not mandatory_count and not preferred_count:
+            return np.full(skill_hits.shape[0], 100.0)
+        
+        mandatory_matched = skill_hits[:, :mandatory_count].sum(axis=1)
+        preferred_matched = skill_hits[:, mandatory_count:].sum(axis=1)
+        
+        mandatory_score = mandatory_matched / max(mandatory_count, 1) * 100
+        preferred_score = preferred_matched / max(preferred_count, 1) * 100
+        
+        return mandatory_score * 0.7 + preferred_score * 0.3
+    
+    def _cgpa_scores(self, cgpa: np.ndarray, min_cgpa: float) -> np.ndarray:
+        """Vectorized _calculate_cgpa_score."""
+        max_cgpa = 10.0
+        range_above_min = max(max_cgpa - min_cgpa, 1e-9)
+        
+        return np.where(
+            cgpa >= max_cgpa,
+            100.0,
+            np.where(
+                cgpa < min_cgpa,
+                (cgpa / max_cgpa) * 50,
+                50 + ((cgpa - min_cgpa) / range_above_min) * 50
+            )
+        )
+    
+    def _experience_scores(self, months: np.ndarray, min_months: int) -> np.ndarray:
+        """Vectorized _calculate_experience_score."""
+        if min_months == 0:
+            return np.where(months > 0, np.minimum(100, 70 + months * 2), 70.0).astype(np.float64)
+        
+        return np.where(
+            months >= min_months,
+            np.minimum(100, 80 + (months - min_months) * 2),
+            (months / min_months) * 60
+        ).astype(np.float64)
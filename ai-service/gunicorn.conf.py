@@ -0,0 +1,16 @@
+"""
+Gunicorn Config Module
+
+Read by gunicorn when it is started directly in this directory (e.g.
+gunicorn -w 4 app:app) rather than through serve.py: exports the worker
+count gunicorn actually runs, which the app checks before serving routes
+with per-process state (route_limits.web_workers).
+"""
+
+import os
+
+
+def on_starting(server):
+    # Runs in the master before any worker is forked (but after a
+    # preloaded app was imported, so the app reads it per request)
+    os.environ['WEB_WORKERS'] = str(server.cfg.workers)
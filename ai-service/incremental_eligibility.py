@@ -0,0 +1,580 @@
+"""
+Incremental Eligibility Module
+
+Keeps the last eligibility component scores (skill_match, cgpa,
+branch_match, experience) and disqualifiers of every (student, job) pair and
+applies profile and job edits as deltas. A delta recomputes only the
+components that depend on the changed fields, only for the pairs that
+involve the changed student or job, and reports the pairs whose eligibility
+level changed, so notifications can fire only for real transitions.
+
+Scores are the same as EligibilityCalculator.calculate_eligibility.
+
+All state is in this process's memory, so the service only exposes it
+(/eligibility/*) when it runs a single worker process.
+"""
+
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from eligibility_calculator import (
+    EligibilityCalculator,
+    EligibilityLevel,
+    JobRequirements,
+    SkillVocabulary,
+    StudentProfile
+)
+
+COMPONENTS = ('skill_match', 'cgpa', 'branch_match', 'experience')
+DISQUALIFIERS = ('cgpa', 'backlogs', 'tenth_percentage', 'twelfth_percentage', 'branch')
+ALL_COMPONENTS = frozenset(COMPONENTS + ('disqualifiers',))
+
+# Level codes, ordered by _determine_level thresholds
+LEVELS = (
+    EligibilityLevel.NOT_ELIGIBLE.value,
+    EligibilityLevel.PARTIALLY_ELIGIBLE.value,
+    EligibilityLevel.ELIGIBLE.value,
+    EligibilityLevel.HIGHLY_ELIGIBLE.value
+)
+NOT_SCORED = -1
+
+# Removed students leave dead rows (in every job's arrays too) until the
+# rows are renumbered, which happens once dead rows outnumber live ones and
+# there are at least this many
+COMPACT_MIN_DEAD = 1024
+
+# Which components each profile / requirement field feeds
+STUDENT_FIELD_COMPONENTS = {
+    'skills': ('skill_match',),
+    'cgpa': ('cgpa', 'disqualifiers'),
+    'branch': ('branch_match', 'disqualifiers'),
+    'experience_months': ('experience',),
+    'backlogs': ('disqualifiers',),
+    'tenth_percentage': ('disqualifiers',),
+    'twelfth_percentage': ('disqualifiers',)
+}
+JOB_FIELD_COMPONENTS = {
+    'mandatory_skills': ('skill_match',),
+    'preferred_skills': ('skill_match',),
+    'min_cgpa': ('cgpa', 'disqualifiers'),
+    'required_branches': ('branch_match', 'disqualifiers'),
+    'min_experience_months': ('experience',),
+    'max_backlogs': ('disqualifiers',),
+    'min_tenth': ('disqualifiers',),
+    'min_twelfth': ('disqualifiers',)
+}
+
+# Alternative spellings accepted in change dicts -> calculator input keys
+STUDENT_KEY_ALIASES = {
+    'experience_months': 'experienceMonths',
+    'tenth_percentage': 'tenthPercentage',
+    'twelfth_percentage': 'twelfthPercentage'
+}
+JOB_KEY_ALIASES = {
+    'required_branches': 'requiredBranches',
+    'minCgpa': 'minCGPA',
+    'min_cgpa': 'minCGPA',
+    'min_tenth': 'minTenth',
+    'min_twelfth': 'minTwelfth',
+    'max_backlogs': 'maxBacklogs',
+    'min_experience_months': 'minExperienceMonths',
+    'mandatory_skills': 'mandatorySkills',
+    'preferred_skills': 'preferredSkills'
+}
+
+
+def _student_to_dict(profile: StudentProfile) -> Dict[str, Any]:
+    """Calculator input dict equivalent to a parsed profile."""
+    return {
+        'name': profile.name,
+        'email': profile.email,
+        'branch': profile.branch,
+        'cgpa': profile.cgpa,
+        'skills': list(profile.skills),
+        'experienceMonths': profile.experience_months,
+        'backlogs': profile.backlogs,
+        'tenthPercentage': profile.tenth_percentage,
+        'twelfthPercentage': profile.twelfth_percentage
+    }
+
+
+def _job_to_dict(job: JobRequirements) -> Dict[str, Any]:
+    """Calculator input dict equivalent to parsed requirements."""
+    return {
+        'title': job.title,
+        'company': job.company,
+        'requiredBranches': list(job.required_branches),
+        'minCGPA': job.min_cgpa,
+        'minTenth': job.min_tenth,
+        'minTwelfth': job.min_twelfth,
+        'maxBacklogs': job.max_backlogs,
+        'minExperienceMonths': job.min_experience_months,
+        'mandatorySkills': list(job.mandatory_skills),
+        'preferredSkills': list(job.preferred_skills)
+    }
+
+
+def _merge(base: Dict[str, Any], changes: Dict[str, Any], aliases: Dict[str, str]) -> Dict[str, Any]:
+    merged = dict(base)
+    for key, value in changes.items():
+        merged[aliases.get(key, key)] = value
+    return merged
+
+
+def _changed_components(old, new, field_components: Dict[str, Tuple[str, ...]]) -> FrozenSet[str]:
+    """Components fed by the fields that differ between two records."""
+    components = set()
+    for field, fed in field_components.items():
+        if getattr(old, field) != getattr(new, field):
+            components.update(fed)
+    return frozenset(components)
+
+
+class _JobState:
+    """Requirements and per-student-row scores of one job."""
+
+    __slots__ = ('requirements', 'components', 'disqualified', 'total', 'level', 'skill_hits')
+
+    def __init__(self, requirements: JobRequirements, capacity: int):
+        self.requirements = requirements
+        # (rows x COMPONENTS) scores, kept for disqualified pairs too so that
+        # clearing a disqualifier needs no recomputation
+        self.components = np.zeros((capacity, len(COMPONENTS)), dtype=np.float64)
+        # Bit i set = DISQUALIFIERS[i] failed
+        self.disqualified = np.zeros(capacity, dtype=np.uint8)
+        self.total = np.zeros(capacity, dtype=np.float64)
+        self.level = np.full(capacity, NOT_SCORED, dtype=np.int8)
+        # Vocabulary skill ID -> matched job skills, filled lazily
+        self.skill_hits = None
+
+    def grow(self, capacity: int) -> None:
+        extra = capacity - len(self.total)
+        self.components = np.concatenate([self.components, np.zeros((extra, len(COMPONENTS)))])
+        self.disqualified = np.concatenate([self.disqualified, np.zeros(extra, dtype=np.uint8)])
+        self.total = np.concatenate([self.total, np.zeros(extra)])
+        self.level = np.concatenate([self.level, np.full(extra, NOT_SCORED, dtype=np.int8)])
+
+    def take(self, rows: np.ndarray, capacity: int) -> None:
+        """Keep only the given rows, renumbered 0..len(rows)-1, in arrays of capacity."""
+        size = len(rows)
+        for name, fill in (('components', 0), ('disqualified', 0), ('total', 0), ('level', NOT_SCORED)):
+            column = getattr(self, name)
+            compacted = np.full((capacity,) + column.shape[1:], fill, dtype=column.dtype)
+            compacted[:size] = column[rows]
+            setattr(self, name, compacted)
+
+
+class IncrementalEligibility:
+    """
+    Eligibility of every student for every job, maintained under deltas.
+
+    Students get a dense row number; numeric fields live in NumPy columns
+    and skills as interned IDs, and each job keeps its component scores,
+    disqualifier flags, totals and levels in arrays over those rows. Student
+    deltas recompute one row in every job, job deltas one job over every
+    row; either way only the affected components are recomputed. Removed
+    students leave dead rows until compact() renumbers the live ones, which
+    remove_student does once enough rows are dead.
+
+    Every mutating method returns a report:
+    - components: components that were recomputed
+    - pairsRecomputed: number of (student, job) pairs touched
+    - transitions: pairs whose level changed, as studentId, jobId,
+      previousLevel, level, previousScore and totalScore; a pair that did
+      not exist before counts as not_eligible (previousLevel None)
+    """
+
+    def __init__(self, calculator: Optional[EligibilityCalculator] = None, initial_capacity: int = 1024):
+        self.calculator = calculator or EligibilityCalculator()
+        self.weights = np.array([self.calculator.weights[name] for name in COMPONENTS])
+
+        self._lock = threading.RLock()
+        self._vocabulary = SkillVocabulary()
+        self._jobs: Dict[str, _JobState] = {}
+
+        self._rows: Dict[str, int] = {}
+        self._row_ids: List[Optional[str]] = []
+        self._profiles: List[Optional[StudentProfile]] = []
+        self._skill_ids: List[np.ndarray] = []
+        self._branch_codes: Dict[str, int] = {}
+        self._branch_names: List[str] = []
+        self._dead = 0
+
+        capacity = max(1, initial_capacity)
+        self._initial_capacity = capacity
+        self._live = np.zeros(capacity, dtype=bool)
+        self._cgpa = np.zeros(capacity, dtype=np.float64)
+        self._backlogs = np.zeros(capacity, dtype=np.int64)
+        self._tenth = np.zeros(capacity, dtype=np.float64)
+        self._twelfth = np.zeros(capacity, dtype=np.float64)
+        self._experience = np.zeros(capacity, dtype=np.int64)
+        self._branch = np.zeros(capacity, dtype=np.int32)
+
+    # Students
+
+    def upsert_students(self, students: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Insert or replace students given as calculator profile dicts with a
+        studentId (or id). Replaced students are diffed against their last
+        profile and only the affected components are recomputed.
+        """
+        parsed = []
+        for student in students:
+            student_id = student.get('studentId', student.get('id'))
+            if student_id is None:
+                raise ValueError('Every student needs a studentId')
+            parsed.append((str(student_id), self.calculator._parse_student(student)))
+
+        with self._lock:
+            return self._apply_students(parsed)
+
+    def update_student(self, student_id: str, changes: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply a partial profile change, e.g. {"skills": [...]} or {"cgpa": 8.2}.
+
+        Raises:
+            KeyError: if the student is unknown
+        """
+        with self._lock:
+            row = self._rows[student_id]
+            merged = _merge(_student_to_dict(self._profiles[row]), changes, STUDENT_KEY_ALIASES)
+            return self._apply_students([(student_id, self.calculator._parse_student(merged))])
+
+    def remove_student(self, student_id: str) -> bool:
+        """Drop a student and its pairs; returns False if it was unknown."""
+        with self._lock:
+            row = self._rows.pop(student_id, None)
+            if row is None:
+                return False
+            self._row_ids[row] = None
+            self._profiles[row] = None
+            self._skill_ids[row] = np.zeros(0, dtype=np.int32)
+            self._live[row] = False
+            for state in self._jobs.values():
+                state.level[row] = NOT_SCORED
+            self._dead += 1
+            if self._dead >= COMPACT_MIN_DEAD and self._dead > len(self._rows):
+                self.compact()
+            return True
+
+    def compact(self) -> None:
+        """Renumber live students densely, in insertion order, dropping dead rows."""
+        with self._lock:
+            if not self._dead:
+                return
+            live = np.flatnonzero(self._live[:len(self._row_ids)])
+            size = len(live)
+
+            self._row_ids = [self._row_ids[row] for row in live.tolist()]
+            self._profiles = [self._profiles[row] for row in live.tolist()]
+            self._skill_ids = [self._skill_ids[row] for row in live.tolist()]
+            self._rows = {student_id: row for row, student_id in enumerate(self._row_ids)}
+
+            capacity = max(self._initial_capacity, size)
+            for name in ('_live', '_cgpa', '_backlogs', '_tenth', '_twelfth', '_experience', '_branch'):
+                column = getattr(self, name)
+                compacted = np.zeros(capacity, dtype=column.dtype)
+                compacted[:size] = column[live]
+                setattr(self, name, compacted)
+            for state in self._jobs.values():
+                state.take(live, capacity)
+            self._dead = 0
+
+    def _apply_students(self, parsed: List[Tuple[str, StudentProfile]]) -> Dict[str, Any]:
+        # Rows grouped by the components they need recomputed
+        groups: Dict[FrozenSet[str], List[int]] = {}
+
+        for student_id, profile in parsed:
+            row = self._rows.get(student_id)
+            if row is None:
+                row = len(self._row_ids)
+                self._rows[student_id] = row
+                self._row_ids.append(student_id)
+                self._profiles.append(None)
+                self._skill_ids.append(None)
+                self._ensure_capacity(row + 1)
+                components = ALL_COMPONENTS
+            else:
+                components = _changed_components(self._profiles[row], profile, STUDENT_FIELD_COMPONENTS)
+            self._store_profile(row, profile)
+            if components:
+                groups.setdefault(components, []).append(row)
+
+        transitions = []
+        recomputed = set()
+        pairs = 0
+        for components, rows in groups.items():
+            rows = np.array(sorted(set(rows)), dtype=np.int64)
+            recomputed.update(components)
+            for job_id, state in self._jobs.items():
+                self._recompute(state, rows, components)
+                transitions.extend(self._finish(job_id, state, rows))
+                pairs += len(rows)
+
+        return self._report(recomputed, pairs, transitions)
+
+    def _store_profile(self, row: int, profile: StudentProfile) -> None:
+        self._profiles[row] = profile
+        self._skill_ids[row] = np.array(
+            [self._vocabulary.intern(skill) for skill in profile.skills],
+            dtype=np.int32
+        )
+        self._live[row] = True
+        self._cgpa[row] = profile.cgpa
+        self._backlogs[row] = profile.backlogs
+        self._tenth[row] = profile.tenth_percentage
+        self._twelfth[row] = profile.twelfth_percentage
+        self._experience[row] = profile.experience_months
+
+        code = self._branch_codes.get(profile.branch)
+        if code is None:
+            code = self._branch_codes[profile.branch] = len(self._branch_names)
+            self._branch_names.append(profile.branch)
+        self._branch[row] = code
+
+    # Jobs
+
+    def upsert_job(self, job_id: str, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert or replace a job given as a calculator job dict."""
+        requirements = self.calculator._parse_job(job)
+        with self._lock:
+            return self._apply_job(str(job_id), requirements)
+
+    def update_job(self, job_id: str, changes: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply a partial job change, e.g. {"minCGPA": 7.5} (minCgpa and
+        snake_case keys are accepted too).
+
+        Raises:
+            KeyError: if the job is unknown
+        """
+        with self._lock:
+            merged = _merge(_job_to_dict(self._jobs[job_id].requirements), changes, JOB_KEY_ALIASES)
+            return self._apply_job(job_id, self.calculator._parse_job(merged))
+
+    def remove_job(self, job_id: str) -> bool:
+        """Drop a job and its pairs; returns False if it was unknown."""
+        with self._lock:
+            return self._jobs.pop(job_id, None) is not None
+
+    def _apply_job(self, job_id: str, requirements: JobRequirements) -> Dict[str, Any]:
+        state = self._jobs.get(job_id)
+        if state is None:
+            state = self._jobs[job_id] = _JobState(requirements, len(self._live))
+            components = ALL_COMPONENTS
+        else:
+            components = _changed_components(state.requirements, requirements, JOB_FIELD_COMPONENTS)
+            if 'skill_match' in components:
+                state.skill_hits = None
+            state.requirements = requirements
+
+        if not components:
+            return self._report(components, 0, [])
+
+        rows = np.flatnonzero(self._live[:len(self._row_ids)])
+        self._recompute(state, rows, components)
+        return self._report(components, len(rows), self._finish(job_id, state, rows))
+
+    # Scores
+
+    def get_scores(
+        self,
+        student_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Current pair results for one student, one job, or one pair.
+
+        Results are sorted by score (descending) and limited to limit pairs.
+
+        Raises:
+            KeyError: if the student or job is unknown
+        """
+        with self._lock:
+            if student_id is not None:
+                rows = np.array([self._rows[student_id]], dtype=np.int64)
+            else:
+                rows = np.flatnonzero(self._live[:len(self._row_ids)])
+            job_ids = [job_id] if job_id is not None else list(self._jobs)
+            for name in job_ids:
+                if name not in self._jobs:
+                    raise KeyError(name)
+
+            results = []
+            for name in job_ids:
+                state = self._jobs[name]
+                for row in rows.tolist():
+                    results.append(self._pair_result(name, state, row))
+
+        results.sort(key=lambda result: result['totalScore'], reverse=True)
+        return results[:limit] if limit is not None else results
+
+    def stats(self) -> Dict[str, int]:
+        """Engine size counters."""
+        with self._lock:
+            return {
+                'students': len(self._rows),
+                'rows': len(self._row_ids),
+                'jobs': len(self._jobs),
+                'pairs': len(self._rows) * len(self._jobs),
+                'skills': len(self._vocabulary)
+            }
+
+    def _pair_result(self, job_id: str, state: _JobState, row: int) -> Dict[str, Any]:
+        flags = int(state.disqualified[row])
+        level = LEVELS[state.level[row]]
+        scores = {}
+        if not flags:
+            scores = {
+                name: round(float(value), 2)
+                for name, value in zip(('skillMatch', 'cgpa', 'branchMatch', 'experience'), state.components[row])
+            }
+        return {
+            'studentId': self._row_ids[row],
+            'jobId': job_id,
+            'isEligible': level != EligibilityLevel.NOT_ELIGIBLE.value,
+            'eligibilityLevel': level,
+            'totalScore': round(float(state.total[row]), 2),
+            'scores': scores,
+            'disqualifiers': [name for bit, name in enumerate(DISQUALIFIERS) if flags & (1 << bit)]
+        }
+
+    # Recomputation
+
+    def _recompute(self, state: _JobState, rows: np.ndarray, components: FrozenSet[str]) -> None:
+        """Recompute the given components of one job for the given rows."""
+        if not len(rows):
+            return
+        job = state.requirements
+        calculator = self.calculator
+
+        if 'skill_match' in components:
+            state.components[rows, 0] = calculator._skill_match_scores(self._skill_hits(state, rows), job)
+        if 'cgpa' in components:
+            state.components[rows, 1] = calculator._cgpa_scores(self._cgpa[rows], job.min_cgpa)
+        if 'branch_match' in components:
+            branch_score = np.array([
+                calculator._calculate_branch_match(branch, job.required_branches)
+                for branch in self._branch_names
+            ], dtype=np.float64)
+            state.components[rows, 2] = branch_score[self._branch[rows]]
+        if 'experience' in components:
+            state.components[rows, 3] = calculator._experience_scores(
+                self._experience[rows],
+                job.min_experience_months
+            )
+
+        if 'disqualifiers' in components:
+            flags = np.zeros(len(rows), dtype=np.uint8)
+            flags |= (self._cgpa[rows] < job.min_cgpa).astype(np.uint8)
+            flags |= (self._backlogs[rows] > job.max_backlogs).astype(np.uint8) << 1
+            if job.min_tenth > 0:
+                flags |= (self._tenth[rows] < job.min_tenth).astype(np.uint8) << 2
+            if job.min_twelfth > 0:
+                flags |= (self._twelfth[rows] < job.min_twelfth).astype(np.uint8) << 3
+            if 'all' not in job.required_branches:
+                branch_fail = np.array([
+                    not calculator._is_branch_match(branch, job.required_branches)
+                    for branch in self._branch_names
+                ], dtype=np.uint8)
+                flags |= branch_fail[self._branch[rows]] << 4
+            state.disqualified[rows] = flags
+
+    def _skill_hits(self, state: _JobState, rows: np.ndarray) -> np.ndarray:
+        """(rows x job skills) matched-skill matrix, as in rank_candidates."""
+        job = state.requirements
+        job_skills = job.mandatory_skills + job.preferred_skills
+        hits = np.zeros((len(rows), len(job_skills)), dtype=bool)
+        if not job_skills:
+            return hits
+
+        # Extend the job's per-vocabulary-skill matches to new skills
+        known = 0 if state.skill_hits is None else len(state.skill_hits)
+        if known < len(self._vocabulary):
+            skills = self._vocabulary.skills
+            extra = np.array([
+                [skill == job_skill or job_skill in skill or skill in job_skill for job_skill in job_skills]
+                for skill in skills[known:]
+            ], dtype=bool).reshape(-1, len(job_skills))
+            state.skill_hits = extra if state.skill_hits is None else np.concatenate([state.skill_hits, extra])
+
+        row_skills = [self._skill_ids[row] for row in rows.tolist()]
+        lengths = np.array([len(ids) for ids in row_skills], dtype=np.int64)
+        if not lengths.sum():
+            return hits
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        has_skills = lengths > 0
+        hits[has_skills] = np.logical_or.reduceat(
+            state.skill_hits[np.concatenate(row_skills)], starts[has_skills], axis=0
+        )
+        return hits
+
+    def _finish(self, job_id: str, state: _JobState, rows: np.ndarray) -> List[Dict[str, Any]]:
+        """Refresh totals and levels of rows; returns their level transitions."""
+        if not len(rows):
+            return []
+        components = state.components[rows]
+        total = (
+            components[:, 0] * self.weights[0] +
+            components[:, 1] * self.weights[1] +
+            components[:, 2] * self.weights[2] +
+            components[:, 3] * self.weights[3]
+        )
+        total = np.where(state.disqualified[rows] != 0, 0.0, total)
+        level = np.select([total >= 80, total >= 60, total >= 40], [3, 2, 1], 0).astype(np.int8)
+
+        previous_level = state.level[rows]
+        previous_total = state.total[rows]
+        # A new pair (NOT_SCORED) only transitions if it is not not_eligible
+        changed = np.flatnonzero(np.maximum(previous_level, 0) != level)
+
+        state.total[rows] = total
+        state.level[rows] = level
+
+        transitions = []
+        row_ids = self._row_ids
+        for row, before, after, before_total, after_total in zip(
+            rows[changed].tolist(),
+            previous_level[changed].tolist(),
+            level[changed].tolist(),
+            previous_total[changed].tolist(),
+            total[changed].tolist()
+        ):
+            is_new = before == NOT_SCORED
+            transitions.append({
+                'studentId': row_ids[row],
+                'jobId': job_id,
+                'previousLevel': None if is_new else LEVELS[before],
+                'level': LEVELS[after],
+                'previousScore': None if is_new else round(before_total, 2),
+                'totalScore': round(after_total, 2)
+            })
+        return transitions
+
+    @staticmethod
+    def _report(components: Iterable[str], pairs: int, transitions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            'components': sorted(components),
+            'pairsRecomputed': pairs,
+            'transitions': transitions
+        }
+
+    def _ensure_capacity(self, size: int) -> None:
+        capacity = len(self._live)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        extra = capacity - len(self._live)
+        self._live = np.concatenate([self._live, np.zeros(extra, dtype=bool)])
+        self._cgpa = np.concatenate([self._cgpa, np.zeros(extra)])
+        self._backlogs = np.concatenate([self._backlogs, np.zeros(extra, dtype=np.int64)])
+        self._tenth = np.concatenate([self._tenth, np.zeros(extra)])
+        self._twelfth = np.concatenate([self._twelfth, np.zeros(extra)])
+        self._experience = np.concatenate([self._experience, np.zeros(extra, dtype=np.int64)])
+        self._branch = np.concatenate([self._branch, np.zeros(extra, dtype=np.int32)])
+        for state in self._jobs.values():
+            state.grow(capacity)
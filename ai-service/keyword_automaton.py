@@ -0,0 +1,148 @@
+"""
+Keyword Automaton Module
+
+Aho-Corasick multi-pattern matcher used to find dictionary keywords
+(skills, tools, domains) in a single linear pass over the text.
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    """Characters that continue a word (same notion as regex \\w)."""
+    return ch.isalnum() or ch == '_'
+
+
+class KeywordAutomaton:
+    """
+    Compiled dictionary of keywords matched with Aho-Corasick.
+
+    Keywords are added with an arbitrary payload, then build() compiles the
+    goto/failure/output tables once. find_all() reports every occurrence of
+    every keyword that does not run into a neighbouring word on either
+    side, so "go" does not match inside "google" and "c" does not match
+    inside "abc", while "c++", "c#" and ".net" still match.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._terminals: List[List[Tuple[int, Any]]] = [[]]
+        self._output: List[List[Tuple[int, Any]]] = [[]]
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def add(self, keyword: str, payload: Any) -> None:
+        """
+        Add a keyword to the dictionary.
+
+        Args:
+            keyword: Keyword text (matched case-sensitively; lowercase it first)
+            payload: Value reported with every match of this keyword
+        """
+        if self._terminals is None:
+            raise ValueError('Automaton loaded from tables cannot be extended')
+        if not keyword:
+            return
+
+        node = 0
+        for ch in keyword:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._terminals.append([])
+                self._goto[node][ch] = next_node
+            node = next_node
+
+        self._terminals[node].append((len(keyword), payload))
+        self._built = False
+
+    def build(self) -> 'KeywordAutomaton':
+        """Compute failure links and merge suffix outputs (breadth-first)."""
+        if self._terminals is None:
+            return self
+        self._output = [list(terminals) for terminals in self._terminals]
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+        self._built = True
+        return self
+
+    def tables(self) -> Tuple[List[Dict[str, int]], List[int], List[List[Tuple[int, Any]]]]:
+        """Compiled (goto, fail, output) tables, building them if needed."""
+        if not self._built:
+            self.build()
+        return self._goto, self._fail, self._output
+
+    @classmethod
+    def from_tables(
+        cls,
+        goto: List[Dict[str, int]],
+        fail: List[int],
+        output: List[List[Tuple[int, Any]]]
+    ) -> 'KeywordAutomaton':
+        """
+        Read-only automaton over tables as returned by tables(), e.g. after
+        a round trip through a compiled artifact. No keywords can be added.
+        """
+        automaton = cls()
+        automaton._goto = goto
+        automaton._fail = fail
+        automaton._terminals = None
+        automaton._output = output
+        automaton._built = True
+        return automaton
+
+    def find_all(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """
+        Find every word-delimited keyword occurrence in text.
+
+        Args:
+            text: Text to scan (already lowercased if keywords are lowercase)
+
+        Yields:
+            (start, end, payload) for each match, in order of end offset
+        """
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        text_length = len(text)
+        node = 0
+
+        for index, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            if not output[node]:
+                continue
+
+            # A keyword ending in a word char must not run into the next word
+            end = index + 1
+            if end < text_length and _is_word_char(ch) and _is_word_char(text[end]):
+                continue
+
+            for length, payload in output[node]:
+                start = end - length
+                if start == 0 or not _is_word_char(text[start]) or not _is_word_char(text[start - 1]):
+                    yield start, end, payload
@@ -0,0 +1,272 @@
+"""
+Metrics Module
+
+Minimal in-process metrics registry (counters, gauges, histograms) rendered
+in the Prometheus text exposition format for the /metrics endpoint.
+
+Metrics are per process: behind a pre-forking server every worker keeps its
+own registry and a scrape reports the worker that answered it.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Latency buckets in seconds, from sub-millisecond stages to slow upstream calls
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{escaped}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+class _Metric:
+    """Common state of a named metric with a fixed set of label names."""
+
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f'{self.name} expects labels {self.labelnames}, got {tuple(labels)}')
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.kind}'
+        ]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class _ValueMetric(_Metric):
+    """
+    Metric holding one number per label set.
+
+    Values are either updated directly or computed at scrape time by a
+    function given to set_function (returning a number, or for labelled
+    metrics a dict of label value tuples to numbers), which suits counters
+    another component already keeps.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._function: Optional[Callable] = None
+
+    def set_function(self, function: Callable) -> None:
+        self._function = function
+
+    def _samples(self) -> List[str]:
+        if self._function is not None:
+            value = self._function()
+            values = sorted(value.items()) if isinstance(value, dict) else [((), value)]
+        else:
+            with self._lock:
+                values = sorted(self._values.items())
+        return [
+            f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+            for key, value in values if value is not None
+        ]
+
+
+class Counter(_ValueMetric):
+    """Monotonically increasing count."""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_ValueMetric):
+    """Value that can go up and down."""
+
+    kind = 'gauge'
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets."""
+
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [bucket counts..., sum, count]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall time spent in the with block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = sorted((key, list(state)) for key, state in self._values.items())
+
+        lines = []
+        bucket_labelnames = self.labelnames + ('le',)
+        for key, state in values:
+            cumulative = 0
+            for i, bound in enumerate(self.buckets):
+                cumulative += state[i]
+                labels = _format_labels(bucket_labelnames, key + (_format_value(bound),))
+                lines.append(f'{self.name}_bucket{labels} {_format_value(cumulative)}')
+            labels = _format_labels(bucket_labelnames, key + ('+Inf',))
+            lines.append(f'{self.name}_bucket{labels} {_format_value(state[-1])}')
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f'{self.name}_sum{labels} {_format_value(state[-2])}')
+            lines.append(f'{self.name}_count{labels} {_format_value(state[-1])}')
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics, rendered together in registration order."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f'Metric {metric.name} already registered with a different type or labels')
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                # A failing scrape-time function must not break the whole scrape
+                lines.append(f'# {metric.name} unavailable: {e}')
+        return '\n'.join(lines) + '\n'
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+registry = MetricsRegistry()
+
+# Time spent in each stage of resume processing (spacy, segmentation, each
+# extractor, skills, analysis, suggestions)
+STAGE_SECONDS = registry.histogram(
+    'ai_stage_duration_seconds',
+    'Time spent in one stage of resume processing.',
+    ['stage']
+)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Record the wall time of a processing stage in ai_stage_duration_seconds."""
+    with STAGE_SECONDS.time(stage=stage):
+        yield
+
+
+def process_rss_bytes() -> Optional[float]:
+    """Current resident set size of this process, or the peak where unavailable."""
+    try:
+        with open('/proc/self/statm') as f:
+            return float(int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE'))
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KB on Linux and bytes on macOS
+    return float(peak if os.uname().sysname == 'Darwin' else peak * 1024)
+
+
+registry.gauge(
+    'process_resident_memory_bytes',
+    'Resident memory size in bytes.'
+).set_function(process_rss_bytes)
@@ -0,0 +1,147 @@
+"""
+NLP Model Module
+
+Lifecycle of the spaCy pipeline shared by the resume parser:
+- loaded lazily (or preloaded once in a pre-forking master so workers share
+  its pages copy-on-write) instead of at import time
+- only the pipeline components the parser uses are loaded
+- a readiness state that /ready can report separately from liveness
+"""
+
+import os
+import threading
+import traceback
+from typing import Any, Dict, List, Optional
+
+import spacy
+
+# Components the parser never reads (lemmas, rule-based sentences)
+DEFAULT_EXCLUDE = 'lemmatizer,senter'
+
+
+class ModelState:
+    """Loading states of an NLPModel."""
+    NOT_LOADED = 'not_loaded'
+    LOADING = 'loading'
+    READY = 'ready'
+    FAILED = 'failed'
+
+
+class NLPModel:
+    """
+    Load-once holder for a spaCy pipeline.
+
+    The parser needs NER (names, organizations) and the dependency parser
+    with its tagger/attribute ruler (noun chunks). Other components are
+    excluded at load time, so they cost neither memory nor CPU.
+    """
+
+    def __init__(self, name: Optional[str] = None, exclude: Optional[List[str]] = None):
+        self.name = name or os.getenv('SPACY_MODEL', 'en_core_web_sm')
+        if exclude is None:
+            exclude = [c.strip() for c in os.getenv('SPACY_EXCLUDE', DEFAULT_EXCLUDE).split(',') if c.strip()]
+        self.exclude = exclude
+
+        self.state = ModelState.NOT_LOADED
+        self.error = None
+        self._nlp = None
+        self._lock = threading.Lock()
+        self._loader: Optional[threading.Thread] = None
+        self._loader_lock = threading.Lock()
+        # A child forked while a loader thread runs has no such thread:
+        # give it fresh locks and let it start loading again
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+        self._loader_lock = threading.Lock()
+        self._loader = None
+        if self._nlp is None and self.state == ModelState.LOADING:
+            self.state = ModelState.NOT_LOADED
+
+    @property
+    def ready(self) -> bool:
+        return self.state == ModelState.READY
+
+    def load(self):
+        """
+        Load the pipeline if it is not loaded yet (thread-safe, idempotent).
+
+        Returns:
+            The spaCy Language object
+
+        Raises:
+            OSError: If the model package is not installed
+        """
+        if self._nlp is not None:
+            return self._nlp
+
+        with self._lock:
+            if self._nlp is not None:
+                return self._nlp
+
+            self.state = ModelState.LOADING
+            try:
+                self._nlp = spacy.load(self.name, exclude=self.exclude)
+            except OSError as e:
+                self.state = ModelState.FAILED
+                self.error = (
+                    f"spaCy model '{self.name}' is not installed. "
+                    f"Install it with: python -m spacy download {self.name}"
+                )
+                raise OSError(self.error) from e
+            except Exception as e:
+                self.state = ModelState.FAILED
+                self.error = str(e)
+                raise
+
+            self.state = ModelState.READY
+            self.error = None
+            return self._nlp
+
+    def load_in_background(self) -> Optional[threading.Thread]:
+        """
+        Start loading on a daemon thread so the process can serve liveness
+        checks meanwhile (once per process; later calls return the same
+        thread, or None when the model is already loaded).
+
+        Call it from a process that will not fork (e.g. on its first
+        request), never at import time in a pre-forking server's master.
+        """
+        if self._nlp is not None:
+            return None
+
+        with self._loader_lock:
+            if self._loader is None:
+                def _load():
+                    try:
+                        self.load()
+                    except Exception:
+                        traceback.print_exc()
+
+                self._loader = threading.Thread(target=_load, name='spacy-model-loader', daemon=True)
+                self._loader.start()
+            return self._loader
+
+    def __call__(self, text: str):
+        """Process text with the pipeline, loading it first if needed."""
+        return self.load()(text)
+
+    def pipe(self, texts, **kwargs):
+        """nlp.pipe with the pipeline, loading it first if needed."""
+        return self.load().pipe(texts, **kwargs)
+
+    def status(self) -> Dict[str, Any]:
+        """Readiness details for the /ready endpoint."""
+        return {
+            'model': self.name,
+            'state': self.state,
+            'pipeline': list(self._nlp.pipe_names) if self._nlp is not None else [],
+            'excluded': self.exclude,
+            'error': self.error
+        }
+
+
+# Shared by every ResumeParser in the process
+nlp = NLPModel()
@@ -2,23 +2,61 @@
 Lightweight OpenAI integration shim for the AI service.
 Provides OpenAIService with:
 - is_available(): returns True only if an API key is set and openai package is importable
-- analyze_resume(text): calls OpenAI if available, otherwise returns a simple local analysis
+- analyze_resume(text, fallback): calls OpenAI if available, otherwise (or when the call
+  fails or misses its deadline) returns fallback(text) or a simple local analysis
+
+Upstream calls run on one asyncio event loop per process (a daemon thread) with a
+pooled AsyncOpenAI client, so Flask request threads only wait on a future:
+- at most OPENAI_MAX_CONCURRENCY calls are in flight at once
+- each call has an OPENAI_DEADLINE second deadline (including queueing)
+- concurrent requests for the same text share one upstream call
+- successful responses are cached by text hash when a ResultCache is given
+  (looked up and stored in the calling thread, so cache I/O never blocks the loop)
 """
 
+import asyncio
+import logging
 import os
-import traceback
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+OPENAI_SECONDS = registry.histogram(
+    'openai_request_duration_seconds', 'Upstream OpenAI call latency by outcome.', ['outcome']
+)
+OPENAI_FAILURES = registry.counter(
+    'openai_failures_total', 'Upstream OpenAI calls that failed or missed their deadline.', ['reason']
+)
+
 
 class OpenAIService:
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, cache=None, base_url=None):
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
+        self.base_url = base_url or os.getenv('OPENAI_BASE_URL') or None
+        self.model = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+        self.deadline = float(os.getenv('OPENAI_DEADLINE', 15))
+        self.max_concurrency = int(os.getenv('OPENAI_MAX_CONCURRENCY', 8))
+        self.max_retries = int(os.getenv('OPENAI_MAX_RETRIES', 1))
+        self.cache = cache
         self._available = False
+        self._openai = None
+
+        # Per-process loop state, (re)created lazily so forked workers get their own
+        self._loop = None
+        self._loop_pid = None
+        self._loop_lock = threading.Lock()
         self._client = None
+        self._semaphore = None
+        self._inflight = {}
 
         if self.api_key:
             try:
                 import openai
-                openai.api_key = self.api_key
-                self._client = openai
+                self._openai = openai
                 self._available = True
             except Exception:
                 # openai not installed or failed to initialize; remain unavailable
@@ -27,29 +65,129 @@ class OpenAIService:
     def is_available(self):
         return bool(self._available)
 
-    def analyze_resume(self, text):
-        """Return analysis dict. Uses OpenAI if available, otherwise a deterministic local summary."""
+    def analyze_resume(self, text, fallback=None):
+        """Return analysis dict. Uses OpenAI if available, otherwise fallback(text) or a deterministic local summary."""
         if not text:
             return {'summary': '', 'keywords': [], 'notes': 'No text provided'}
 
         if self.is_available():
-            try:
-                # Minimal, safe request: use the completions API if available
-                resp = self._client.ChatCompletion.create(
-                    model='gpt-4o-mini',
-                    messages=[
-                        { 'role': 'system', 'content': 'You are a helpful resume analyzer.' },
-                        { 'role': 'user', 'content': f'Extract key skills and provide a brief summary for the following resume text:\n\n{text[:4000]}' }
-                    ],
-                    max_tokens=300
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key('openai-analysis', text, self.model)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            outcome = self._run(self._analyze(text, cache_key))
+            if outcome is not None:
+                result, owner = outcome
+                if result is not None:
+                    # Only the caller that made the shared call stores it
+                    if owner and cache_key is not None:
+                        self.cache.set(cache_key, result)
+                    return result
+
+        if fallback is not None:
+            return fallback(text)
+        return self._local_analysis(text)
+
+    def _run(self, coroutine):
+        """Run a coroutine on the service loop and wait for it, bounded by the deadline."""
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._get_loop())
+        try:
+            # The coroutine enforces the deadline itself; the margin only guards a stuck loop
+            return future.result(timeout=self.deadline + 1)
+        except FutureTimeoutError:
+            future.cancel()
+        except Exception:
+            logger.exception('OpenAI analysis failed')
+        return None
+
+    def _get_loop(self):
+        """Start the background event loop for this process if needed."""
+        with self._loop_lock:
+            if self._loop is None or self._loop_pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name='openai-loop', daemon=True)
+                thread.start()
+                self._loop = loop
+                self._loop_pid = os.getpid()
+                self._client = None
+                self._semaphore = None
+                self._inflight = {}
+            return self._loop
+
+    def _get_client(self):
+        """Pooled async client, created on the loop that uses it."""
+        if self._client is None:
+            import httpx
+            self._client = self._openai.AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                timeout=self.deadline,
+                max_retries=self.max_retries,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=self.max_concurrency,
+                        max_keepalive_connections=self.max_concurrency
+                    ),
+                    timeout=self.deadline
                 )
-                content = resp.choices[0].message.content
-                return { 'summary': content }
-            except Exception:
-                traceback.print_exc()
-                # Fall back to local analysis below
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    async def _analyze(self, text, cache_key=None):
+        """
+        Coalesced and deadline-bounded upstream analysis.
+
+        Returns (result or None on failure, whether this call started the
+        shared upstream call).
+        """
+        key = cache_key or hash(text)
+        task = self._inflight.get(key)
+        owner = task is None
+        if owner:
+            task = asyncio.ensure_future(self._call_with_deadline(text))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one waiter being cancelled does not cancel the shared call
+        return await asyncio.shield(task), owner
+
+    async def _call_with_deadline(self, text):
+        started = time.perf_counter()
+        outcome = 'success'
+        try:
+            return await asyncio.wait_for(self._call(text), timeout=self.deadline)
+        except asyncio.TimeoutError:
+            outcome = 'timeout'
+            logger.warning('OpenAI analysis exceeded %ss deadline; using fallback', self.deadline)
+        except Exception:
+            outcome = 'error'
+            logger.exception('OpenAI call failed')
+        finally:
+            OPENAI_SECONDS.observe(time.perf_counter() - started, outcome=outcome)
+            if outcome != 'success':
+                OPENAI_FAILURES.inc(reason=outcome)
+        return None
+
+    async def _call(self, text):
+        client = self._get_client()
+        async with self._semaphore:
+            resp = await client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    { 'role': 'system', 'content': 'You are a helpful resume analyzer.' },
+                    { 'role': 'user', 'content': f'Extract key skills and provide a brief summary for the following resume text:\n\n{text[:4000]}' }
+                ],
+                max_tokens=300
+            )
+        content = resp.choices[0].message.content
+        return { 'summary': content }
 
-        # Local deterministic fallback analysis
+    def _local_analysis(self, text):
+        """Local deterministic fallback analysis."""
         lower = text.lower()
         # very small skill heuristics
         keywords = []
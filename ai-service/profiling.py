@@ -0,0 +1,235 @@
+"""
+Profiling Module
+
+Opt-in sampling profiler for single requests. A background thread
+snapshots the request thread's Python stack at a fixed interval, so the
+request itself runs unmodified (no tracing hooks); the samples are kept as
+collapsed stacks and exported as text ("frame;frame;frame count", for
+flamegraph.pl and friends) or speedscope JSON.
+
+Requests are profiled when an admin explicitly asks for it, or
+continuously for 1 in PROFILE_SAMPLE_RATE requests. Recent profiles are
+kept in memory (and optionally written to PROFILE_DIR) and served by ID.
+
+Only the request's own thread is sampled: work handed to worker
+processes (batch parsing, file extraction) shows up as waiting, and
+streamed response bodies produced after the view returns are not covered.
+"""
+
+import hmac
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+# Python only switches threads every sys.getswitchinterval() (5 ms by
+# default), so shorter intervals mostly add overhead without more samples
+DEFAULT_INTERVAL_MS = 5.0
+MAX_STACK_DEPTH = 128
+
+Frame = Tuple[str, str, int]
+
+
+class Profile:
+    """Aggregated stack samples of one profiled request."""
+
+    def __init__(self, stacks: Dict[Tuple[Frame, ...], int], interval: float, duration: float):
+        """
+        Args:
+            stacks: Stack (outermost frame first) -> number of samples
+            interval: Seconds between samples
+            duration: Wall time covered, in seconds
+        """
+        self.stacks = stacks
+        self.interval = interval
+        self.duration = duration
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def to_collapsed(self) -> str:
+        """Collapsed stacks, one 'outer;...;inner count' line per stack."""
+        lines = []
+        for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1]):
+            lines.append(';'.join(_frame_name(frame) for frame in stack) + f' {count}')
+        return '\n'.join(lines) + '\n' if lines else ''
+
+    def to_speedscope(self, name: str = 'request') -> Dict:
+        """Speedscope 'sampled' profile, one weighted sample per distinct stack."""
+        frame_indexes: Dict[Frame, int] = {}
+        frames = []
+        samples = []
+        weights = []
+        interval_ms = self.interval * 1000
+        for stack, count in self.stacks.items():
+            sample = []
+            for frame in stack:
+                index = frame_indexes.get(frame)
+                if index is None:
+                    index = frame_indexes[frame] = len(frames)
+                    frames.append({'name': frame[1], 'file': frame[0], 'line': frame[2]})
+                sample.append(index)
+            samples.append(sample)
+            weights.append(round(count * interval_ms, 3))
+
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': name,
+            'exporter': 'ai-service profiling',
+            'activeProfileIndex': 0,
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'milliseconds',
+                'startValue': 0,
+                'endValue': round(max(self.duration * 1000, sum(weights)), 3),
+                'samples': samples,
+                'weights': weights
+            }]
+        }
+
+
+def _frame_name(frame: Frame) -> str:
+    filename, function, line = frame
+    return f'{function} ({os.path.basename(filename)}:{line})'
+
+
+class SamplingProfiler:
+    """
+    Samples one thread's stack from a background thread until stopped.
+    """
+
+    def __init__(self, thread_id: Optional[int] = None, interval_ms: float = DEFAULT_INTERVAL_MS):
+        """
+        Args:
+            thread_id: Thread to sample (default: the calling thread)
+            interval_ms: Milliseconds between samples
+        """
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = max(interval_ms, 0.1) / 1000
+        self._stacks: Counter = Counter()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+
+    def start(self) -> 'SamplingProfiler':
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='request-profiler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Profile:
+        """Stop sampling and return what was collected."""
+        duration = time.perf_counter() - self._started
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        return Profile(dict(self._stacks), self.interval, duration)
+
+    def _run(self) -> None:
+        # Frame code objects are cached so a sample is a dict lookup per frame
+        names: Dict[object, Tuple[str, str, int]] = {}
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                name = names.get(code)
+                if name is None:
+                    name = names[code] = (code.co_filename, code.co_name, code.co_firstlineno)
+                stack.append(name)
+                frame = frame.f_back
+            stack.reverse()
+            self._stacks[tuple(stack)] += 1
+
+
+class ProfileStore:
+    """Most recent profiles by ID, in memory and optionally on disk."""
+
+    def __init__(self, keep: int = 50, directory: Optional[str] = None):
+        self.keep = max(1, keep)
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._profiles: 'OrderedDict[str, Tuple[Dict, Profile]]' = OrderedDict()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def add(self, info: Dict, profile: Profile) -> str:
+        """Store a profile with its request metadata; returns its ID."""
+        profile_id = uuid.uuid4().hex[:16]
+        info = dict(info, id=profile_id, samples=profile.samples)
+        with self._lock:
+            self._profiles[profile_id] = (info, profile)
+            while len(self._profiles) > self.keep:
+                self._profiles.popitem(last=False)
+
+        if self.directory:
+            path = os.path.join(self.directory, f'{profile_id}.speedscope.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(profile.to_speedscope(f"{info.get('method', '')} {info.get('route', '')}"), f)
+        return profile_id
+
+    def get(self, profile_id: str) -> Optional[Tuple[Dict, Profile]]:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self) -> List[Dict]:
+        """Metadata of stored profiles, newest first."""
+        with self._lock:
+            return [info for info, _ in reversed(self._profiles.values())]
+
+
+class RequestProfiling:
+    """
+    Decides which requests to profile and keeps their profiles.
+
+    Configured from the environment:
+        PROFILE_ADMIN_TOKEN   token required to ask for or read profiles
+                              (unset: explicit profiling is disabled)
+        PROFILE_SAMPLE_RATE   profile 1 in N requests (0 = never)
+        PROFILE_INTERVAL_MS   milliseconds between stack samples
+        PROFILE_KEEP          profiles kept in memory
+        PROFILE_DIR           directory to also write speedscope files to
+    """
+
+    def __init__(
+        self,
+        admin_token: Optional[str] = None,
+        sample_rate: Optional[int] = None,
+        interval_ms: Optional[float] = None,
+        keep: Optional[int] = None,
+        directory: Optional[str] = None
+    ):
+        self.admin_token = admin_token if admin_token is not None else os.getenv('PROFILE_ADMIN_TOKEN', '')
+        self.sample_rate = int(sample_rate if sample_rate is not None else os.getenv('PROFILE_SAMPLE_RATE', 0))
+        self.interval_ms = float(
+            interval_ms if interval_ms is not None else os.getenv('PROFILE_INTERVAL_MS', DEFAULT_INTERVAL_MS)
+        )
+        self.store = ProfileStore(
+            int(keep if keep is not None else os.getenv('PROFILE_KEEP', 50)),
+            directory if directory is not None else os.getenv('PROFILE_DIR') or None
+        )
+        self._counter = itertools.count(1)
+
+    def is_admin(self, token: Optional[str]) -> bool:
+        """Whether token is the configured admin token."""
+        return bool(self.admin_token) and bool(token) and hmac.compare_digest(
+            token.encode('utf-8'), self.admin_token.encode('utf-8')
+        )
+
+    def sampled(self) -> bool:
+        """Whether this request is the 1 in sample_rate picked for continuous profiling."""
+        return self.sample_rate > 0 and next(self._counter) % self.sample_rate == 0
+
+    def start(self) -> SamplingProfiler:
+        """Start sampling the calling (request) thread."""
+        return SamplingProfiler(interval_ms=self.interval_ms).start()
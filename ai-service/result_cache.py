@@ -0,0 +1,221 @@
+"""
+Result Cache Module
+
+Content-addressed cache for expensive per-resume results (spaCy parsing,
+paid OpenAI analysis). Two tiers:
+- an in-process LRU with a size bound and TTL
+- an optional SQLite file shared by every worker on the host, so results
+  survive restarts
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+def normalize_text(text: str) -> str:
+    """Normalize line endings and surrounding whitespace before hashing."""
+    lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    return '\n'.join(line.rstrip() for line in lines).strip()
+
+
+class ResultCache:
+    """
+    Two-tier cache keyed by a hash of the normalized input text plus the
+    versions of whatever produced the result.
+
+    Cached values must be JSON-serializable and are shared between callers,
+    so treat them as read-only.
+
+    The SQLite connection has its own lock, so memory hits never wait
+    behind a disk read, write or commit.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        disk_path: Optional[str] = None
+    ):
+        self.max_entries = int(max_entries if max_entries is not None else os.getenv('RESULT_CACHE_SIZE', 1024))
+        self.ttl_seconds = float(ttl_seconds if ttl_seconds is not None else os.getenv('RESULT_CACHE_TTL', 86400))
+        self.disk_path = disk_path if disk_path is not None else os.getenv('RESULT_CACHE_PATH', '')
+
+        self._memory: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._connection = None
+        self._connection_pid = None
+        self._disk_writes = 0
+
+        self._stats = {
+            'memoryHits': 0,
+            'diskHits': 0,
+            'misses': 0,
+            'writes': 0,
+            'evictions': 0,
+            'errors': 0
+        }
+
+    @staticmethod
+    def make_key(namespace: str, text: str, *versions: str) -> str:
+        """Cache key for text processed by a given producer/version set."""
+        digest = hashlib.sha256()
+        digest.update('\x1f'.join((namespace,) + tuple(str(v) for v in versions)).encode('utf-8'))
+        digest.update(b'\x1e')
+        digest.update(normalize_text(text).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None."""
+        now = time.time()
+
+        if self.max_entries > 0:
+            with self._lock:
+                entry = self._memory.get(key)
+                if entry is not None:
+                    expires_at, value = entry
+                    if expires_at > now:
+                        self._memory.move_to_end(key)
+                        self._stats['memoryHits'] += 1
+                        return value
+                    del self._memory[key]
+
+        value = self._disk_get(key, now)
+        with self._lock:
+            if value is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['diskHits'] += 1
+
+        self._memory_set(key, value, now)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value in every enabled tier."""
+        now = time.time()
+        self._memory_set(key, value, now)
+        self._disk_set(key, value, now)
+        with self._lock:
+            self._stats['writes'] += 1
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        cacheable: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Args:
+            key: Cache key from make_key()
+            compute: Produces the value on a miss
+            cacheable: Predicate deciding whether a computed value is stored
+                (e.g. not results cut short by a time budget)
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            if cacheable is None or cacheable(value):
+                self.set(key, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current sizes."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memoryEntries'] = len(self._memory)
+
+        lookups = stats['memoryHits'] + stats['diskHits'] + stats['misses']
+        stats['hitRatio'] = round((stats['memoryHits'] + stats['diskHits']) / lookups, 4) if lookups else 0.0
+        stats['maxEntries'] = self.max_entries
+        stats['ttlSeconds'] = self.ttl_seconds
+        stats['diskEnabled'] = bool(self.disk_path)
+        return stats
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        with self._disk_lock:
+            connection = self._get_connection()
+            if connection is not None:
+                connection.execute('DELETE FROM results')
+                connection.commit()
+
+    def _memory_set(self, key: str, value: Any, now: float) -> None:
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._memory[key] = (now + self.ttl_seconds, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def _get_connection(self):
+        """SQLite connection for this process (reopened after a fork). Call with _disk_lock held."""
+        if not self.disk_path:
+            return None
+
+        if self._connection is None or self._connection_pid != os.getpid():
+            directory = os.path.dirname(self.disk_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.disk_path, timeout=5, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS results '
+                '(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)'
+            )
+            connection.commit()
+            self._connection = connection
+            self._connection_pid = os.getpid()
+
+        return self._connection
+
+    def _disk_get(self, key: str, now: float) -> Optional[Any]:
+        if not self.disk_path:
+            return None
+
+        try:
+            with self._disk_lock:
+                row = self._get_connection().execute(
+                    'SELECT value, expires_at FROM results WHERE key = ?', (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            with self._lock:
+                self._stats['errors'] += 1
+            return None
+
+        if row is None or row[1] <= now:
+            return None
+        return json.loads(row[0])
+
+    def _disk_set(self, key: str, value: Any, now: float) -> None:
+        if not self.disk_path:
+            return
+
+        serialized = json.dumps(value)
+        try:
+            with self._disk_lock:
+                connection = self._get_connection()
+                connection.execute(
+                    'INSERT OR REPLACE INTO results (key, value, expires_at) VALUES (?, ?, ?)',
+                    (key, serialized, now + self.ttl_seconds)
+                )
+                # Purge expired rows now and then instead of on every write
+                self._disk_writes += 1
+                if self._disk_writes % 256 == 0:
+                    connection.execute('DELETE FROM results WHERE expires_at <= ?', (now,))
+                connection.commit()
+        except sqlite3.Error:
+            with self._lock:
+                self._stats['errors'] += 1
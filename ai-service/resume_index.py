@@ -0,0 +1,353 @@
+"""
+Resume Index Module
+
+BM25 full-text index over parsed resume texts, for ranking every stored
+resume against a job description in one pass instead of extracting and
+matching skills per resume.
+
+Postings live in two segments: a compacted CSR segment in NumPy arrays
+(term -> documents and term frequencies) and a small per-term delta that
+new resumes are appended to. The delta is merged into the CSR segment
+once it grows past a fraction of it, so adding a resume is cheap and the
+merge cost is amortized; the merge also renumbers the live resumes, so
+replaced and removed ones do not hold memory. A query gathers the postings of its terms from
+both segments and accumulates BM25 weights per document with one
+bincount, which is the sparse matrix-vector product of the term-document
+matrix with the query vector.
+"""
+
+import hashlib
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Words as skills are written: 'node.js' -> 'node', 'js'; 'c++' and 'c#' kept
+_TOKEN_PATTERN = re.compile(r'[^\W_][\w+#]*')
+
+STOP_WORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by
+can could did do does doing during each etc for from had has have having he
+her his how i if in into is it its just may me more most my must not of on
+or our out over own same she should so some such than that the their them
+then there these they this those through to too under up very via was we
+were what when where which while who will with within would you your
+""".split())
+
+# The delta is merged into the CSR segment once it holds more postings
+# than this, or more than 1/MERGE_RATIO of the CSR segment
+MERGE_MIN_POSTINGS = 50000
+MERGE_RATIO = 4
+# Removals alone also trigger a merge once dead slots outnumber live
+# resumes and there are at least this many
+MERGE_MIN_DEAD = 1024
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens of text, without stop words."""
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+class ResumeIndex:
+    """
+    Incrementally updatable BM25 index keyed by resume ID.
+
+    Each resume gets a dense internal number; replacing or removing a
+    resume leaves a dead number whose postings are skipped by queries and
+    which is reclaimed at the next merge, when live resumes are renumbered. Document frequencies and lengths only count
+    live resumes, so scores never depend on removed ones.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Args:
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+
+        self._lock = threading.RLock()
+        self._numbers: Dict[str, int] = {}
+        self._resume_ids: List[Optional[str]] = []
+        self._fingerprints: List[Optional[str]] = []
+        self._doc_terms: List[Optional[np.ndarray]] = []
+        self._terms: Dict[str, int] = {}
+        self._term_names: List[str] = []
+
+        self._lengths = np.zeros(1024, dtype=np.float64)
+        self._live = np.zeros(1024, dtype=bool)
+        self._df = np.zeros(1024, dtype=np.int64)
+        self._total_length = 0.0
+        self._live_count = 0
+        self._dead_count = 0
+
+        # CSR segment over the first len(_offsets) - 1 term IDs
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._docs = np.zeros(0, dtype=np.int32)
+        self._tfs = np.zeros(0, dtype=np.float32)
+
+        # Delta segment: term ID -> (document numbers, term frequencies)
+        self._delta: Dict[int, Tuple[List[int], List[float]]] = {}
+        self._delta_postings = 0
+
+    def __len__(self) -> int:
+        return self._live_count
+
+    def __contains__(self, resume_id: str) -> bool:
+        return resume_id in self._numbers
+
+    def add(self, resume_id: str, text: str) -> bool:
+        """
+        Insert or replace one resume.
+
+        Returns:
+            False if the resume was already indexed with the same text
+        """
+        fingerprint = hashlib.sha1(text.encode('utf-8', 'surrogatepass')).hexdigest()
+        counts = Counter(tokenize(text))
+
+        with self._lock:
+            number = self._numbers.get(resume_id)
+            if number is not None:
+                if self._fingerprints[number] == fingerprint:
+                    return False
+                self._remove_number(number)
+
+            number = len(self._resume_ids)
+            self._numbers[resume_id] = number
+            self._resume_ids.append(resume_id)
+            self._fingerprints.append(fingerprint)
+
+            term_ids = [self._term_id(term) for term in counts]
+            self._doc_terms.append(np.array(term_ids, dtype=np.int32))
+            self._ensure_capacity(number + 1, len(self._term_names))
+
+            length = float(sum(counts.values()))
+            self._lengths[number] = length
+            self._live[number] = True
+            self._total_length += length
+            self._live_count += 1
+            if term_ids:
+                self._df[term_ids] += 1
+
+            for term_id, count in zip(term_ids, counts.values()):
+                docs, tfs = self._delta.setdefault(term_id, ([], []))
+                docs.append(number)
+                tfs.append(float(count))
+            self._delta_postings += len(term_ids)
+
+            if self._delta_postings > max(MERGE_MIN_POSTINGS, len(self._docs) // MERGE_RATIO) or self._too_many_dead():
+                self._merge()
+            return True
+
+    def add_many(self, resumes: Iterable[Tuple[str, str]]) -> int:
+        """Insert or replace (resume ID, text) pairs; returns how many changed."""
+        return sum(1 for resume_id, text in resumes if self.add(resume_id, text))
+
+    def remove(self, resume_id: str) -> bool:
+        """Drop a resume; returns False if it was not indexed."""
+        with self._lock:
+            number = self._numbers.pop(resume_id, None)
+            if number is None:
+                return False
+            self._remove_number(number)
+            if self._too_many_dead():
+                self._merge()
+            return True
+
+    def search(self, query: str, top_k: int = 10, min_score: float = 0.0) -> Dict:
+        """
+        Rank indexed resumes against a query such as a job description.
+
+        Args:
+            query: Free text; each distinct word counts once
+            top_k: Number of resumes returned
+            min_score: Minimum BM25 score of a returned resume
+
+        Returns:
+            {'total': resumes matching any query term,
+             'results': [{'resumeId', 'score', 'matchedTerms'}] best first}
+        """
+        query_terms = sorted(set(tokenize(query)))
+
+        with self._lock:
+            term_ids = [self._terms[term] for term in query_terms if term in self._terms]
+            term_ids = [term_id for term_id in term_ids if self._df[term_id] > 0]
+            if not term_ids or not self._live_count:
+                return {'total': 0, 'results': []}
+
+            docs, tfs, positions = self._gather(term_ids)
+            live = self._live[docs]
+            docs, tfs, positions = docs[live], tfs[live], positions[live]
+
+            # BM25 (Lucene's non-negative idf)
+            document_count = self._live_count
+            df = self._df[term_ids].astype(np.float64)
+            idf = np.log(1.0 + (document_count - df + 0.5) / (df + 0.5))
+            average_length = self._total_length / document_count or 1.0
+            norms = self.k1 * (1.0 - self.b + self.b * self._lengths[docs] / average_length)
+            weights = idf[positions] * tfs * (self.k1 + 1.0) / (tfs + norms)
+
+            scores = np.bincount(docs, weights=weights, minlength=len(self._resume_ids))
+            matched = np.flatnonzero(scores > 0)
+            total = len(matched)
+            if min_score > 0:
+                matched = matched[scores[matched] >= min_score]
+
+            top_k = max(0, int(top_k))
+            if len(matched) > top_k:
+                matched = matched[np.argpartition(-scores[matched], top_k - 1)[:top_k]] if top_k else matched[:0]
+            # Best first, ties in insertion order
+            top = matched[np.lexsort((matched, -scores[matched]))]
+
+            # Matched terms of the returned resumes, from the gathered postings
+            in_top = np.isin(docs, top)
+            terms_by_doc: Dict[int, List[str]] = {}
+            for doc, position in zip(docs[in_top].tolist(), positions[in_top].tolist()):
+                terms_by_doc.setdefault(doc, []).append(self._term_names[term_ids[position]])
+
+            return {
+                'total': total,
+                'results': [
+                    {
+                        'resumeId': self._resume_ids[doc],
+                        'score': round(float(scores[doc]), 4),
+                        'matchedTerms': sorted(terms_by_doc.get(doc, []))
+                    }
+                    for doc in top.tolist()
+                ]
+            }
+
+    def stats(self) -> Dict[str, int]:
+        """Index size counters."""
+        with self._lock:
+            return {
+                'resumes': self._live_count,
+                'slots': len(self._resume_ids),
+                'terms': len(self._term_names),
+                'postings': len(self._docs),
+                'pendingPostings': self._delta_postings
+            }
+
+    def compact(self) -> None:
+        """Merge pending postings now (e.g. after a bulk load)."""
+        with self._lock:
+            if self._delta_postings or self._dead_count:
+                self._merge()
+
+    def _too_many_dead(self) -> bool:
+        return self._dead_count >= MERGE_MIN_DEAD and self._dead_count > self._live_count
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._terms.get(term)
+        if term_id is None:
+            term_id = len(self._term_names)
+            self._terms[term] = term_id
+            self._term_names.append(term)
+        return term_id
+
+    def _ensure_capacity(self, documents: int, terms: int) -> None:
+        if documents > len(self._lengths):
+            capacity = max(documents, 2 * len(self._lengths))
+            self._lengths = np.concatenate([self._lengths, np.zeros(capacity - len(self._lengths))])
+            self._live = np.concatenate([self._live, np.zeros(capacity - len(self._live), dtype=bool)])
+        if terms > len(self._df):
+            capacity = max(terms, 2 * len(self._df))
+            self._df = np.concatenate([self._df, np.zeros(capacity - len(self._df), dtype=np.int64)])
+
+    def _remove_number(self, number: int) -> None:
+        """Mark a document dead and take it out of the collection statistics."""
+        self._resume_ids[number] = None
+        self._fingerprints[number] = None
+        term_ids = self._doc_terms[number]
+        self._doc_terms[number] = None
+        if term_ids is not None and len(term_ids):
+            self._df[term_ids] -= 1
+        self._live[number] = False
+        self._total_length -= self._lengths[number]
+        self._live_count -= 1
+        self._dead_count += 1
+
+    def _gather(self, term_ids: List[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Postings of term_ids from both segments.
+
+        Returns:
+            (document numbers, term frequencies, position of the term in term_ids)
+        """
+        docs, tfs, positions = [], [], []
+        csr_terms = len(self._offsets) - 1
+        for position, term_id in enumerate(term_ids):
+            if term_id < csr_terms:
+                start, end = self._offsets[term_id], self._offsets[term_id + 1]
+                if end > start:
+                    docs.append(self._docs[start:end])
+                    tfs.append(self._tfs[start:end])
+                    positions.append(np.full(end - start, position, dtype=np.int32))
+            delta = self._delta.get(term_id)
+            if delta is not None:
+                docs.append(np.array(delta[0], dtype=np.int32))
+                tfs.append(np.array(delta[1], dtype=np.float32))
+                positions.append(np.full(len(delta[0]), position, dtype=np.int32))
+
+        if not docs:
+            return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.int32)
+        return np.concatenate(docs), np.concatenate(tfs).astype(np.float64), np.concatenate(positions)
+
+    def _merge(self) -> None:
+        """Fold the delta into the CSR segment, dropping and renumbering dead documents."""
+        term_count = len(self._term_names)
+        csr_terms = len(self._offsets) - 1
+
+        delta_terms, delta_docs, delta_tfs = [], [], []
+        for term_id, (docs, tfs) in self._delta.items():
+            delta_terms.append(np.full(len(docs), term_id, dtype=np.int32))
+            delta_docs.append(np.array(docs, dtype=np.int32))
+            delta_tfs.append(np.array(tfs, dtype=np.float32))
+
+        terms = np.concatenate([
+            np.repeat(np.arange(csr_terms, dtype=np.int32), np.diff(self._offsets))
+        ] + delta_terms)
+        docs = np.concatenate([self._docs] + delta_docs)
+        tfs = np.concatenate([self._tfs] + delta_tfs)
+
+        live = self._live[docs]
+        terms, docs, tfs = terms[live], docs[live], tfs[live]
+
+        # Renumber live documents densely; the mapping keeps their order, so
+        # postings stay sorted by document within a term
+        if self._dead_count:
+            survivors = np.flatnonzero(self._live[:len(self._resume_ids)])
+            renumber = np.full(len(self._resume_ids), -1, dtype=np.int32)
+            renumber[survivors] = np.arange(len(survivors), dtype=np.int32)
+            docs = renumber[docs]
+            self._renumber(survivors.tolist())
+
+        # Stable: CSR documents precede (older) delta documents within a term
+        order = np.argsort(terms, kind='stable')
+        self._docs = docs[order]
+        self._tfs = tfs[order]
+        self._offsets = np.zeros(term_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(terms, minlength=term_count), out=self._offsets[1:])
+
+        self._delta = {}
+        self._delta_postings = 0
+
+    def _renumber(self, survivors: List[int]) -> None:
+        """Keep only the survivors' per-document state, numbered 0..n-1."""
+        self._resume_ids = [self._resume_ids[number] for number in survivors]
+        self._fingerprints = [self._fingerprints[number] for number in survivors]
+        self._doc_terms = [self._doc_terms[number] for number in survivors]
+        self._numbers = {resume_id: number for number, resume_id in enumerate(self._resume_ids)}
+
+        capacity = max(1024, len(survivors))
+        lengths = np.zeros(capacity, dtype=np.float64)
+        lengths[:len(survivors)] = self._lengths[survivors]
+        self._lengths = lengths
+        self._live = np.zeros(capacity, dtype=bool)
+        self._live[:len(survivors)] = True
+        self._dead_count = 0
+
@@ -4,18 +4,111 @@ Resume Parser Module
 Extracts structured information from resume text using NLP techniques.
 """
 
-import re
-import spacy
-from typing import Dict, List, Any, Optional
+import os
+import time
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 
-# Load spaCy model
-try:
-    nlp = spacy.load('en_core_web_sm')
-except OSError:
-    print("Downloading spaCy model...")
-    import subprocess
-    subprocess.run(['python', '-m', 'spacy', 'download', 'en_core_web_sm'])
-    nlp = spacy.load('en_core_web_sm')
+# Shared spaCy pipeline, loaded on first use (see nlp_model)
+from nlp_model import nlp
+from metrics import registry as metrics_registry, stage_timer
+from section_segmenter import Section, SectionSegmenter, first_section
+from text_extractors import (
+    count_words,
+    find_date_ranges,
+    find_email,
+    find_github,
+    find_grade,
+    find_linkedin,
+    find_phone,
+    has_quantified_impact
+)
+
+NLP_DEGRADED = metrics_registry.counter(
+    'resume_nlp_degraded_total',
+    'Resumes whose NLP pass stopped early at the character, token or time cap.',
+    ['reason']
+)
+
+# Window boundaries are moved back to the last paragraph break, line
+# break or space within this fraction of the window, in that order
+WINDOW_BREAK_SEARCH = 0.25
+
+
+class TextSpan:
+    """Entity or noun chunk of a windowed document, at global character offsets."""
+    
+    __slots__ = ('text', 'label_', 'start_char', 'end_char')
+    
+    def __init__(self, text: str, label: str, start_char: int, end_char: int):
+        self.text = text
+        self.label_ = label
+        self.start_char = start_char
+        self.end_char = end_char
+
+
+class ParsedDocument:
+    """
+    A resume run through the spaCy pipeline exactly once.
+    
+    Shared by every extractor handling the same request so that sections
+    reuse the entities and noun chunks of the full document (selected by
+    character offsets) instead of re-running the pipeline on slices.
+    
+    Long resumes are processed in windows (see ResumeParser.process); their
+    documents hold no spaCy Doc, only the merged entities and noun chunks,
+    plus a description of what was skipped if a cap was hit.
+    """
+    
+    def __init__(
+        self,
+        text: str,
+        doc,
+        sections: List[Section],
+        entities: Optional[List] = None,
+        noun_chunks: Optional[List] = None,
+        degraded: Optional[Dict[str, Any]] = None
+    ):
+        self.text = text
+        self.doc = doc
+        self.sections = sections
+        self.degraded = degraded
+        self._entities = entities
+        self._noun_chunks = noun_chunks
+    
+    def entities(self, start: int = 0, end: Optional[int] = None) -> List:
+        """Named entities lying entirely within text[start:end]."""
+        if self._entities is None:
+            self._entities = list(self.doc.ents)
+        if end is None:
+            end = len(self.text)
+        return [ent for ent in self._entities if ent.start_char >= start and ent.end_char <= end]
+    
+    def noun_chunks(self, start: int = 0, end: Optional[int] = None) -> List:
+        """Noun chunks lying entirely within text[start:end]."""
+        if self._noun_chunks is None:
+            self._noun_chunks = list(self.doc.noun_chunks)
+        if end is None:
+            end = len(self.text)
+        return [chunk for chunk in self._noun_chunks if chunk.start_char >= start and chunk.end_char <= end]
+
+
+def text_windows(text: str, window_chars: int) -> Iterator[Tuple[int, str]]:
+    """
+    Split text into (offset, window) pieces of at most window_chars,
+    preferably at paragraph breaks, then line breaks, then spaces.
+    """
+    start = 0
+    while start < len(text):
+        end = min(start + window_chars, len(text))
+        if end < len(text):
+            floor = end - int(window_chars * WINDOW_BREAK_SEARCH)
+            for separator in ('\n\n', '\n', ' '):
+                cut = text.rfind(separator, floor, end)
+                if cut > start:
+                    end = cut + len(separator)
+                    break
+        yield start, text[start:end]
+        start = end
 
 
 class ResumeParser:
@@ -23,12 +116,10 @@ class ResumeParser:
     Parse and extract information from resume text.
     """
     
+    # Bump whenever extraction logic changes so cached results are invalidated
+    VERSION = '1.4.0'
+    
     def __init__(self):
-        self.email_pattern = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
-        self.phone_pattern = re.compile(r'[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{4,6}[-\s\.]?[0-9]{0,4}')
-        self.linkedin_pattern = re.compile(r'linkedin\.com/in/[\w-]+')
-        self.github_pattern = re.compile(r'github\.com/[\w-]+')
-        
         # Education keywords
         self.degree_keywords = [
             'bachelor', 'b.tech', 'b.e.', 'btech', 'b.sc', 'bsc',
@@ -45,40 +136,179 @@ class ResumeParser:
             'certifications': ['certifications', 'certificates', 'credentials', 'courses'],
             'achievements': ['achievements', 'awards', 'honors', 'accomplishments']
         }
+        
+        # Summary/objective headers (segmented, but not scored as a section)
+        self.summary_keywords = ['summary', 'objective', 'profile', 'about me', 'career objective']
+        
+        self.segmenter = SectionSegmenter({
+            'summary': self.summary_keywords,
+            **self.section_headers
+        })
+        
+        # Long-document mode: texts longer than one window are run through
+        # spaCy window by window, and the NLP pass stops (keeping what it
+        # has) at the first cap on characters, tokens or seconds
+        self.window_chars = int(os.getenv('NLP_WINDOW_CHARS', 20000))
+        self.max_chars = int(os.getenv('NLP_MAX_CHARS', 200000))
+        self.max_tokens = int(os.getenv('NLP_MAX_TOKENS', 50000))
+        self.time_budget = float(os.getenv('NLP_TIME_BUDGET', 10))
+        self.window_batch_size = 4
+    
+    def process(self, text: str) -> ParsedDocument:
+        """
+        Run the spaCy pipeline over resume text once.
+        
+        Args:
+            text: Raw resume text
+            
+        Returns:
+            ParsedDocument to hand to parse() and analyze_resume()
+        """
+        if self.is_long(text):
+            return self._process_windows(text)
+        
+        with stage_timer('spacy'):
+            doc = nlp(text)
+        with stage_timer('segmentation'):
+            sections = self.segmenter.segment(text)
+        return ParsedDocument(text, doc, sections)
+    
+    def is_long(self, text: str) -> bool:
+        """Whether text is processed in windows rather than as one Doc."""
+        return len(text) > self.window_chars
+    
+    def _process_windows(self, text: str) -> ParsedDocument:
+        """
+        Run spaCy over a long text in bounded windows with nlp.pipe.
+        
+        Each window's Doc is reduced to its entities and noun chunks (moved
+        to global offsets) and dropped, so memory stays bounded by the window
+        batch. Windows past max_chars are skipped, and processing stops once
+        max_tokens tokens were seen or time_budget seconds passed.
+        """
+        deadline = time.perf_counter() + self.time_budget
+        nlp_text = text[:self.max_chars]
+        windows = list(text_windows(nlp_text, self.window_chars))
+        
+        entities = []
+        noun_chunks = []
+        tokens = 0
+        processed_chars = 0
+        reason = 'chars' if len(text) > self.max_chars else None
+        
+        with stage_timer('spacy'):
+            docs = nlp.pipe((window for _, window in windows), batch_size=self.window_batch_size)
+            for (offset, window), doc in zip(windows, docs):
+                entities.extend(
+                    TextSpan(ent.text, ent.label_, ent.start_char + offset, ent.end_char + offset)
+                    for ent in doc.ents
+                )
+                noun_chunks.extend(
+                    TextSpan(chunk.text, '', chunk.start_char + offset, chunk.end_char + offset)
+                    for chunk in doc.noun_chunks
+                )
+                tokens += len(doc)
+                processed_chars = offset + len(window)
+                del doc
+                
+                if processed_chars >= len(nlp_text):
+                    break
+                if tokens >= self.max_tokens:
+                    reason = 'tokens'
+                    break
+                if time.perf_counter() >= deadline:
+                    reason = 'time'
+                    break
+        
+        with stage_timer('segmentation'):
+            sections = self.segmenter.segment(text)
+        
+        degraded = None
+        if reason is not None:
+            NLP_DEGRADED.inc(reason=reason)
+            degraded = {
+                'reason': reason,
+                'processedChars': processed_chars,
+                'totalChars': len(text),
+                'tokens': tokens
+            }
+        return ParsedDocument(text, None, sections, entities, noun_chunks, degraded)
     
-    def parse(self, text: str) -> Dict[str, Any]:
+    def process_many(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        n_process: int = 1
+    ) -> Iterator[ParsedDocument]:
+        """
+        Run the spaCy pipeline over many resumes with nlp.pipe.
+        
+        Args:
+            texts: Raw resume texts
+            batch_size: Number of texts spaCy processes per batch
+            n_process: Number of processes spaCy itself may use
+            
+        Yields:
+            ParsedDocument for each text, in input order (long texts are
+            processed on their own, in windows)
+        """
+        docs = nlp.pipe(
+            (text for text in texts if not self.is_long(text)),
+            batch_size=batch_size,
+            n_process=n_process
+        )
+        for text in texts:
+            if self.is_long(text):
+                yield self._process_windows(text)
+                continue
+            doc = next(docs)
+            with stage_timer('segmentation'):
+                sections = self.segmenter.segment(text)
+            yield ParsedDocument(text, doc, sections)
+    
+    def parse(self, text: str, document: Optional[ParsedDocument] = None) -> Dict[str, Any]:
         """
         Parse resume text and extract structured information.
         
         Args:
             text: Raw resume text
+            document: Already processed document for this text (optional)
             
         Returns:
             Dictionary with structured resume data
         """
-        # Process with spaCy
-        doc = nlp(text)
+        if document is None:
+            document = self.process(text)
         
         # Extract basic information
-        result = {
-            'name': self._extract_name(doc, text),
-            'email': self._extract_email(text),
-            'phone': self._extract_phone(text),
-            'linkedin': self._extract_linkedin(text),
-            'github': self._extract_github(text),
-            'summary': self._extract_summary(text),
-            'education': self._extract_education(text),
-            'experience': self._extract_experience(text, doc),
-            'projects': self._extract_projects(text),
-            'certifications': self._extract_certifications(text)
-        }
+        result = {}
+        with stage_timer('extract_name'):
+            result['name'] = self._extract_name(document, text)
+        with stage_timer('extract_contact'):
+            result['email'] = self._extract_email(text)
+            result['phone'] = self._extract_phone(text)
+            result['linkedin'] = self._extract_linkedin(text)
+            result['github'] = self._extract_github(text)
+        with stage_timer('extract_summary'):
+            result['summary'] = self._extract_summary(text, document.sections)
+        with stage_timer('extract_education'):
+            result['education'] = self._extract_education(text, document.sections)
+        with stage_timer('extract_experience'):
+            result['experience'] = self._extract_experience(text, document)
+        with stage_timer('extract_projects'):
+            result['projects'] = self._extract_projects(text, document.sections)
+        with stage_timer('extract_certifications'):
+            result['certifications'] = self._extract_certifications(text, document.sections)
+        
+        if document.degraded is not None:
+            result['degraded'] = document.degraded
         
         return result
     
-    def _extract_name(self, doc, text: str) -> str:
+    def _extract_name(self, document: ParsedDocument, text: str) -> str:
         """Extract name from resume."""
         # Try to find PERSON entities
-        for ent in doc.ents:
+        for ent in document.entities():
             if ent.label_ == 'PERSON':
                 return ent.text
         
@@ -95,77 +325,47 @@ class ResumeParser:
     
     def _extract_email(self, text: str) -> str:
         """Extract email address."""
-        match = self.email_pattern.search(text)
-        return match.group(0) if match else ''
+        return find_email(text)
     
     def _extract_phone(self, text: str) -> str:
         """Extract phone number."""
-        match = self.phone_pattern.search(text)
-        return match.group(0) if match else ''
+        return find_phone(text)
     
     def _extract_linkedin(self, text: str) -> str:
         """Extract LinkedIn profile URL."""
-        match = self.linkedin_pattern.search(text.lower())
-        if match:
-            return f"https://{match.group(0)}"
+        profile = find_linkedin(text)
+        if profile:
+            return f"https://{profile}"
         return ''
     
     def _extract_github(self, text: str) -> str:
         """Extract GitHub profile URL."""
-        match = self.github_pattern.search(text.lower())
-        if match:
-            return f"https://{match.group(0)}"
+        profile = find_github(text)
+        if profile:
+            return f"https://{profile}"
         return ''
     
-    def _extract_summary(self, text: str) -> str:
+    def _extract_summary(self, text: str, sections: List[Section]) -> str:
         """Extract professional summary/objective."""
-        text_lower = text.lower()
-        
-        summary_keywords = ['summary', 'objective', 'profile', 'about me', 'career objective']
-        
-        for keyword in summary_keywords:
-            if keyword in text_lower:
-                start_idx = text_lower.find(keyword)
-                # Find the end of this section
-                end_idx = len(text)
-                for header in self.section_headers['education'] + self.section_headers['experience']:
-                    header_idx = text_lower.find(header, start_idx + len(keyword))
-                    if header_idx != -1 and header_idx < end_idx:
-                        end_idx = header_idx
-                
-                summary = text[start_idx:end_idx].strip()
-                # Clean up
-                lines = summary.split('\n')[1:3]  # Skip header, take first 2-3 lines
-                return ' '.join(lines).strip()
-        
-        return ''
+        span = first_section(sections, 'summary')
+        if span is None:
+            return ''
+        
+        summary = text[span[0]:span[1]].strip()
+        # Clean up
+        lines = summary.split('\n')[1:3]  # Skip header, take first 2-3 lines
+        return ' '.join(lines).strip()
     
-    def _extract_education(self, text: str) -> List[Dict]:
+    def _extract_education(self, text: str, sections: List[Section]) -> List[Dict]:
         """Extract education information."""
         education = []
-        text_lower = text.lower()
-        
-        # Find education section
-        edu_start = -1
-        for keyword in self.section_headers['education']:
-            idx = text_lower.find(keyword)
-            if idx != -1:
-                edu_start = idx
-                break
         
-        if edu_start == -1:
+        # Locate the education section
+        span = first_section(sections, 'education')
+        if span is None:
             return education
         
-        # Find section end
-        edu_end = len(text)
-        for section_type, keywords in self.section_headers.items():
-            if section_type == 'education':
-                continue
-            for keyword in keywords:
-                idx = text_lower.find(keyword, edu_start + 10)
-                if idx != -1 and idx < edu_end:
-                    edu_end = idx
-        
+        edu_start, edu_end = span
         edu_text = text[edu_start:edu_end]
         
         # Extract degree information
@@ -183,50 +383,32 @@ class ResumeParser:
                         
                         # Try to find grade/CGPA
                         for search_line in lines[i:i+3]:
-                            cgpa_match = re.search(r'(\d+\.?\d*)\s*(cgpa|gpa|%|percentage)', search_line.lower())
-                            if cgpa_match:
-                                entry['grade'] = cgpa_match.group(0)
+                            grade = find_grade(search_line.lower())
+                            if grade:
+                                entry['grade'] = grade
                         
                         education.append(entry)
                         break
         
         return education
     
-    def _extract_experience(self, text: str, doc) -> List[Dict]:
+    def _extract_experience(self, text: str, document: ParsedDocument) -> List[Dict]:
         """Extract work experience."""
         experience = []
-        text_lower = text.lower()
         
-        # Find experience section
-        exp_start = -1
-        for keyword in self.section_headers['experience']:
-            idx = text_lower.find(keyword)
-            if idx != -1:
-                exp_start = idx
-                break
-        
-        if exp_start == -1:
+        # Locate the experience section
+        span = first_section(document.sections, 'experience')
+        if span is None:
             return experience
         
-        # Find section end
-        exp_end = len(text)
-        for section_type, keywords in self.section_headers.items():
-            if section_type == 'experience':
-                continue
-            for keyword in keywords:
-                idx = text_lower.find(keyword, exp_start + 10)
-                if idx != -1 and idx < exp_end:
-                    exp_end = idx
-        
+        exp_start, exp_end = span
         exp_text = text[exp_start:exp_end]
         
-        # Extract organization names from NER
-        exp_doc = nlp(exp_text)
-        orgs = [ent.text for ent in exp_doc.ents if ent.label_ == 'ORG']
+        # Extract organization names from NER over the section span
+        orgs = [ent.text for ent in document.entities(exp_start, exp_end) if ent.label_ == 'ORG']
         
         # Extract date ranges
-        date_pattern = re.compile(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s*\d{2,4}\s*[-–to]+\s*(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|present|current)[a-z]*\s*\d{0,4}', re.IGNORECASE)
-        dates = date_pattern.findall(exp_text)
+        dates = find_date_ranges(exp_text)
         
         # Build experience entries
         lines = exp_text.split('\n')
@@ -259,32 +441,16 @@ class ResumeParser:
         
         return experience
     
-    def _extract_projects(self, text: str) -> List[Dict]:
+    def _extract_projects(self, text: str, sections: List[Section]) -> List[Dict]:
         """Extract project information."""
         projects = []
-        text_lower = text.lower()
         
-        # Find projects section
-        proj_start = -1
-        for keyword in self.section_headers['projects']:
-            idx = text_lower.find(keyword)
-            if idx != -1:
-                proj_start = idx
-                break
-        
-        if proj_start == -1:
+        # Locate the projects section
+        span = first_section(sections, 'projects')
+        if span is None:
             return projects
         
-        # Find section end
-        proj_end = len(text)
-        for section_type, keywords in self.section_headers.items():
-            if section_type == 'projects':
-                continue
-            for keyword in keywords:
-                idx = text_lower.find(keyword, proj_start + 10)
-                if idx != -1 and idx < proj_end:
-                    proj_end = idx
-        
+        proj_start, proj_end = span
         proj_text = text[proj_start:proj_end]
         lines = proj_text.split('\n')
         
@@ -316,32 +482,16 @@ class ResumeParser:
         
         return projects[:5]  # Limit to 5 projects
     
-    def _extract_certifications(self, text: str) -> List[Dict]:
+    def _extract_certifications(self, text: str, sections: List[Section]) -> List[Dict]:
         """Extract certifications."""
         certifications = []
-        text_lower = text.lower()
-        
-        # Find certifications section
-        cert_start = -1
-        for keyword in self.section_headers['certifications']:
-            idx = text_lower.find(keyword)
-            if idx != -1:
-                cert_start = idx
-                break
         
-        if cert_start == -1:
+        # Locate the certifications section
+        span = first_section(sections, 'certifications')
+        if span is None:
             return certifications
         
-        # Find section end
-        cert_end = len(text)
-        for section_type, keywords in self.section_headers.items():
-            if section_type == 'certifications':
-                continue
-            for keyword in keywords:
-                idx = text_lower.find(keyword, cert_start + 10)
-                if idx != -1 and idx < cert_end:
-                    cert_end = idx
-        
+        cert_start, cert_end = span
         cert_text = text[cert_start:cert_end]
         lines = cert_text.split('\n')
         
@@ -356,19 +506,20 @@ class ResumeParser:
         
         return certifications[:10]  # Limit to 10
     
-    def analyze_resume(self, text: str, skills: Dict) -> Dict:
+    def analyze_resume(self, text: str, skills: Dict, document: Optional[ParsedDocument] = None) -> Dict:
         """
         Analyze resume quality and generate scores.
         
         Args:
             text: Resume text
             skills: Extracted skills dictionary
+            document: Already processed document for this text (optional)
             
         Returns:
             Analysis results with scores and suggestions
         """
         # Calculate various scores
-        word_count = len(text.split())
+        word_count = count_words(text)
         
         # Skills score
         total_skills = sum(len(s) for s in skills.values() if isinstance(s, list))
@@ -402,7 +553,11 @@ class ResumeParser:
         )
         
         # Generate suggestions
-        suggestions = self.generate_suggestions(text, skills, '')
+        with stage_timer('suggestions'):
+            suggestions = self.generate_suggestions(text, skills, '')
+        
+        with stage_timer('keywords'):
+            keywords = self._extract_keywords(document or self.process(text))
         
         return {
             'overallScore': round(overall_score, 1),
@@ -411,23 +566,21 @@ class ResumeParser:
             'educationScore': round(education_score, 1),
             'presentationScore': round(content_score, 1),
             'suggestions': suggestions,
-            'keywords': self._extract_keywords(text),
+            'keywords': keywords,
             'summary': f"Resume has {word_count} words with {total_skills} identified skills.",
             'analyzedAt': None  # Will be set by caller
         }
     
-    def _extract_keywords(self, text: str) -> List[str]:
+    def _extract_keywords(self, document: ParsedDocument) -> List[str]:
         """Extract important keywords from resume."""
-        doc = nlp(text)
-        
         # Get noun phrases and named entities
         keywords = set()
         
-        for chunk in doc.noun_chunks:
+        for chunk in document.noun_chunks():
             if len(chunk.text) > 2:
                 keywords.add(chunk.text.lower())
         
-        for ent in doc.ents:
+        for ent in document.entities():
             if ent.label_ in ['ORG', 'PRODUCT', 'WORK_OF_ART']:
                 keywords.add(ent.text.lower())
         
@@ -460,11 +613,11 @@ class ResumeParser:
             suggestions.append("Use more action verbs (developed, implemented, achieved) to describe your accomplishments")
         
         # Check for quantifiable achievements
-        if not re.search(r'\d+%|\$\d+|\d+\s*(users|customers|projects)', text_lower):
+        if not has_quantified_impact(text_lower):
             suggestions.append("Add quantifiable achievements (e.g., 'increased efficiency by 25%')")
         
         # Check length
-        word_count = len(text.split())
+        word_count = count_words(text)
         if word_count < 200:
             suggestions.append("Your resume seems too brief. Add more details about your experience and skills")
         elif word_count > 1000:
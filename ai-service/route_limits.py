@@ -0,0 +1,97 @@
+"""
+Route Limits Module
+
+Per-route concurrency limits. Routes are assigned to named groups, each
+with a bounded number of requests in progress per process; a request that
+cannot get a slot within a short wait is rejected with 503 so CPU-bound
+NLP routes cannot occupy every worker thread and starve cheap routes such
+as /health and /match-skills.
+
+Also the number of web worker processes, which the service reads from one
+place: serve.py starts that many gunicorn workers, and the app and batch
+pools size themselves by it.
+"""
+
+import os
+import threading
+from typing import Dict, Optional
+
+
+def web_workers() -> int:
+    """
+    Gunicorn worker processes serving the app: WEB_WORKERS, or gunicorn's
+    own WEB_CONCURRENCY, or 1 (gunicorn's default). serve.py and
+    gunicorn.conf.py export WEB_WORKERS with the count actually started.
+    """
+    return max(1, int(os.getenv('WEB_WORKERS') or os.getenv('WEB_CONCURRENCY') or 1))
+
+
+class RouteLimiter:
+    """
+    Bounded concurrency per route group.
+
+    Groups and limits come from the constructor, with each limit
+    overridable by a ROUTE_LIMIT_<GROUP> environment variable (0 disables
+    the limit). Routes not assigned to a group are never limited.
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, int],
+        routes: Dict[str, str],
+        queue_timeout: Optional[float] = None
+    ):
+        """
+        Args:
+            limits: Group name -> maximum concurrent requests
+            routes: Route rule (e.g. '/parse-resume') -> group name
+            queue_timeout: Seconds to wait for a free slot before rejecting
+        """
+        self.queue_timeout = float(
+            queue_timeout if queue_timeout is not None else os.getenv('ROUTE_QUEUE_TIMEOUT', 0.5)
+        )
+        self.limits = {
+            group: int(os.getenv(f'ROUTE_LIMIT_{group.upper()}', limit))
+            for group, limit in limits.items()
+        }
+        self.routes = dict(routes)
+        self._semaphores = {
+            group: threading.BoundedSemaphore(limit)
+            for group, limit in self.limits.items() if limit > 0
+        }
+        self._lock = threading.Lock()
+        self._in_flight = {group: 0 for group in self._semaphores}
+        self._rejected = {group: 0 for group in self._semaphores}
+
+    def group_for(self, route: Optional[str]) -> Optional[str]:
+        """Limited group of a route rule, or None if the route is unlimited."""
+        group = self.routes.get(route)
+        return group if group in self._semaphores else None
+
+    def acquire(self, group: str) -> bool:
+        """Take a slot in group, waiting up to queue_timeout; False if none freed up."""
+        if not self._semaphores[group].acquire(timeout=self.queue_timeout):
+            with self._lock:
+                self._rejected[group] += 1
+            return False
+        with self._lock:
+            self._in_flight[group] += 1
+        return True
+
+    def release(self, group: str) -> None:
+        """Return a slot taken by acquire()."""
+        with self._lock:
+            self._in_flight[group] -= 1
+        self._semaphores[group].release()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Limit, requests in progress and rejections per group."""
+        with self._lock:
+            return {
+                group: {
+                    'limit': self.limits[group],
+                    'inFlight': self._in_flight[group],
+                    'rejected': self._rejected[group]
+                }
+                for group in self._semaphores
+            }
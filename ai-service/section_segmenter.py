@@ -0,0 +1,124 @@
+"""
+Section Segmenter Module
+
+Splits resume text into sections (education, experience, projects, ...)
+in a single pass over its lines.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Words that may accompany a section keyword in a header line
+# ("Work Experience", "Academic Projects", "Education & Qualifications")
+HEADER_QUALIFIERS = {
+    'and', '&', '/', 'of', 'my', 'key', 'relevant', 'professional', 'technical',
+    'academic', 'work', 'personal', 'core', 'other', 'additional', 'selected',
+    'major', 'notable', 'recent', 'details'
+}
+
+# Longest line (in words / characters) considered as a possible header
+MAX_HEADER_WORDS = 5
+MAX_HEADER_CHARS = 60
+
+_NON_HEADER_CHARS = re.compile(r'[^a-z&/ ]+')
+
+Section = Tuple[str, int, int]
+
+
+class SectionSegmenter:
+    """
+    Detect section header lines and return ordered (section, start, end) spans.
+
+    A line is a header when it (or the part before its first colon) is short
+    and made up only of a section keyword plus optional qualifier words, so
+    "Experience:", "WORK EXPERIENCE" or "Skills: python, sql" start a section
+    while a sentence that merely mentions "experience" does not.
+    Each span runs from the start of its header line to the start of the next
+    header line (or the end of the text).
+    """
+
+    def __init__(self, section_headers: Dict[str, List[str]]):
+        # First keyword word -> [(keyword words, section)], longest keyword first
+        self._keywords: Dict[str, List[Tuple[Tuple[str, ...], str]]] = {}
+        for section, keywords in section_headers.items():
+            for keyword in keywords:
+                words = tuple(keyword.lower().split())
+                self._keywords.setdefault(words[0], []).append((words, section))
+        for candidates in self._keywords.values():
+            candidates.sort(key=lambda candidate: -len(candidate[0]))
+
+    def segment(self, text: str) -> List[Section]:
+        """
+        Split text into sections.
+
+        Args:
+            text: Resume text
+
+        Returns:
+            Ordered list of (section, start, end) character spans
+        """
+        headers = []
+        offset = 0
+
+        for line in text.split('\n'):
+            section = self._header_section(line)
+            if section is not None:
+                headers.append((section, offset))
+            offset += len(line) + 1
+
+        sections = []
+        for i, (section, start) in enumerate(headers):
+            end = headers[i + 1][1] if i + 1 < len(headers) else len(text)
+            sections.append((section, start, end))
+
+        return sections
+
+    def _header_section(self, line: str) -> Optional[str]:
+        """Section named by a header line, or None if the line is not a header."""
+        # "Skills: python, sql" opens a section with its content inline
+        line = line.strip().split(':', 1)[0].strip()
+        if not line or len(line) > MAX_HEADER_CHARS:
+            return None
+
+        words = _NON_HEADER_CHARS.sub(' ', line.lower()).split()
+        if not words or len(words) > MAX_HEADER_WORDS:
+            return None
+
+        section = None
+        position = 0
+        while position < len(words):
+            match = self._match_keyword(words, position)
+            if match is not None:
+                length, section = match
+                position += length
+            elif words[position] in HEADER_QUALIFIERS:
+                position += 1
+            else:
+                return None
+
+        return section
+
+    def _match_keyword(self, words: List[str], position: int) -> Optional[Tuple[int, str]]:
+        """(length, section) of the longest keyword starting at words[position]."""
+        word = words[position]
+        candidates = self._keywords.get(word) or self._keywords.get(word[:-1] if word.endswith('s') else word)
+        if not candidates:
+            return None
+
+        for keyword, section in candidates:
+            window = words[position:position + len(keyword)]
+            if len(window) == len(keyword) and all(
+                actual == expected or actual == expected + 's'
+                for actual, expected in zip(window, keyword)
+            ):
+                return len(keyword), section
+
+        return None
+
+
+def first_section(sections: List[Section], name: str) -> Optional[Tuple[int, int]]:
+    """(start, end) of the first section with the given name, or None."""
+    for section, start, end in sections:
+        if section == name:
+            return start, end
+    return None
@@ -0,0 +1,100 @@
+"""
+Production Server Module
+
+Runs the Flask app under gunicorn with threaded workers:
+
+    python serve.py
+
+Starting gunicorn directly in this directory (gunicorn app:app) works too;
+gunicorn.conf.py then tells the app how many workers gunicorn runs.
+
+Configuration (environment):
+- HOST / PORT: bind address (default 0.0.0.0:5001)
+- WEB_WORKERS: worker processes (default 1, as route_limits.web_workers()
+  reads it). The student and resume indexes, /rank-resumes and
+  /eligibility/* keep per-process state, so they are disabled (503) with
+  more than one worker; raise it only for deployments that do not use
+  them. Each worker's /parse-resume/batch pool gets CPUs // WEB_WORKERS
+  processes (at least 1) unless BATCH_N_PROCESS is set, which is then per
+  worker
+- WEB_THREADS: request threads per worker (default 8)
+- WEB_MAX_REQUESTS / WEB_MAX_REQUESTS_JITTER: recycle a worker after this
+  many requests, staggered by a random jitter (default 2000 / 200)
+- WEB_TIMEOUT / WEB_GRACEFUL_TIMEOUT: seconds before a silent worker is
+  killed / in-flight requests get on shutdown or recycling (default 120 / 30)
+- WEB_PRELOAD: 1 = import the app and load the spaCy model once in the
+  master so workers share it copy-on-write (default 1; forces
+  SPACY_PRELOAD=1). 0 = each worker imports the app after the fork and
+  loads the model in the background from its first request
+
+Per-route concurrency limits and the request body limit are enforced by the
+app itself (ROUTE_LIMIT_*, MAX_CONTENT_LENGTH), so they also apply to the
+development server.
+"""
+
+import os
+from typing import Any, Dict
+
+from dotenv import load_dotenv
+from gunicorn.app.base import BaseApplication
+
+from route_limits import web_workers
+
+
+class ServiceApplication(BaseApplication):
+    """Gunicorn application serving app.app with programmatic options."""
+
+    def __init__(self, options: Dict[str, Any]):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            if key in self.cfg.settings and value is not None:
+                self.cfg.set(key, value)
+
+    def load(self):
+        from app import app
+        return app
+
+
+def gunicorn_options() -> Dict[str, Any]:
+    """Gunicorn settings from the environment."""
+    preload = os.getenv('WEB_PRELOAD', '1') == '1'
+
+    return {
+        'bind': f"{os.getenv('HOST', '0.0.0.0')}:{int(os.getenv('PORT', 5001))}",
+        'workers': web_workers(),
+        'worker_class': 'gthread',
+        'threads': int(os.getenv('WEB_THREADS', 8)),
+        'max_requests': int(os.getenv('WEB_MAX_REQUESTS', 2000)),
+        'max_requests_jitter': int(os.getenv('WEB_MAX_REQUESTS_JITTER', 200)),
+        'timeout': int(os.getenv('WEB_TIMEOUT', 120)),
+        'graceful_timeout': int(os.getenv('WEB_GRACEFUL_TIMEOUT', 30)),
+        'keepalive': int(os.getenv('WEB_KEEPALIVE', 5)),
+        'preload_app': preload,
+        'accesslog': os.getenv('WEB_ACCESS_LOG') or None,
+        'errorlog': '-',
+        'loglevel': os.getenv('LOG_LEVEL', 'info').lower()
+    }
+
+
+def main():
+    load_dotenv()
+    options = gunicorn_options()
+
+    # The app and its batch pools read the worker count back from this
+    os.environ['WEB_WORKERS'] = str(options['workers'])
+
+    # A preloaded app must load the model synchronously in the master before
+    # forking (overriding SPACY_PRELOAD=0 from .env): workers then share it
+    # copy-on-write, and no loader thread can be mid-load, holding the model
+    # lock, when a worker is forked
+    if options['preload_app']:
+        os.environ['SPACY_PRELOAD'] = '1'
+
+    ServiceApplication(options).run()
+
+
+if __name__ == '__main__':
+    main()
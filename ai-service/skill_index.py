@@ -0,0 +1,321 @@
+"""
+Skill Index Module
+
+Normalized skill vocabulary with integer IDs, alias expansion in both
+directions and cached per-skill match bitsets, so that matching a
+candidate against job requirements is a handful of integer set/bit
+operations instead of pairwise string comparisons.
+
+Approximate matches are found through trigram, word and version posting
+lists instead of scanning the vocabulary: a required skill only ever looks
+at the skills that share enough trigrams with it (typos), contain all of
+its words (compound skills) or differ from it by a version number
+('html' / 'html5'), and each of those is verified exactly.
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+# Characters that separate the words of a skill; '+' and '#' are kept
+# because they distinguish skills ('c', 'c++', 'c#')
+_SEPARATORS = re.compile(r'[^\w+#]+')
+_VERSION_SUFFIX = re.compile(r'\d+$')
+
+# Words of a required skill only match inside longer skills when the
+# skill is at least this long, so 'c' or 'js' never match 'objective-c'
+# or 'node.js'
+MIN_CONTAINED_LENGTH = 3
+
+TRIGRAM_PADDING = '  '
+
+
+def normalize_skill(skill: str) -> str:
+    """Canonical lookup form of a skill string."""
+    return skill.lower().strip()
+
+
+def skill_words(skill: str) -> List[str]:
+    """Words of a skill, ignoring punctuation: 'Node.js' -> ['node', 'js']."""
+    return [word for word in _SEPARATORS.split(skill.lower().replace('_', ' ')) if word]
+
+
+def skill_key(skill: str) -> str:
+    """
+    Punctuation- and spacing-insensitive form of a skill, so that
+    'node js', 'NodeJS' and 'node.js' are the same skill.
+    """
+    return ''.join(skill_words(skill))
+
+
+def split_version(key: str) -> Tuple[str, str]:
+    """Skill key and its trailing version number: 'css3' -> ('css', '3')."""
+    match = _VERSION_SUFFIX.search(key)
+    if match is None or match.start() == 0:
+        return key, ''
+    return key[:match.start()], match.group(0)
+
+
+def max_edits(length: int) -> int:
+    """
+    Typos tolerated between two skill keys, the shorter being length long.
+
+    Short keys get none: one edit turns 'react' into 'preact' or 'scala'
+    into 'scalar', which are different things rather than typos.
+    """
+    if length < 6:
+        return 0
+    if length < 10:
+        return 1
+    return 2
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance between a and b, or limit + 1 if it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+
+    return min(previous[-1], limit + 1)
+
+
+def trigrams(key: str) -> Set[str]:
+    """Distinct padded trigrams of a skill key."""
+    padded = TRIGRAM_PADDING + key + TRIGRAM_PADDING
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SkillIndex:
+    """
+    Interned skill vocabulary used by SkillMatcher.match_skills.
+
+    Every skill is mapped to an integer ID by its skill_key, so spelling
+    variants such as 'node.js' and 'nodejs' share one ID. The dictionary
+    vocabulary and alias table are interned up front; unseen skills coming
+    from candidates or job postings are interned on first use. Sets of
+    skills are represented as bitsets (Python ints) over those IDs.
+
+    A candidate skill satisfies a required skill when they have the same
+    key, when the candidate skill contains every word of the required one
+    ('machine learning' -> 'machine learning engineering'), when one is the
+    other plus a version number ('html' / 'html5'; two different versions
+    do not match), or when their keys are within max_edits() typos of each
+    other. Typos are only tolerated when at least one of the two skills is
+    outside the dictionary vocabulary and aliases: they correct a
+    misspelling towards a known skill, never one known skill into another
+    ('mysql' / 'mssql').
+
+    For each required skill the index lazily caches the bitset of all known
+    skills that satisfy it, extending the bitset only when skills newer than
+    the cached watermark show up. Candidates for a required skill come from
+    word and trigram posting lists (sorted by ID, so only IDs past the
+    watermark are visited) and are then verified one by one.
+
+    Interning, resetting and matching mutate the index, so they run under
+    `lock`. A caller mixing IDs from several calls (intern a skill, then
+    match with it) holds the lock across all of them; it is reentrant, so
+    the methods still take it inside. Otherwise a reset_if_full() from
+    another thread could invalidate the IDs in between.
+    """
+
+    def __init__(
+        self,
+        vocabulary: Iterable[str],
+        aliases: Dict[str, str],
+        max_skills: int = 50000
+    ):
+        self.max_skills = max_skills
+        self.lock = threading.RLock()
+
+        self._ids: Dict[str, int] = {}
+        self._keys: List[str] = []
+        self._skills: List[str] = []
+        self._tokens: List[FrozenSet[str]] = []
+        self._word_postings: Dict[str, List[int]] = {}
+        self._trigram_postings: Dict[str, List[int]] = {}
+        self._versions: List[Tuple[str, str]] = []
+        self._version_postings: Dict[str, List[int]] = {}
+        self._expansions: Dict[int, int] = {}
+        self._match_cache: Dict[int, Tuple[int, int]] = {}
+
+        for skill in vocabulary:
+            self.intern(skill)
+
+        # Alias map in both directions: an alias implies its full name and
+        # a full name implies every alias pointing at it
+        for alias, full in aliases.items():
+            alias_id = self.intern(alias)
+            full_id = self.intern(full)
+            self._expansions[alias_id] = self._expansions.get(alias_id, 1 << alias_id) | (1 << full_id)
+            self._expansions[full_id] = self._expansions.get(full_id, 1 << full_id) | (1 << alias_id)
+
+        self._static_size = len(self._skills)
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def intern(self, skill: str) -> int:
+        """Return the ID of a skill, assigning a new one if unseen."""
+        words = skill_words(skill)
+        key = ''.join(words)
+        with self.lock:
+            skill_id = self._ids.get(key)
+            if skill_id is None:
+                skill_id = len(self._skills)
+                self._ids[key] = skill_id
+                self._keys.append(key)
+                self._skills.append(normalize_skill(skill))
+                self._tokens.append(frozenset(words))
+                for word in self._tokens[skill_id]:
+                    self._word_postings.setdefault(word, []).append(skill_id)
+                for trigram in trigrams(key):
+                    self._trigram_postings.setdefault(trigram, []).append(skill_id)
+                self._versions.append(split_version(key))
+                self._version_postings.setdefault(self._versions[skill_id][0], []).append(skill_id)
+            return skill_id
+
+    def skill(self, skill_id: int) -> str:
+        """Normalized skill string for an ID (the first spelling seen)."""
+        return self._skills[skill_id]
+
+    def skills(self, mask: int) -> List[str]:
+        """Normalized skill strings for every ID set in a bitset."""
+        result = []
+        with self.lock:
+            while mask:
+                low_bit = mask & -mask
+                result.append(self._skills[low_bit.bit_length() - 1])
+                mask ^= low_bit
+        return result
+
+    def reset_if_full(self) -> None:
+        """
+        Forget skills interned after construction once max_skills is exceeded.
+
+        IDs handed out earlier become invalid: call it at the start of a
+        request, under the same hold of `lock` as the request's matching.
+        """
+        with self.lock:
+            if len(self._skills) <= self.max_skills:
+                return
+
+            for key in self._keys[self._static_size:]:
+                del self._ids[key]
+            del self._keys[self._static_size:]
+            del self._skills[self._static_size:]
+            del self._tokens[self._static_size:]
+            del self._versions[self._static_size:]
+            for postings in (self._word_postings, self._trigram_postings, self._version_postings):
+                for term in list(postings):
+                    ids = postings[term]
+                    del ids[bisect_left(ids, self._static_size):]
+                    if not ids:
+                        del postings[term]
+            self._match_cache.clear()
+
+    def candidate_mask(self, skills: Iterable[str]) -> int:
+        """Bitset of a candidate's skills, expanded through the alias map."""
+        mask = 0
+        with self.lock:
+            for skill in skills:
+                skill_id = self.intern(skill)
+                mask |= self._expansions.get(skill_id, 1 << skill_id)
+        return mask
+
+    def matches(self, required_id: int, candidate_mask: int) -> bool:
+        """Whether any skill in candidate_mask satisfies the required skill."""
+        with self.lock:
+            return bool(self._match_mask(required_id, candidate_mask.bit_length()) & candidate_mask)
+
+    def _match_mask(self, required_id: int, needed: int) -> int:
+        """Bitset of skills satisfying required_id, covering at least IDs < needed."""
+        mask, watermark = self._match_cache.get(required_id, (0, 0))
+        if watermark >= needed:
+            return mask
+
+        limit = len(self._skills)
+        for skill_id in self._candidates(required_id, watermark):
+            if self._pair_matches(required_id, skill_id):
+                mask |= 1 << skill_id
+
+        self._match_cache[required_id] = (mask, limit)
+        return mask
+
+    def _candidates(self, required_id: int, start: int) -> Set[int]:
+        """
+        IDs >= start that may satisfy required_id: a superset of the skills
+        _pair_matches accepts, drawn from the posting lists.
+        """
+        key = self._keys[required_id]
+        candidates = set()
+        if required_id >= start:
+            candidates.add(required_id)
+
+        # Skills containing every word: walk the shortest word posting list
+        words = self._tokens[required_id]
+        if words and len(key) >= MIN_CONTAINED_LENGTH:
+            shortest = min((self._word_postings[word] for word in words), key=len)
+            candidates.update(shortest[bisect_left(shortest, start):])
+
+        # Same skill with or without a version number
+        versions = self._version_postings[self._versions[required_id][0]]
+        candidates.update(versions[bisect_left(versions, start):])
+
+        # Typos: every edit changes at most 3 trigrams, so a key within
+        # `edits` edits still shares all but 3 * edits of ours. A vocabulary
+        # skill only takes typos from skills outside the vocabulary
+        edits = max_edits(len(key))
+        if edits:
+            if required_id < self._static_size:
+                start = max(start, self._static_size)
+            required_trigrams = trigrams(key)
+            shared = Counter()
+            for trigram in required_trigrams:
+                ids = self._trigram_postings[trigram]
+                shared.update(ids[bisect_left(ids, start):])
+            threshold = len(required_trigrams) - 3 * edits
+            candidates.update(skill_id for skill_id, count in shared.items() if count >= threshold)
+
+        return candidates
+
+    def _pair_matches(self, required_id: int, skill_id: int) -> bool:
+        """
+        Compare two skills: same key, the skill contains every word of the
+        required one, the same skill with and without a version number, or
+        (unless both are vocabulary skills) keys a few typos apart.
+        """
+        if required_id == skill_id:
+            return True
+
+        required = self._keys[required_id]
+        skill = self._keys[skill_id]
+
+        required_words = self._tokens[required_id]
+        if required_words and len(required) >= MIN_CONTAINED_LENGTH and required_words <= self._tokens[skill_id]:
+            return True
+
+        required_base, required_version = self._versions[required_id]
+        base, version = self._versions[skill_id]
+        if required_version and version and required_version != version:
+            return False
+        if required_base == base:
+            return True
+
+        if required_id < self._static_size and skill_id < self._static_size:
+            return False
+        edits = max_edits(min(len(required), len(skill)))
+        return edits > 0 and edit_distance(required, skill, edits) <= edits
@@ -4,169 +4,161 @@ Skill Matcher Module
 Extracts and matches skills from text against job requirements.
 """
 
-import re
-from typing import Dict, List, Set, Tuple
+import os
+import threading
+import time
+import traceback
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from keyword_automaton import KeywordAutomaton
+from metrics import registry as metrics_registry
+from skill_index import SkillIndex, normalize_skill
+from skill_taxonomy import DEFAULT_ARTIFACT_PATH, DEFAULT_SOURCE_PATH, SkillTaxonomy, artifact_stat, read_header
+
+TAXONOMY_RELOADS = metrics_registry.counter(
+    'skill_taxonomy_reloads_total',
+    'Skill taxonomy artifacts loaded after a version change, or that failed to load.',
+    ['result']
+)
 
 class SkillMatcher:
     """
     Extract skills from text and match against job requirements.
+    
+    The skill dictionaries come from the compiled taxonomy artifact
+    (skill_taxonomy.py), which is memory-mapped and swapped for a newer one
+    when its version changes.
     """
     
-    def __init__(self):
-        # Comprehensive skill database
-        self.technical_skills = {
-            # Programming Languages
-            'programming_languages': [
-                'python', 'javascript', 'java', 'c++', 'c#', 'c', 'ruby', 'go', 'golang',
-                'rust', 'swift', 'kotlin', 'typescript', 'php', 'scala', 'r', 'matlab',
-                'perl', 'haskell', 'lua', 'dart', 'objective-c', 'assembly', 'cobol',
-                'fortran', 'groovy', 'julia', 'elixir', 'clojure', 'erlang', 'f#'
-            ],
-            
-            # Web Development
-            'web_frontend': [
-                'html', 'html5', 'css', 'css3', 'sass', 'scss', 'less', 'tailwind',
-                'bootstrap', 'material-ui', 'mui', 'chakra-ui', 'ant design',
-                'react', 'reactjs', 'react.js', 'angular', 'angularjs', 'vue', 'vuejs',
-                'vue.js', 'svelte', 'next.js', 'nextjs', 'nuxt.js', 'nuxtjs',
-                'gatsby', 'remix', 'jquery', 'webpack', 'vite', 'rollup', 'parcel',
-                'babel', 'redux', 'mobx', 'recoil', 'zustand', 'context api'
-            ],
-            
-            # Web Backend
-            'web_backend': [
-                'node.js', 'nodejs', 'express', 'express.js', 'fastify', 'nest.js',
-                'nestjs', 'koa', 'hapi', 'django', 'flask', 'fastapi', 'tornado',
-                'spring', 'spring boot', 'springboot', 'hibernate', 'struts',
-                'asp.net', '.net', 'dotnet', '.net core', 'rails', 'ruby on rails',
-                'laravel', 'symfony', 'codeigniter', 'gin', 'echo', 'fiber',
-                'actix', 'rocket', 'phoenix', 'graphql', 'rest', 'restful', 'api',
-                'microservices', 'serverless', 'grpc', 'websocket', 'socket.io'
-            ],
-            
-            # Databases
-            'databases': [
-                'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'elasticsearch',
-                'sqlite', 'oracle', 'sql server', 'mssql', 'mariadb', 'cassandra',
-                'dynamodb', 'firebase', 'firestore', 'couchdb', 'neo4j', 'graphdb',
-                'influxdb', 'timescaledb', 'cockroachdb', 'supabase', 'prisma',
-                'sequelize', 'typeorm', 'mongoose', 'sql', 'nosql', 'plsql'
-            ],
-            
-            # Cloud & DevOps
-            'cloud_devops': [
-                'aws', 'amazon web services', 'azure', 'microsoft azure', 'gcp',
-                'google cloud', 'google cloud platform', 'heroku', 'digitalocean',
-                'linode', 'vultr', 'cloudflare', 'vercel', 'netlify', 'railway',
-                'docker', 'kubernetes', 'k8s', 'openshift', 'podman', 'containerd',
-                'jenkins', 'gitlab ci', 'github actions', 'circleci', 'travis ci',
-                'teamcity', 'bamboo', 'argo cd', 'terraform', 'ansible', 'puppet',
-                'chef', 'vagrant', 'packer', 'helm', 'prometheus', 'grafana',
-                'elk', 'elasticsearch', 'logstash', 'kibana', 'datadog', 'new relic',
-                'splunk', 'nagios', 'zabbix', 'cloudwatch', 'nginx', 'apache',
-                'load balancer', 'cdn', 'ci/cd', 'cicd', 'devops', 'sre', 'iaas',
-                'paas', 'saas', 'lambda', 'ec2', 's3', 'rds', 'eks', 'ecs'
-            ],
-            
-            # AI/ML/Data Science
-            'ai_ml_data': [
-                'machine learning', 'ml', 'deep learning', 'dl', 'artificial intelligence',
-                'ai', 'neural network', 'cnn', 'rnn', 'lstm', 'transformer', 'bert',
-                'gpt', 'llm', 'nlp', 'natural language processing', 'computer vision',
-                'opencv', 'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'sklearn',
-                'pandas', 'numpy', 'scipy', 'matplotlib', 'seaborn', 'plotly',
-                'jupyter', 'anaconda', 'data analysis', 'data science', 'data engineering',
-                'etl', 'data pipeline', 'spark', 'pyspark', 'hadoop', 'hive', 'pig',
-                'kafka', 'airflow', 'mlflow', 'kubeflow', 'dvc', 'weights & biases',
-                'hugging face', 'langchain', 'openai api', 'stable diffusion',
-                'regression', 'classification', 'clustering', 'reinforcement learning',
-                'feature engineering', 'model deployment', 'mlops', 'data visualization',
-                'tableau', 'power bi', 'looker', 'metabase', 'superset', 'dbt'
-            ],
-            
-            # Mobile Development
-            'mobile': [
-                'android', 'ios', 'react native', 'flutter', 'xamarin', 'ionic',
-                'cordova', 'phonegap', 'swift', 'swiftui', 'kotlin', 'java android',
-                'objective-c', 'cocoa', 'uikit', 'android studio', 'xcode',
-                'firebase', 'push notifications', 'mobile ui', 'mobile ux'
-            ],
-            
-            # Version Control & Collaboration
-            'version_control': [
-                'git', 'github', 'gitlab', 'bitbucket', 'svn', 'subversion',
-                'mercurial', 'perforce', 'azure devops', 'jira', 'confluence',
-                'trello', 'asana', 'notion', 'slack', 'teams'
-            ],
-            
-            # Testing
-            'testing': [
-                'jest', 'mocha', 'chai', 'jasmine', 'cypress', 'selenium',
-                'playwright', 'puppeteer', 'pytest', 'unittest', 'junit',
-                'testng', 'rspec', 'cucumber', 'postman', 'insomnia',
-                'unit testing', 'integration testing', 'e2e testing', 'tdd', 'bdd',
-                'qa', 'quality assurance', 'test automation', 'load testing',
-                'jmeter', 'gatling', 'locust', 'k6'
-            ],
-            
-            # Security
-            'security': [
-                'cybersecurity', 'security', 'penetration testing', 'ethical hacking',
-                'owasp', 'ssl', 'tls', 'https', 'oauth', 'oauth2', 'jwt',
-                'encryption', 'authentication', 'authorization', 'sso', 'ldap',
-                'active directory', 'firewall', 'vpn', 'ids', 'ips', 'siem',
-                'vulnerability assessment', 'security audit', 'compliance',
-                'gdpr', 'hipaa', 'pci-dss', 'sox', 'iso 27001'
-            ],
+    def __init__(
+        self,
+        taxonomy_path: Optional[str] = None,
+        source_path: Optional[str] = None,
+        check_interval: Optional[float] = None
+    ):
+        """
+        Args:
+            taxonomy_path: Compiled artifact (default TAXONOMY_PATH)
+            source_path: Taxonomy JSON compiled when the artifact is missing
+                or older (default TAXONOMY_SOURCE)
+            check_interval: Seconds between checks for a new artifact
+                version (default TAXONOMY_CHECK_INTERVAL; 0 disables reloading)
+        """
+        self.taxonomy_path = taxonomy_path or os.getenv('TAXONOMY_PATH', DEFAULT_ARTIFACT_PATH)
+        self.source_path = source_path or os.getenv('TAXONOMY_SOURCE', DEFAULT_SOURCE_PATH)
+        self.check_interval = float(
+            check_interval if check_interval is not None else os.getenv('TAXONOMY_CHECK_INTERVAL', 5)
+        )
+        self._reload_lock = threading.Lock()
+        self._next_check = time.monotonic() + self.check_interval
+        
+        self._use(SkillTaxonomy.ensure(self.source_path, self.taxonomy_path))
+        
+        # Optional SkillSimilarity for graded matching (set by the caller
+        # once a similarity matrix has been built and loaded)
+        self.skill_similarity = None
+    
+    def _use(self, taxonomy: SkillTaxonomy) -> None:
+        """Switch to a loaded taxonomy (one assignment, so readers see either)."""
+        # Interned vocabulary and alias tables used by match_skills
+        skill_index = SkillIndex(
+            list(taxonomy.all_technical_skills) + taxonomy.soft_skills,
+            taxonomy.skill_aliases
+        )
+        self._stat = taxonomy.stat
+        self._current = (taxonomy, skill_index)
+    
+    def reload_taxonomy(self, force: bool = False) -> bool:
+        """
+        Load the artifact at taxonomy_path if its version differs from the
+        one in use. Called on use at most every check_interval seconds;
+        a failed load keeps the current taxonomy.
+        
+        Args:
+            force: Check now even if the file looks unchanged
             
-            # Other Tools & Technologies
-            'other_tech': [
-                'linux', 'unix', 'windows server', 'bash', 'shell scripting',
-                'powershell', 'vim', 'emacs', 'vscode', 'intellij', 'eclipse',
-                'postman', 'swagger', 'openapi', 'soap', 'xml', 'json', 'yaml',
-                'markdown', 'latex', 'regex', 'cron', 'rabbitmq', 'celery',
-                'redis queue', 'message queue', 'event driven', 'blockchain',
-                'solidity', 'web3', 'ethereum', 'smart contracts', 'nft',
-                'iot', 'embedded systems', 'arduino', 'raspberry pi',
-                'agile', 'scrum', 'kanban', 'waterfall', 'sdlc'
-            ]
-        }
+        Returns:
+            True if a new taxonomy was loaded
+        """
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+        try:
+            self._next_check = time.monotonic() + self.check_interval
+            stat = artifact_stat(self.taxonomy_path)
+            if stat is None or (stat == self._stat and not force):
+                return False
+            self._stat = stat
+            if read_header(self.taxonomy_path)['version'] == self.taxonomy.version:
+                return False
+            self._use(SkillTaxonomy.load(self.taxonomy_path))
+            TAXONOMY_RELOADS.inc(result='loaded')
+            return True
+        except (OSError, ValueError, KeyError):
+            traceback.print_exc()
+            TAXONOMY_RELOADS.inc(result='failed')
+            return False
+        finally:
+            self._reload_lock.release()
+    
+    def _check_taxonomy(self) -> None:
+        if self.check_interval > 0 and time.monotonic() >= self._next_check:
+            self.reload_taxonomy()
+    
+    @property
+    def taxonomy(self) -> SkillTaxonomy:
+        return self._current[0]
+    
+    @property
+    def skill_index(self) -> SkillIndex:
+        return self._current[1]
+    
+    @property
+    def technical_skills(self) -> Dict[str, List[str]]:
+        return self.taxonomy.technical_skills
+    
+    @property
+    def all_technical_skills(self) -> Set[str]:
+        return self.taxonomy.all_technical_skills
+    
+    @property
+    def soft_skills(self) -> List[str]:
+        return self.taxonomy.soft_skills
+    
+    @property
+    def skill_aliases(self) -> Dict[str, str]:
+        return self.taxonomy.skill_aliases
+    
+    @property
+    def tool_keywords(self) -> List[str]:
+        return self.taxonomy.tool_keywords
+    
+    @property
+    def domain_keywords(self) -> Dict[str, List[str]]:
+        return self.taxonomy.domain_keywords
+    
+    @property
+    def keyword_automaton(self) -> KeywordAutomaton:
+        return self.taxonomy.automaton
+    
+    @property
+    def dictionary_version(self) -> str:
+        """Fingerprint of the extraction dictionaries, used to version cached results."""
+        return self.taxonomy.fingerprint
+    
+    def _scan(self, text_lower: str) -> Dict[str, List[Tuple]]:
+        """
+        Run the keyword automaton once over lowercased text.
         
-        # Soft skills
-        self.soft_skills = [
-            'communication', 'leadership', 'teamwork', 'problem solving',
-            'critical thinking', 'time management', 'adaptability', 'creativity',
-            'attention to detail', 'analytical', 'interpersonal', 'presentation',
-            'negotiation', 'conflict resolution', 'decision making', 'mentoring',
-            'collaboration', 'flexibility', 'initiative', 'work ethic',
-            'emotional intelligence', 'patience', 'empathy', 'active listening',
-            'public speaking', 'writing', 'research', 'project management',
-            'organizational', 'multitasking', 'self-motivated', 'team player'
-        ]
+        Returns:
+            Matched keyword payloads grouped by kind, in dictionary order
+        """
+        hits = {'technical': set(), 'soft': set(), 'tools': set(), 'domains': set()}
+        for _, _, payload in self.keyword_automaton.find_all(text_lower):
+            hits[payload[0]].add(payload)
         
-        # Build flattened skill set for quick lookup
-        self.all_technical_skills = set()
-        for category_skills in self.technical_skills.values():
-            for skill in category_skills:
-                self.all_technical_skills.add(skill.lower())
-        
-        # Common skill aliases
-        self.skill_aliases = {
-            'js': 'javascript',
-            'ts': 'typescript',
-            'py': 'python',
-            'node': 'node.js',
-            'react': 'reactjs',
-            'vue': 'vuejs',
-            'angular': 'angularjs',
-            'postgres': 'postgresql',
-            'mongo': 'mongodb',
-            'k8s': 'kubernetes',
-            'tf': 'tensorflow',
-            'sklearn': 'scikit-learn',
-            'aws': 'amazon web services',
-            'gcp': 'google cloud platform'
-        }
+        return {kind: sorted(payloads, key=lambda p: p[1]) for kind, payloads in hits.items()}
     
     def extract_skills(self, text: str) -> Dict[str, List[Dict]]:
         """
@@ -178,52 +170,36 @@ class SkillMatcher:
         Returns:
             Dictionary with categorized skills
         """
+        self._check_taxonomy()
         text_lower = text.lower()
+        hits = self._scan(text_lower)
         
-        # Find technical skills
+        # Technical skills (first category wins for skills listed twice)
         technical = []
         found_skills = set()
         
-        for category, skills in self.technical_skills.items():
-            for skill in skills:
-                skill_lower = skill.lower()
-                
-                # Check if skill is in text (with word boundaries for short skills)
-                if len(skill_lower) <= 3:
-                    # Use word boundary for short skills
-                    pattern = r'\b' + re.escape(skill_lower) + r'\b'
-                    if re.search(pattern, text_lower):
-                        if skill_lower not in found_skills:
-                            found_skills.add(skill_lower)
-                            technical.append({
-                                'skill': skill,
-                                'confidence': 0.9,
-                                'category': category.replace('_', ' ').title()
-                            })
-                else:
-                    if skill_lower in text_lower:
-                        if skill_lower not in found_skills:
-                            found_skills.add(skill_lower)
-                            technical.append({
-                                'skill': skill,
-                                'confidence': 0.85,
-                                'category': category.replace('_', ' ').title()
-                            })
-        
-        # Find soft skills
-        soft = []
-        for skill in self.soft_skills:
-            if skill.lower() in text_lower:
-                soft.append({
-                    'skill': skill.title(),
-                    'confidence': 0.75
-                })
-        
-        # Extract tools (look for specific patterns)
-        tools = self._extract_tools(text_lower)
+        for _, _, skill, category in hits['technical']:
+            skill_lower = skill.lower()
+            if skill_lower in found_skills:
+                continue
+            found_skills.add(skill_lower)
+            technical.append({
+                'skill': skill,
+                'confidence': 0.9 if len(skill_lower) <= 3 else 0.85,
+                'category': category.replace('_', ' ').title()
+            })
+        
+        # Soft skills
+        soft = [
+            {'skill': skill.title(), 'confidence': 0.75}
+            for _, _, skill, _ in hits['soft']
+        ]
+        
+        # Extract tools
+        tools = self._extract_tools(text_lower, hits)
         
         # Extract domains/industries
-        domains = self._extract_domains(text_lower)
+        domains = self._extract_domains(text_lower, hits)
         
         return {
             'technical': technical,
@@ -232,49 +208,28 @@ class SkillMatcher:
             'domains': domains
         }
     
-    def _extract_tools(self, text: str) -> List[Dict]:
+    def _extract_tools(self, text: str, hits: Optional[Dict[str, List[Tuple]]] = None) -> List[Dict]:
         """Extract development tools."""
-        tools = []
-        tool_keywords = [
-            'vs code', 'visual studio', 'pycharm', 'webstorm', 'android studio',
-            'xcode', 'eclipse', 'intellij', 'sublime', 'atom', 'notepad++',
-            'figma', 'sketch', 'adobe xd', 'photoshop', 'illustrator',
-            'jira', 'confluence', 'slack', 'teams', 'zoom', 'notion',
-            'postman', 'insomnia', 'charles', 'fiddler', 'wireshark'
-        ]
-        
-        for tool in tool_keywords:
-            if tool in text:
-                tools.append({
-                    'skill': tool.title(),
-                    'confidence': 0.8
-                })
+        if hits is None:
+            hits = self._scan(text)
         
-        return tools
+        return [
+            {'skill': tool.title(), 'confidence': 0.8}
+            for _, _, tool, _ in hits['tools']
+        ]
     
-    def _extract_domains(self, text: str) -> List[Dict]:
+    def _extract_domains(self, text: str, hits: Optional[Dict[str, List[Tuple]]] = None) -> List[Dict]:
         """Extract domain expertise."""
-        domains = []
-        domain_keywords = {
-            'fintech': ['fintech', 'banking', 'payment', 'financial', 'trading'],
-            'healthcare': ['healthcare', 'medical', 'health', 'clinical', 'hospital'],
-            'ecommerce': ['e-commerce', 'ecommerce', 'retail', 'shopping', 'marketplace'],
-            'edtech': ['edtech', 'education', 'learning', 'lms', 'e-learning'],
-            'gaming': ['gaming', 'game development', 'unity', 'unreal'],
-            'iot': ['iot', 'internet of things', 'embedded', 'sensors'],
-            'blockchain': ['blockchain', 'crypto', 'web3', 'defi', 'nft'],
-            'ai': ['artificial intelligence', 'machine learning', 'deep learning'],
-            'saas': ['saas', 'software as a service', 'b2b', 'enterprise']
-        }
-        
-        for domain, keywords in domain_keywords.items():
-            if any(kw in text for kw in keywords):
-                domains.append({
-                    'skill': domain.upper() if domain in ['iot', 'ai', 'saas'] else domain.title(),
-                    'confidence': 0.7
-                })
-        
-        return domains
+        if hits is None:
+            hits = self._scan(text)
+        
+        return [
+            {
+                'skill': domain.upper() if domain in ['iot', 'ai', 'saas'] else domain.title(),
+                'confidence': 0.7
+            }
+            for _, _, domain, _ in hits['domains']
+        ]
     
     def match_skills(self, candidate_skills: List[str], required_skills: Dict) -> Dict:
         """
@@ -287,42 +242,47 @@ class SkillMatcher:
         Returns:
             Match analysis with percentages and details
         """
-        # Normalize candidate skills
-        candidate_set = set(s.lower().strip() for s in candidate_skills)
-        
-        # Add aliases
-        expanded_candidate = set(candidate_set)
-        for skill in candidate_set:
-            if skill in self.skill_aliases:
-                expanded_candidate.add(self.skill_aliases[skill])
-            # Check reverse aliases
-            for alias, full in self.skill_aliases.items():
-                if skill == full:
-                    expanded_candidate.add(alias)
+        self._check_taxonomy()
+        index = self.skill_index
         
         # Get required skills
-        mandatory = [s.lower().strip() for s in required_skills.get('mandatory', [])]
-        preferred = [s.lower().strip() for s in required_skills.get('preferred', [])]
+        mandatory = [normalize_skill(s) for s in required_skills.get('mandatory', [])]
+        preferred = [normalize_skill(s) for s in required_skills.get('preferred', [])]
         
-        # Match mandatory skills
         mandatory_matched = []
         mandatory_missing = []
-        
-        for skill in mandatory:
-            if self._skill_matches(skill, expanded_candidate):
-                mandatory_matched.append(skill)
-            else:
-                mandatory_missing.append(skill)
-        
-        # Match preferred skills
         preferred_matched = []
         preferred_missing = []
         
-        for skill in preferred:
-            if self._skill_matches(skill, expanded_candidate):
-                preferred_matched.append(skill)
-            else:
-                preferred_missing.append(skill)
+        # Skill IDs are only valid until the next reset_if_full(), which
+        # another request thread may run: hold the index lock until the
+        # last ID is used
+        with index.lock:
+            index.reset_if_full()
+            
+            # Candidate skills as a bitset of skill IDs, expanded through aliases
+            candidate_mask = index.candidate_mask(candidate_skills)
+            required_mask = 0
+            
+            # Match mandatory skills
+            for skill in mandatory:
+                skill_id = index.intern(skill)
+                required_mask |= 1 << skill_id
+                if index.matches(skill_id, candidate_mask):
+                    mandatory_matched.append(skill)
+                else:
+                    mandatory_missing.append(skill)
+            
+            # Match preferred skills
+            for skill in preferred:
+                skill_id = index.intern(skill)
+                required_mask |= 1 << skill_id
+                if index.matches(skill_id, candidate_mask):
+                    preferred_matched.append(skill)
+                else:
+                    preferred_missing.append(skill)
+            
+            extra_skills = index.skills(candidate_mask & ~required_mask)[:10]
         
         # Calculate percentages
         mandatory_percentage = (len(mandatory_matched) / max(len(mandatory), 1)) * 100
@@ -331,7 +291,7 @@ class SkillMatcher:
         # Overall match (weighted: mandatory 70%, preferred 30%)
         overall_percentage = (mandatory_percentage * 0.7 + preferred_percentage * 0.3)
         
-        return {
+        result = {
             'matchPercentage': round(overall_percentage, 2),
             'mandatory': {
                 'matched': mandatory_matched,
@@ -345,43 +305,106 @@ class SkillMatcher:
             },
             'totalRequired': len(mandatory) + len(preferred),
             'totalMatched': len(mandatory_matched) + len(preferred_matched),
-            'candidateExtraSkills': list(expanded_candidate - set(mandatory) - set(preferred))[:10]
+            'candidateExtraSkills': extra_skills
         }
+        
+        if self.skill_similarity is not None:
+            result['graded'] = self._graded_match(
+                candidate_skills, mandatory, preferred, set(mandatory_matched) | set(preferred_matched)
+            )
+        
+        return result
     
-    def _skill_matches(self, required_skill: str, candidate_skills: Set[str]) -> bool:
-        """Check if a required skill matches any candidate skill."""
-        required_skill = required_skill.lower().strip()
+    def _graded_match(
+        self,
+        candidate_skills: List[str],
+        mandatory: List[str],
+        preferred: List[str],
+        matched: Set[str]
+    ) -> Dict:
+        """
+        Similarity-graded version of the match: matched skills count 1, missing
+        ones count their best similarity to any candidate skill.
+        """
+        grades = self.skill_similarity.grade(candidate_skills, mandatory + preferred).tolist()
+        scores = [
+            1.0 if skill in matched else grade
+            for skill, grade in zip(mandatory + preferred, grades)
+        ]
+        mandatory_scores = scores[:len(mandatory)]
+        preferred_scores = scores[len(mandatory):]
         
-        # Direct match
-        if required_skill in candidate_skills:
-            return True
+        mandatory_percentage = sum(mandatory_scores) / max(len(mandatory), 1) * 100
+        preferred_percentage = sum(preferred_scores) / max(len(preferred), 1) * 100
         
-        # Partial match (for compound skills)
-        for skill in candidate_skills:
-            # Check if one contains the other
-            if required_skill in skill or skill in required_skill:
-                return True
-            
-            # Check word overlap for multi-word skills
-            req_words = set(required_skill.split())
-            skill_words = set(skill.split())
-            if len(req_words & skill_words) >= min(len(req_words), len(skill_words)) * 0.5:
-                return True
+        return {
+            'matchPercentage': round(mandatory_percentage * 0.7 + preferred_percentage * 0.3, 2),
+            'mandatory': {skill: round(score, 3) for skill, score in zip(mandatory, mandatory_scores)},
+            'preferred': {skill: round(score, 3) for skill, score in zip(preferred, preferred_scores)}
+        }
+    
+    def match_cohort(self, cohort: List[List[str]], required_skills: Dict) -> List[Dict]:
+        """
+        Match many candidates against one set of job requirements.
+        
+        Binary matches go through the skill index as in match_skills; graded
+        scores for the whole cohort come from one SkillSimilarity pass.
         
-        return False
+        Args:
+            cohort: Skill list per candidate
+            required_skills: Dictionary with 'mandatory' and 'preferred' skill lists
+            
+        Returns:
+            Per candidate (in order): matchPercentage, gradedMatchPercentage
+            and matched count
+        """
+        self._check_taxonomy()
+        index = self.skill_index
+        
+        mandatory = [normalize_skill(s) for s in required_skills.get('mandatory', [])]
+        preferred = [normalize_skill(s) for s in required_skills.get('preferred', [])]
+        required = mandatory + preferred
+        
+        hits = np.zeros((len(cohort), len(required)), dtype=np.float32)
+        with index.lock:
+            index.reset_if_full()
+            required_ids = [index.intern(skill) for skill in required]
+            for row, skills in enumerate(cohort):
+                candidate_mask = index.candidate_mask(skills)
+                hits[row] = [index.matches(skill_id, candidate_mask) for skill_id in required_ids]
+        
+        grades = hits
+        if self.skill_similarity is not None:
+            grades = np.maximum(hits, self.skill_similarity.grade_cohort(cohort, required))
+        
+        # Weighted: mandatory 70%, preferred 30%
+        weights = np.zeros(len(required), dtype=np.float64)
+        weights[:len(mandatory)] = 70.0 / max(len(mandatory), 1)
+        weights[len(mandatory):] = 30.0 / max(len(preferred), 1)
+        match_percentages = hits @ weights
+        graded_percentages = grades @ weights
+        
+        return [
+            {
+                'matchPercentage': round(float(match_percentage), 2),
+                'gradedMatchPercentage': round(float(graded_percentage), 2),
+                'totalMatched': int(matched)
+            }
+            for match_percentage, graded_percentage, matched in zip(
+                match_percentages.tolist(), graded_percentages.tolist(), hits.sum(axis=1).tolist()
+            )
+        ]
+    
+    def _skill_matches(self, required_skill: str, candidate_skills: Set[str]) -> bool:
+        """Check if a required skill matches any candidate skill."""
+        index = self.skill_index
+        with index.lock:
+            return index.matches(index.intern(required_skill), index.candidate_mask(candidate_skills))
     
     def get_skill_category(self, skill: str) -> str:
         """Get the category of a skill."""
-        skill_lower = skill.lower()
-        
-        for category, skills in self.technical_skills.items():
-            if skill_lower in [s.lower() for s in skills]:
-                return category.replace('_', ' ').title()
-        
-        if skill_lower in [s.lower() for s in self.soft_skills]:
-            return 'Soft Skills'
-        
-        return 'Other'
+        self._check_taxonomy()
+        return self.taxonomy.categories.get(skill.lower(), 'Other')
     
     def suggest_skills(self, current_skills: List[str], target_role: str = '') -> List[str]:
         """
@@ -394,21 +417,13 @@ class SkillMatcher:
         Returns:
             List of suggested skills to learn
         """
+        self._check_taxonomy()
+        taxonomy = self.taxonomy
         current_set = set(s.lower() for s in current_skills)
         suggestions = []
         
         # Suggest based on current skills (related technologies)
-        skill_relationships = {
-            'react': ['redux', 'next.js', 'typescript', 'jest'],
-            'vue': ['vuex', 'nuxt.js', 'typescript', 'jest'],
-            'angular': ['rxjs', 'typescript', 'jasmine', 'ngrx'],
-            'python': ['django', 'flask', 'fastapi', 'pytest'],
-            'node.js': ['express', 'nest.js', 'typescript', 'jest'],
-            'java': ['spring boot', 'hibernate', 'junit', 'maven'],
-            'machine learning': ['tensorflow', 'pytorch', 'scikit-learn', 'pandas'],
-            'docker': ['kubernetes', 'ci/cd', 'terraform', 'aws'],
-            'aws': ['docker', 'terraform', 'kubernetes', 'lambda']
-        }
+        skill_relationships = taxonomy.skill_relationships
         
         for skill in current_set:
             if skill in skill_relationships:
@@ -417,17 +432,8 @@ class SkillMatcher:
                         suggestions.append(related)
         
         # Suggest based on role
-        role_skills = {
-            'frontend': ['react', 'typescript', 'css', 'testing', 'webpack'],
-            'backend': ['node.js', 'python', 'sql', 'docker', 'api design'],
-            'fullstack': ['react', 'node.js', 'sql', 'docker', 'aws'],
-            'devops': ['docker', 'kubernetes', 'terraform', 'ci/cd', 'aws'],
-            'data scientist': ['python', 'machine learning', 'sql', 'tensorflow', 'pandas'],
-            'mobile': ['react native', 'flutter', 'firebase', 'ios', 'android']
-        }
-        
         target_lower = target_role.lower()
-        for role, skills in role_skills.items():
+        for role, skills in taxonomy.role_skills.items():
             if role in target_lower:
                 for skill in skills:
                     if skill.lower() not in current_set and skill not in suggestions:
@@ -0,0 +1,309 @@
+"""
+Skill Similarity Module
+
+Graded skill matching from a precomputed skill-by-skill similarity matrix
+over the canonical technical vocabulary, so that 'pytorch' partially
+satisfies a 'tensorflow' requirement instead of scoring zero.
+
+The matrix is built offline from skill co-occurrence in parsed resumes:
+positive pointwise mutual information (PPMI) vectors per skill, compared
+by cosine similarity, so two skills are similar when they appear alongside
+the same other skills. It is stored as a float32 .npy file with its
+vocabulary in a JSON file next to it, and memory-mapped at load time so
+every worker shares one copy through the page cache.
+
+Build it with:
+    python skill_similarity.py build --input parsed.ndjson --output models/skill_similarity.npy
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from skill_index import skill_key
+
+# Documents folded into the co-occurrence counts per matrix product
+BUILD_CHUNK_SIZE = 4096
+
+
+def vocabulary_path(path: str) -> str:
+    """JSON vocabulary file stored next to a similarity matrix."""
+    return os.path.splitext(path)[0] + '.json'
+
+
+class SkillSimilarity:
+    """
+    Read-only similarity matrix between vocabulary skills.
+
+    Scores are in [0, 1] with 1 on the diagonal. Skills are looked up by
+    skill_key, and aliases resolve to the row of their full name. Skills
+    outside the vocabulary have no row and grade 0 against everything.
+    """
+
+    def __init__(
+        self,
+        vocabulary: List[str],
+        matrix: np.ndarray,
+        aliases: Optional[Dict[str, str]] = None
+    ):
+        """
+        Args:
+            vocabulary: Skill for each row/column of matrix
+            matrix: (n x n) float32 similarity matrix, possibly memory-mapped
+            aliases: Alias -> full skill name (e.g. SkillMatcher.skill_aliases)
+        """
+        if matrix.shape != (len(vocabulary), len(vocabulary)):
+            raise ValueError(f'Similarity matrix shape {matrix.shape} does not match {len(vocabulary)} skills')
+
+        self.vocabulary = list(vocabulary)
+        self.matrix = matrix
+        self._rows: Dict[str, int] = {}
+        for row, skill in enumerate(self.vocabulary):
+            self._rows.setdefault(skill_key(skill), row)
+        for alias, full in (aliases or {}).items():
+            row = self._rows.get(skill_key(full))
+            if row is not None:
+                self._rows.setdefault(skill_key(alias), row)
+
+    def __len__(self) -> int:
+        return len(self.vocabulary)
+
+    @classmethod
+    def load(cls, path: str, aliases: Optional[Dict[str, str]] = None, mmap: bool = True) -> 'SkillSimilarity':
+        """Load a matrix written by save(), memory-mapped unless mmap is False."""
+        with open(vocabulary_path(path), 'r', encoding='utf-8') as f:
+            vocabulary = json.load(f)['vocabulary']
+        matrix = np.load(path, mmap_mode='r' if mmap else None)
+        return cls(vocabulary, matrix, aliases)
+
+    def save(self, path: str) -> None:
+        """Write the matrix (.npy) and its vocabulary (.json next to it)."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.save(path, np.ascontiguousarray(self.matrix, dtype=np.float32))
+        with open(vocabulary_path(path), 'w', encoding='utf-8') as f:
+            json.dump({'vocabulary': self.vocabulary}, f)
+
+    @classmethod
+    def build(
+        cls,
+        documents: Iterable[Iterable[str]],
+        vocabulary: List[str],
+        aliases: Optional[Dict[str, str]] = None,
+        min_count: int = 5,
+        min_similarity: float = 0.2
+    ) -> 'SkillSimilarity':
+        """
+        Build the matrix from the skill lists of many resumes.
+
+        Args:
+            documents: Skill names per resume
+            vocabulary: Canonical skills (rows of the matrix)
+            aliases: Alias -> full skill name
+            min_count: Skills in fewer resumes than this only match themselves
+            min_similarity: Similarities below this are stored as 0
+
+        Returns:
+            SkillSimilarity over vocabulary
+        """
+        result = cls(vocabulary, np.eye(len(vocabulary), dtype=np.float32), aliases)
+        size = len(vocabulary)
+
+        # Co-occurrence counts: C = X^T X over (documents x skills) incidence
+        # matrices, one chunk of documents at a time
+        cooccurrence = np.zeros((size, size), dtype=np.float64)
+        document_count = 0
+        chunk = []
+        lookup: Dict[str, Optional[int]] = {}
+        for skills in documents:
+            rows = result.rows(skills, lookup)
+            if len(rows):
+                chunk.append(rows)
+            if len(chunk) == BUILD_CHUNK_SIZE:
+                cooccurrence += _cooccurrence(chunk, size)
+                document_count += len(chunk)
+                chunk = []
+        if chunk:
+            cooccurrence += _cooccurrence(chunk, size)
+            document_count += len(chunk)
+
+        counts = np.diag(cooccurrence).copy()
+        frequent = counts >= max(min_count, 1)
+        if document_count == 0 or not frequent.any():
+            return result
+
+        # PPMI context vectors (self co-occurrence is not context)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pmi = np.log(cooccurrence * document_count / np.outer(counts, counts))
+        ppmi = np.where(np.isfinite(pmi) & (pmi > 0), pmi, 0.0)
+        np.fill_diagonal(ppmi, 0.0)
+        ppmi[~frequent] = 0.0
+        ppmi[:, ~frequent] = 0.0
+
+        norms = np.linalg.norm(ppmi, axis=1)
+        norms[norms == 0] = 1.0
+        unit = ppmi / norms[:, None]
+        similarity = np.clip(unit @ unit.T, 0.0, 1.0)
+        similarity[similarity < min_similarity] = 0.0
+        np.fill_diagonal(similarity, 1.0)
+
+        result.matrix = similarity.astype(np.float32)
+        return result
+
+    def row(self, skill: str) -> Optional[int]:
+        """Row of a skill (or of the skill an alias points at), None if unknown."""
+        return self._rows.get(skill_key(skill))
+
+    def rows(self, skills: Iterable[str], lookup: Optional[Dict[str, Optional[int]]] = None) -> np.ndarray:
+        """
+        Distinct known rows of skills, as an int array.
+
+        Args:
+            skills: Skill names
+            lookup: Optional memo of skill name -> row shared across calls
+        """
+        if lookup is None:
+            lookup = {}
+        rows = set()
+        for skill in skills:
+            if skill not in lookup:
+                lookup[skill] = self._rows.get(skill_key(skill))
+            rows.add(lookup[skill])
+        rows.discard(None)
+        return np.fromiter(sorted(rows), dtype=np.int64, count=len(rows))
+
+    def grade(self, candidate_skills: Iterable[str], required_skills: List[str]) -> np.ndarray:
+        """
+        Best similarity of any candidate skill to each required skill.
+
+        Returns:
+            float32 array aligned with required_skills (0 for unknown skills)
+        """
+        return self.grade_cohort([candidate_skills], required_skills)[0]
+
+    def grade_cohort(self, cohort: List[Iterable[str]], required_skills: List[str]) -> np.ndarray:
+        """
+        grade() for many candidates at once.
+
+        Every candidate's skill rows are gathered in one pass over the
+        required columns and max-reduced per candidate segment (a max, not
+        a matrix product, so one strong neighbour is not outweighed by
+        many weak ones).
+
+        Returns:
+            (candidates x required skills) float32 array
+        """
+        grades = np.zeros((len(cohort), len(required_skills)), dtype=np.float32)
+        required_rows = [self.row(skill) for skill in required_skills]
+        known = np.array([row is not None for row in required_rows], dtype=bool)
+        if not len(cohort) or not known.any():
+            return grades
+
+        # Cohorts repeat the same skill names, so each is keyed once
+        lookup: Dict[str, Optional[int]] = {}
+        candidate_rows = [self.rows(skills, lookup) for skills in cohort]
+        offsets = np.zeros(len(cohort) + 1, dtype=np.int64)
+        np.cumsum([len(rows) for rows in candidate_rows], out=offsets[1:])
+        if not offsets[-1]:
+            return grades
+
+        # The matrix is symmetric, so the required columns are the (few,
+        # contiguous) required rows; candidate rows are gathered from those
+        columns = np.array([row for row in required_rows if row is not None], dtype=np.int64)
+        required_block = np.asarray(self.matrix[columns], dtype=np.float32).T
+        gathered = required_block[np.concatenate(candidate_rows)]
+
+        # Segments of candidates without known skills are empty; reduceat
+        # over the remaining starts covers each non-empty segment exactly
+        starts = offsets[:-1]
+        has_skills = offsets[1:] > starts
+        grades[np.ix_(has_skills, known)] = np.maximum.reduceat(gathered, starts[has_skills], axis=0)
+        return grades
+
+    def neighbors(self, skill: str, limit: int = 10) -> List[Dict]:
+        """Most similar other skills to skill, best first."""
+        row = self.row(skill)
+        if row is None:
+            return []
+        scores = np.asarray(self.matrix[row], dtype=np.float32)
+        order = np.argsort(-scores, kind='stable')
+        return [
+            {'skill': self.vocabulary[other], 'similarity': round(float(scores[other]), 3)}
+            for other in order.tolist()
+            if other != row and scores[other] > 0
+        ][:limit]
+
+
+def _cooccurrence(documents: List[np.ndarray], size: int) -> np.ndarray:
+    """X^T X for the (documents x skills) incidence matrix of documents."""
+    incidence = np.zeros((len(documents), size), dtype=np.float32)
+    for index, rows in enumerate(documents):
+        incidence[index, rows] = 1.0
+    return (incidence.T @ incidence).astype(np.float64)
+
+
+def _read_documents(path: str) -> Iterable[List[str]]:
+    """
+    Skill names per record of an NDJSON file: /parse-resume(/stream)
+    results (extract_skills output under 'skills') or student records
+    with a 'skills' list. Failed and skill-less records are skipped.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            skills = record.get('skills')
+            if isinstance(skills, dict):
+                # Only technical skills are in the vocabulary
+                skills = skills.get('technical', [])
+            if not skills:
+                continue
+            yield [entry.get('skill', '') if isinstance(entry, dict) else entry for entry in skills]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Build or inspect the skill similarity matrix.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help='build the matrix from parsed resumes')
+    build.add_argument('--input', required=True, help='NDJSON of /parse-resume results or student records')
+    build.add_argument('--output', default=os.getenv('SKILL_SIMILARITY_PATH', './models/skill_similarity.npy'))
+    build.add_argument('--min-count', type=int, default=5, help='minimum resumes per skill (default 5)')
+    build.add_argument('--min-similarity', type=float, default=0.2, help='smallest similarity kept (default 0.2)')
+
+    show = commands.add_parser('neighbors', help='print the most similar skills')
+    show.add_argument('skill')
+    show.add_argument('--path', default=os.getenv('SKILL_SIMILARITY_PATH', './models/skill_similarity.npy'))
+    show.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    from skill_matcher import SkillMatcher
+    matcher = SkillMatcher()
+
+    if args.command == 'build':
+        similarity = SkillSimilarity.build(
+            _read_documents(args.input),
+            sorted(matcher.all_technical_skills),
+            matcher.skill_aliases,
+            min_count=args.min_count,
+            min_similarity=args.min_similarity
+        )
+        similarity.save(args.output)
+        linked = int(np.count_nonzero(similarity.matrix)) - len(similarity)
+        print(f'Wrote {len(similarity)} skills ({linked // 2} similar pairs) to {args.output}')
+    else:
+        similarity = SkillSimilarity.load(args.path, matcher.skill_aliases)
+        for neighbor in similarity.neighbors(args.skill, args.limit):
+            print(f'{neighbor["similarity"]:.3f}  {neighbor["skill"]}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
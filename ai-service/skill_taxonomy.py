@@ -0,0 +1,416 @@
+"""
+Skill Taxonomy Module
+
+Compiles the skill taxonomy (data/skill_taxonomy.json: technical skills by
+category, soft skills, aliases, tool and domain keywords, related skills
+and role skills) into one binary artifact, and loads it back by memory
+mapping it.
+
+The artifact holds every string once in a string table, the keyword
+automaton's goto/failure/output tables and every list as integer arrays
+indexing into that table. Loading it does no compilation, and processes
+that map the same file (gunicorn workers, batch workers) share its pages
+through the page cache. A new artifact is picked up by SkillMatcher when
+its version changes, without a restart.
+
+After editing the JSON file, bump its "version" and compile it with:
+    python skill_taxonomy.py compile
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from keyword_automaton import KeywordAutomaton
+
+DEFAULT_SOURCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skill_taxonomy.json')
+DEFAULT_ARTIFACT_PATH = './models/skill_taxonomy.bin'
+
+MAGIC = b'SKILLTAX'
+FORMAT_VERSION = 1
+# Magic, format version and header length, followed by the JSON header
+_PREAMBLE = struct.Struct('<8sII')
+_ALIGNMENT = 8
+
+# Keyword kinds, in the order extract_skills reports them
+KINDS = ('technical', 'soft', 'tools', 'domains')
+
+Stat = Tuple[int, int, int]
+
+
+def artifact_stat(path: str) -> Optional[Stat]:
+    """(inode, size, mtime) of a file, None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def read_header(path: str) -> Dict:
+    """Header of an artifact (version, fingerprint, section table) without mapping it."""
+    with open(path, 'rb') as f:
+        return _parse_header(f.read(_PREAMBLE.size), f.read)
+
+
+def _aligned(size: int) -> int:
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
+
+
+def _parse_header(preamble: bytes, read) -> Dict:
+    if len(preamble) < _PREAMBLE.size:
+        raise ValueError('Truncated skill taxonomy artifact')
+    magic, format_version, header_length = _PREAMBLE.unpack(preamble)
+    if magic != MAGIC:
+        raise ValueError('Not a skill taxonomy artifact')
+    if format_version != FORMAT_VERSION:
+        raise ValueError(f'Unsupported skill taxonomy format {format_version}')
+    header = json.loads(read(header_length).decode('utf-8'))
+    header['data_start'] = _aligned(_PREAMBLE.size + header_length)
+    return header
+
+
+def load_source(path: str) -> Dict:
+    """Read and validate a taxonomy JSON file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        source = json.load(f)
+
+    if not isinstance(source.get('version'), str) or not source['version']:
+        raise ValueError(f'{path}: "version" must be a non-empty string')
+    for key in ('technical_skills', 'domain_keywords', 'skill_relationships', 'role_skills'):
+        if not isinstance(source.get(key), dict) or not all(
+            isinstance(values, list) for values in source[key].values()
+        ):
+            raise ValueError(f'{path}: "{key}" must map names to lists')
+    for key in ('soft_skills', 'tool_keywords'):
+        if not isinstance(source.get(key), list):
+            raise ValueError(f'{path}: "{key}" must be a list')
+    if not isinstance(source.get('skill_aliases'), dict):
+        raise ValueError(f'{path}: "skill_aliases" must map aliases to skills')
+    return source
+
+
+def fingerprint(source: Dict) -> str:
+    """Hash of the dictionaries extraction depends on (versions cached results)."""
+    return hashlib.sha256(json.dumps([
+        source['technical_skills'],
+        source['soft_skills'],
+        source['skill_aliases'],
+        source['tool_keywords'],
+        source['domain_keywords']
+    ], sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+
+class _StringTable:
+    """Interned strings, numbered in order of first use."""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def intern(self, string: str) -> int:
+        string_id = self.ids.get(string)
+        if string_id is None:
+            string_id = self.ids[string] = len(self.strings)
+            self.strings.append(string)
+        return string_id
+
+    def intern_all(self, strings: List[str]) -> List[int]:
+        return [self.intern(string) for string in strings]
+
+
+def _groups(table: _StringTable, groups: Dict[str, List[str]]) -> Tuple[List[int], List[int], List[int]]:
+    """Name -> list mapping as (name IDs, CSR offsets, member IDs)."""
+    names, offsets, members = [], [0], []
+    for name, values in groups.items():
+        names.append(table.intern(name))
+        members.extend(table.intern_all(values))
+        offsets.append(len(members))
+    return names, offsets, members
+
+
+def compile_taxonomy(source: Dict) -> bytes:
+    """
+    Compile a taxonomy (as read by load_source) into artifact bytes.
+
+    Keywords are added to the automaton in the order SkillMatcher reports
+    them: technical skills by category, soft skills, tools, then domains
+    (all keywords of a domain share its order).
+    """
+    table = _StringTable()
+    arrays: Dict[str, np.ndarray] = {}
+
+    def int32(name: str, values: List[int]) -> None:
+        arrays[name] = np.array(values, dtype=np.int32)
+
+    # Keyword patterns: (kind, order, reported name, category or -1)
+    automaton = KeywordAutomaton()
+    patterns: List[Tuple[int, int, int, int, int]] = []
+
+    def add_pattern(keyword: str, kind: int, order: int, name: str, category: int) -> None:
+        keyword = keyword.lower()
+        automaton.add(keyword, len(patterns))
+        patterns.append((kind, order, table.intern(name), category, len(keyword)))
+
+    order = 0
+    for category, skills in source['technical_skills'].items():
+        category_id = table.intern(category)
+        for skill in skills:
+            add_pattern(skill, 0, order, skill, category_id)
+            order += 1
+    for skill in source['soft_skills']:
+        add_pattern(skill, 1, order, skill, -1)
+        order += 1
+    for tool in source['tool_keywords']:
+        add_pattern(tool, 2, order, tool, -1)
+        order += 1
+    for domain, keywords in source['domain_keywords'].items():
+        for keyword in keywords:
+            add_pattern(keyword, 3, order, domain, -1)
+        order += 1
+
+    arrays['pattern_kinds'] = np.array([pattern[0] for pattern in patterns], dtype=np.uint8)
+    for index, name in enumerate(('pattern_orders', 'pattern_names', 'pattern_categories', 'pattern_lengths'), 1):
+        int32(name, [pattern[index] for pattern in patterns])
+
+    # Automaton tables: CSR edges (code point -> node), failure links and
+    # CSR outputs (pattern IDs, suffix outputs included)
+    goto, fail, output = automaton.tables()
+    edge_offsets, edge_chars, edge_targets = [0], [], []
+    output_offsets, output_patterns = [0], []
+    for node in range(len(goto)):
+        for ch, child in goto[node].items():
+            edge_chars.append(ord(ch))
+            edge_targets.append(child)
+        edge_offsets.append(len(edge_chars))
+        output_patterns.extend(pattern for _, pattern in output[node])
+        output_offsets.append(len(output_patterns))
+    int32('node_edge_offsets', edge_offsets)
+    int32('edge_chars', edge_chars)
+    int32('edge_targets', edge_targets)
+    int32('node_fail', fail)
+    int32('node_output_offsets', output_offsets)
+    int32('output_patterns', output_patterns)
+
+    # Lists and mappings over the string table
+    for prefix, key in (
+        ('category', 'technical_skills'),
+        ('domain', 'domain_keywords'),
+        ('relation', 'skill_relationships'),
+        ('role', 'role_skills')
+    ):
+        names, offsets, members = _groups(table, source[key])
+        int32(f'{prefix}_names', names)
+        int32(f'{prefix}_offsets', offsets)
+        int32(f'{prefix}_members', members)
+    int32('soft_skills', table.intern_all(source['soft_skills']))
+    int32('tool_keywords', table.intern_all(source['tool_keywords']))
+    int32('alias_keys', table.intern_all(list(source['skill_aliases'])))
+    int32('alias_values', table.intern_all(list(source['skill_aliases'].values())))
+
+    # String table last, once every string is interned
+    encoded = [string.encode('utf-8') for string in table.strings]
+    arrays['string_offsets'] = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(string) for string in encoded], out=arrays['string_offsets'][1:])
+    arrays['string_bytes'] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+    # Section offsets are relative to the data, which starts at the first
+    # aligned position after the header
+    sections = {}
+    position = 0
+    for name, array in arrays.items():
+        sections[name] = [array.dtype.str, position, len(array)]
+        position += _aligned(array.nbytes)
+    header = {'version': source['version'], 'fingerprint': fingerprint(source), 'sections': sections}
+    header_bytes = json.dumps(header).encode('utf-8')
+    header_bytes += b' ' * (_aligned(_PREAMBLE.size + len(header_bytes)) - _PREAMBLE.size - len(header_bytes))
+
+    parts = [_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)), header_bytes]
+    for name, array in arrays.items():
+        data = array.tobytes()
+        parts.append(data + b'\0' * (_aligned(len(data)) - len(data)))
+    return b''.join(parts)
+
+
+def write_artifact(source_path: str, artifact_path: str) -> Dict:
+    """
+    Compile a taxonomy JSON file and atomically replace the artifact.
+
+    Processes mapping the previous artifact keep their mapping of the old
+    file until they reload.
+
+    Returns:
+        The artifact header
+    """
+    data = compile_taxonomy(load_source(source_path))
+    directory = os.path.dirname(artifact_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary = f'{artifact_path}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, artifact_path)
+    return _parse_header(data[:_PREAMBLE.size], lambda size: data[_PREAMBLE.size:_PREAMBLE.size + size])
+
+
+class SkillTaxonomy:
+    """
+    Read-only view of a memory-mapped taxonomy artifact.
+
+    The Python dictionaries (technical_skills, skill_aliases, ...) and the
+    automaton's per-node transition dicts are decoded from the mapped
+    arrays once at load: matching is a pure-Python loop, and dict lookups
+    per character are far faster than indexing arrays per character.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Artifact written by write_artifact()
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            self.stat: Stat = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        mapped = self._mmap
+        header = _parse_header(
+            mapped[:_PREAMBLE.size], lambda size: mapped[_PREAMBLE.size:_PREAMBLE.size + size]
+        )
+        self.version: str = header['version']
+        self.fingerprint: str = header['fingerprint']
+        self.arrays: Dict[str, np.ndarray] = {}
+        for name, (dtype, offset, count) in header['sections'].items():
+            offset += header['data_start']
+            if offset + count * np.dtype(dtype).itemsize > len(mapped):
+                raise ValueError(f'Truncated skill taxonomy artifact: {path}')
+            self.arrays[name] = np.frombuffer(mapped, dtype=dtype, count=count, offset=offset)
+
+        self._decode()
+
+    def _decode(self) -> None:
+        arrays = self.arrays
+        offsets = arrays['string_offsets'].tolist()
+        raw = arrays['string_bytes'].tobytes()
+        strings = [raw[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+
+        def names(key: str) -> List[str]:
+            return [strings[string_id] for string_id in arrays[key].tolist()]
+
+        def groups(prefix: str) -> Dict[str, List[str]]:
+            bounds = arrays[f'{prefix}_offsets'].tolist()
+            members = names(f'{prefix}_members')
+            return {
+                name: members[bounds[i]:bounds[i + 1]]
+                for i, name in enumerate(names(f'{prefix}_names'))
+            }
+
+        self.technical_skills: Dict[str, List[str]] = groups('category')
+        self.soft_skills: List[str] = names('soft_skills')
+        self.skill_aliases: Dict[str, str] = dict(zip(names('alias_keys'), names('alias_values')))
+        self.tool_keywords: List[str] = names('tool_keywords')
+        self.domain_keywords: Dict[str, List[str]] = groups('domain')
+        self.skill_relationships: Dict[str, List[str]] = groups('relation')
+        self.role_skills: Dict[str, List[str]] = groups('role')
+
+        self.all_technical_skills = set()
+        # Display category per lowercased skill (first category wins)
+        self.categories: Dict[str, str] = {}
+        for category, skills in self.technical_skills.items():
+            self.all_technical_skills.update(skills)
+            for skill in skills:
+                self.categories.setdefault(skill.lower(), category.replace('_', ' ').title())
+        for skill in self.soft_skills:
+            self.categories.setdefault(skill.lower(), 'Soft Skills')
+
+        self.automaton = self._automaton(strings)
+
+    def _automaton(self, strings: List[str]) -> KeywordAutomaton:
+        arrays = self.arrays
+        payloads = [
+            (KINDS[kind], order, strings[name], strings[category] if category >= 0 else None)
+            for kind, order, name, category in zip(
+                arrays['pattern_kinds'].tolist(),
+                arrays['pattern_orders'].tolist(),
+                arrays['pattern_names'].tolist(),
+                arrays['pattern_categories'].tolist()
+            )
+        ]
+        lengths = arrays['pattern_lengths'].tolist()
+
+        edge_offsets = arrays['node_edge_offsets'].tolist()
+        chars = [chr(code) for code in arrays['edge_chars'].tolist()]
+        targets = arrays['edge_targets'].tolist()
+        output_offsets = arrays['node_output_offsets'].tolist()
+        patterns = arrays['output_patterns'].tolist()
+
+        goto = []
+        output = []
+        for node in range(len(edge_offsets) - 1):
+            start, end = edge_offsets[node], edge_offsets[node + 1]
+            goto.append(dict(zip(chars[start:end], targets[start:end])))
+            output.append([
+                (lengths[pattern], payloads[pattern])
+                for pattern in patterns[output_offsets[node]:output_offsets[node + 1]]
+            ])
+        return KeywordAutomaton.from_tables(goto, arrays['node_fail'].tolist(), output)
+
+    @classmethod
+    def load(cls, path: str) -> 'SkillTaxonomy':
+        return cls(path)
+
+    @classmethod
+    def ensure(cls, source_path: str, artifact_path: str) -> 'SkillTaxonomy':
+        """
+        Load the artifact, compiling it first if it is missing, unreadable
+        or older than the source's version.
+        """
+        try:
+            header = read_header(artifact_path)
+        except (OSError, ValueError):
+            header = None
+
+        if header is None or (
+            os.path.exists(source_path) and load_source(source_path)['version'] != header['version']
+        ):
+            write_artifact(source_path, artifact_path)
+        return cls(artifact_path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Compile or inspect the skill taxonomy artifact.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('compile', help='compile the taxonomy JSON into the artifact')
+    build.add_argument('--source', default=os.getenv('TAXONOMY_SOURCE', DEFAULT_SOURCE_PATH))
+    build.add_argument('--output', default=os.getenv('TAXONOMY_PATH', DEFAULT_ARTIFACT_PATH))
+
+    show = commands.add_parser('info', help='print the version and size of an artifact')
+    show.add_argument('--path', default=os.getenv('TAXONOMY_PATH', DEFAULT_ARTIFACT_PATH))
+    args = parser.parse_args(argv)
+
+    if args.command == 'compile':
+        header = write_artifact(args.source, args.output)
+        print(f"Wrote taxonomy {header['version']} ({header['fingerprint']}) to {args.output}")
+    else:
+        taxonomy = SkillTaxonomy.load(args.path)
+        print(f'version      {taxonomy.version}')
+        print(f'fingerprint  {taxonomy.fingerprint}')
+        print(f'bytes        {taxonomy.stat[1]}')
+        print(f'skills       {len(taxonomy.all_technical_skills)} technical, {len(taxonomy.soft_skills)} soft')
+        print(f'keywords     {len(taxonomy.arrays["pattern_kinds"])} ({len(taxonomy.automaton)} automaton states)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
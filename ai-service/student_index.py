@@ -0,0 +1,497 @@
+"""
+Student Index Module
+
+In-memory inverted index from canonical skill to the students who have it,
+for reverse lookups such as "python AND (docker OR kubernetes) AND
+cgpa >= 7" over a whole campus without scoring every student.
+
+Posting lists are bitsets (Python ints) over dense student numbers, so
+boolean operators are single big-integer operations; cgpa, backlogs and
+branch live in NumPy columns and numeric filters become bitsets too.
+"""
+
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from skill_index import skill_key
+
+# Query grammar (keywords are case-insensitive):
+#   expr       := and_expr (OR and_expr)*
+#   and_expr   := unary (AND unary)*
+#   unary      := NOT unary | '(' expr ')' | comparison | skill
+#   comparison := (cgpa | backlogs) (>= | <= | > | < | = | !=) number
+#               | branch (= | !=) name
+#   skill      := "quoted text" | one or more bare words
+_TOKEN_PATTERN = re.compile(r'\s*(\(|\)|>=|<=|!=|=|>|<|"[^"]*"|[^\s()<>=!"]+)')
+_KEYWORDS = {'and', 'or', 'not'}
+_OPERATORS = {'>=', '<=', '!=', '=', '>', '<'}
+_NUMERIC_FIELDS = {'cgpa', 'backlogs'}
+
+# Removed students leave dead slots until the index is renumbered, which
+# happens once dead slots outnumber live ones and there are at least this many
+COMPACT_MIN_DEAD = 1024
+
+Node = Tuple
+
+
+class QuerySyntaxError(ValueError):
+    """The query string does not follow the query grammar."""
+
+
+def _tokenize(query: str) -> List[str]:
+    tokens = []
+    position = 0
+    query = query.strip()
+    while position < len(query):
+        match = _TOKEN_PATTERN.match(query, position)
+        if match is None or not match.group(1):
+            raise QuerySyntaxError(f'Unexpected character at position {position}: {query[position]!r}')
+        tokens.append(match.group(1))
+        position = match.end()
+    return tokens
+
+
+class _QueryParser:
+    """Recursive descent parser producing a small tuple AST."""
+
+    def __init__(self, query: str):
+        self.tokens = _tokenize(query)
+        self.position = 0
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise QuerySyntaxError('Empty query')
+        node = self._expr()
+        if self.position < len(self.tokens):
+            raise QuerySyntaxError(f'Unexpected {self.tokens[self.position]!r}')
+        return node
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _peek_keyword(self) -> Optional[str]:
+        token = self._peek()
+        return token.lower() if token is not None and token.lower() in _KEYWORDS else None
+
+    def _take(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise QuerySyntaxError('Unexpected end of query')
+        self.position += 1
+        return token
+
+    def _expr(self) -> Node:
+        nodes = [self._and_expr()]
+        while self._peek_keyword() == 'or':
+            self.position += 1
+            nodes.append(self._and_expr())
+        return nodes[0] if len(nodes) == 1 else ('or', nodes)
+
+    def _and_expr(self) -> Node:
+        nodes = [self._unary()]
+        while self._peek_keyword() == 'and':
+            self.position += 1
+            nodes.append(self._unary())
+        return nodes[0] if len(nodes) == 1 else ('and', nodes)
+
+    def _unary(self) -> Node:
+        if self._peek_keyword() == 'not':
+            self.position += 1
+            return ('not', self._unary())
+
+        token = self._take()
+        if token == '(':
+            node = self._expr()
+            if self._take() != ')':
+                raise QuerySyntaxError('Expected )')
+            return node
+        if token == ')' or token in _OPERATORS:
+            raise QuerySyntaxError(f'Unexpected {token!r}')
+        if token.startswith('"'):
+            return ('skill', token[1:-1])
+
+        field = token.lower()
+        if field in _NUMERIC_FIELDS or field == 'branch':
+            if self._peek() in _OPERATORS:
+                return self._comparison(field)
+
+        # Consecutive bare words form one multi-word skill ("spring boot")
+        words = [token]
+        while True:
+            token = self._peek()
+            if token is None or token in ('(', ')') or token in _OPERATORS or token.startswith('"') \
+                    or token.lower() in _KEYWORDS:
+                break
+            words.append(self._take())
+        return ('skill', ' '.join(words))
+
+    def _comparison(self, field: str) -> Node:
+        operator = self._take()
+        value = self._take()
+        if field == 'branch':
+            if operator not in ('=', '!='):
+                raise QuerySyntaxError('branch only supports = and !=')
+            return ('cmp', field, operator, value.strip('"'))
+        try:
+            return ('cmp', field, operator, float(value))
+        except ValueError:
+            raise QuerySyntaxError(f'{field} must be compared with a number, got {value!r}')
+
+
+def _mask_to_bits(mask: np.ndarray) -> int:
+    """Boolean array -> bitset with bit i set where mask[i]."""
+    if not len(mask):
+        return 0
+    return int.from_bytes(np.packbits(mask, bitorder='little').tobytes(), 'little')
+
+
+def _numbers_to_bits(numbers: List[int], size: int) -> int:
+    """Bit positions -> bitset."""
+    if not numbers:
+        return 0
+    if len(numbers) == 1:
+        return 1 << numbers[0]
+    mask = np.zeros(size, dtype=bool)
+    mask[numbers] = True
+    return _mask_to_bits(mask)
+
+
+def _bits_to_numbers(bits: int, size: int) -> np.ndarray:
+    """Bitset -> sorted array of the set bit positions below size."""
+    if not bits:
+        return np.empty(0, dtype=np.int64)
+    data = np.frombuffer(bits.to_bytes((size + 7) // 8, 'little'), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(data, bitorder='little')[:size].view(bool))
+
+
+class StudentIndex:
+    """
+    Inverted skill index with numeric columns over a student population.
+
+    Students are upserted one at a time or in bulk (e.g. straight from
+    SkillMatcher.extract_skills output) and get a dense internal number;
+    removed students leave a hole that is skipped by every query until
+    compact() renumbers the remaining students.
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, str]] = None, initial_capacity: int = 1024):
+        """
+        Args:
+            aliases: Alias -> full skill name (e.g. SkillMatcher.skill_aliases),
+                so 'k8s' and 'kubernetes' share a posting list
+            initial_capacity: Initial size of the numeric columns
+        """
+        self.aliases = {skill_key(alias): skill_key(full) for alias, full in (aliases or {}).items()}
+
+        self._lock = threading.RLock()
+        self._numbers: Dict[str, int] = {}
+        self._student_ids: List[Optional[str]] = []
+        self._student_skills: List[Tuple[str, ...]] = []
+        self._postings: Dict[str, int] = {}
+        self._live = 0
+        self._dead = 0
+
+        initial_capacity = max(1, initial_capacity)
+        self._initial_capacity = initial_capacity
+        self._branch_codes: Dict[str, int] = {}
+        self._cgpa = np.full(initial_capacity, np.nan, dtype=np.float64)
+        self._backlogs = np.full(initial_capacity, -1, dtype=np.int32)
+        self._branch = np.full(initial_capacity, -1, dtype=np.int32)
+
+        self._query_cache: Dict[str, Node] = {}
+
+    def __len__(self) -> int:
+        return bin(self._live).count('1')
+
+    def canonical_skill(self, skill: str) -> str:
+        """Lookup form of a skill: punctuation-insensitive key, aliases resolved."""
+        skill = skill_key(skill)
+        return self.aliases.get(skill, skill)
+
+    @staticmethod
+    def skill_names(skills: Union[Iterable[str], Dict[str, List]]) -> List[str]:
+        """Flatten a list of skill names or an extract_skills() result."""
+        if isinstance(skills, dict):
+            names = []
+            for entries in skills.values():
+                for entry in entries or []:
+                    name = entry.get('skill') if isinstance(entry, dict) else entry
+                    if name:
+                        names.append(name)
+            return names
+        return [skill for skill in skills if skill]
+
+    def add(
+        self,
+        student_id: str,
+        skills: Union[Iterable[str], Dict[str, List]],
+        cgpa: Optional[float] = None,
+        branch: Optional[str] = None,
+        backlogs: Optional[int] = None
+    ) -> None:
+        """
+        Insert or replace one student.
+
+        Args:
+            student_id: Stable student identifier
+            skills: Skill names or an extract_skills() result
+            cgpa: CGPA (optional; students without one never match cgpa filters)
+            branch: Branch name (optional)
+            backlogs: Number of backlogs (optional)
+        """
+        self._upsert([(student_id, skills, cgpa, branch, backlogs)])
+
+    def add_many(self, students: Iterable[Dict[str, Any]]) -> int:
+        """
+        Upsert students given as dicts with studentId (or id), skills and
+        optional cgpa, branch and backlogs. Returns the number indexed.
+
+        Posting lists are extended once per skill for the whole batch, so
+        bulk loads cost O(students + skills) big-integer work rather than
+        one bitset copy per student and skill.
+        """
+        rows = []
+        for student in students:
+            student_id = student.get('studentId', student.get('id'))
+            if student_id is None:
+                raise ValueError('Every student needs a studentId')
+            rows.append((
+                str(student_id),
+                student.get('skills') or [],
+                student.get('cgpa'),
+                student.get('branch'),
+                student.get('backlogs')
+            ))
+        self._upsert(rows)
+        return len(rows)
+
+    def _upsert(self, rows: List[Tuple]) -> None:
+        """Insert or replace (student_id, skills, cgpa, branch, backlogs) rows."""
+        prepared = [
+            (student_id, tuple(sorted({self.canonical_skill(name) for name in self.skill_names(skills)})), cgpa, branch, backlogs)
+            for student_id, skills, cgpa, branch, backlogs in rows
+        ]
+
+        with self._lock:
+            new_numbers: Dict[str, List[int]] = {}
+            touched = []
+            for student_id, skill_set, cgpa, branch, backlogs in prepared:
+                number = self._numbers.get(student_id)
+                if number is None:
+                    number = len(self._student_ids)
+                    self._numbers[student_id] = number
+                    self._student_ids.append(student_id)
+                    self._student_skills.append(())
+                    self._ensure_capacity(number + 1)
+                else:
+                    self._clear_postings(number)
+                touched.append(number)
+
+                for skill in skill_set:
+                    new_numbers.setdefault(skill, []).append(number)
+                self._student_skills[number] = skill_set
+
+                self._cgpa[number] = np.nan if cgpa is None else float(cgpa)
+                self._backlogs[number] = -1 if backlogs is None else int(backlogs)
+                self._branch[number] = -1 if not branch else self._branch_code(branch)
+
+            size = len(self._student_ids)
+            for skill, numbers in new_numbers.items():
+                self._postings[skill] = self._postings.get(skill, 0) | _numbers_to_bits(numbers, size)
+            if touched:
+                self._live |= _numbers_to_bits(touched, size)
+
+    def remove(self, student_id: str) -> bool:
+        """Drop a student; returns False if it was not indexed."""
+        with self._lock:
+            number = self._numbers.pop(student_id, None)
+            if number is None:
+                return False
+            self._clear_postings(number)
+            self._student_ids[number] = None
+            self._student_skills[number] = ()
+            self._live &= ~(1 << number)
+            self._dead += 1
+            if self._dead >= COMPACT_MIN_DEAD and self._dead > len(self._student_ids) - self._dead:
+                self.compact()
+            return True
+
+    def compact(self) -> None:
+        """Renumber live students densely, in insertion order, dropping dead slots."""
+        with self._lock:
+            if not self._dead:
+                return
+            live = [number for number, student_id in enumerate(self._student_ids) if student_id is not None]
+            size = len(live)
+
+            self._student_ids = [self._student_ids[number] for number in live]
+            self._student_skills = [self._student_skills[number] for number in live]
+            self._numbers = {student_id: number for number, student_id in enumerate(self._student_ids)}
+
+            capacity = max(self._initial_capacity, size)
+            index = np.array(live, dtype=np.int64)
+            for name, fill in (('_cgpa', np.nan), ('_backlogs', -1), ('_branch', -1)):
+                column = getattr(self, name)
+                compacted = np.full(capacity, fill, dtype=column.dtype)
+                compacted[:size] = column[index]
+                setattr(self, name, compacted)
+
+            numbers_by_skill: Dict[str, List[int]] = {}
+            for number, skills in enumerate(self._student_skills):
+                for skill in skills:
+                    numbers_by_skill.setdefault(skill, []).append(number)
+            self._postings = {
+                skill: _numbers_to_bits(numbers, size) for skill, numbers in numbers_by_skill.items()
+            }
+            self._live = (1 << size) - 1
+            self._dead = 0
+
+    def query(
+        self,
+        expression: Optional[str] = None,
+        min_cgpa: Optional[float] = None,
+        branches: Optional[List[str]] = None,
+        max_backlogs: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[int, List[str]]:
+        """
+        Find students matching a boolean skill query and numeric filters.
+
+        Args:
+            expression: Query such as 'python AND (docker OR k8s) AND cgpa >= 7'
+                (None matches every student)
+            min_cgpa: Minimum CGPA
+            branches: Accepted branch names
+            max_backlogs: Maximum number of backlogs
+            limit: Maximum number of IDs returned
+
+        Returns:
+            (total matches, student IDs in insertion order, at most limit)
+
+        Raises:
+            QuerySyntaxError: if the expression cannot be parsed
+        """
+        node = self._parse(expression) if expression and expression.strip() else None
+
+        with self._lock:
+            size = len(self._student_ids)
+            bits = self._live if node is None else self._evaluate(node, size)
+
+            mask = None
+            if min_cgpa is not None:
+                mask = self._cgpa[:size] >= float(min_cgpa)
+            if max_backlogs is not None:
+                backlog_mask = (self._backlogs[:size] >= 0) & (self._backlogs[:size] <= int(max_backlogs))
+                mask = backlog_mask if mask is None else mask & backlog_mask
+            if branches is not None:
+                # Lookup table over branch codes; the extra last slot is hit by -1 (no branch)
+                accepted = np.zeros(len(self._branch_codes) + 1, dtype=bool)
+                for name in map(self._normalize_branch, branches):
+                    if name in self._branch_codes:
+                        accepted[self._branch_codes[name]] = True
+                branch_mask = accepted[self._branch[:size]]
+                mask = branch_mask if mask is None else mask & branch_mask
+            if mask is not None:
+                bits &= _mask_to_bits(mask)
+
+            numbers = _bits_to_numbers(bits, size)
+            total = len(numbers)
+            if limit is not None:
+                numbers = numbers[:max(0, int(limit))]
+            return total, [self._student_ids[number] for number in numbers.tolist()]
+
+    def stats(self) -> Dict[str, int]:
+        """Index size counters."""
+        with self._lock:
+            return {
+                'students': len(self),
+                'slots': len(self._student_ids),
+                'skills': len(self._postings),
+                'branches': len(self._branch_codes)
+            }
+
+    def _parse(self, expression: str) -> Node:
+        node = self._query_cache.get(expression)
+        if node is None:
+            node = _QueryParser(expression).parse()
+            if len(self._query_cache) >= 1024:
+                self._query_cache.clear()
+            self._query_cache[expression] = node
+        return node
+
+    def _evaluate(self, node: Node, size: int) -> int:
+        """Bitset of live students matching an AST node."""
+        kind = node[0]
+        if kind == 'skill':
+            return self._postings.get(self.canonical_skill(node[1]), 0)
+        if kind == 'and':
+            bits = self._live
+            for child in node[1]:
+                bits &= self._evaluate(child, size)
+                if not bits:
+                    break
+            return bits
+        if kind == 'or':
+            bits = 0
+            for child in node[1]:
+                bits |= self._evaluate(child, size)
+            return bits & self._live
+        if kind == 'not':
+            return self._live & ~self._evaluate(node[1], size)
+        return self._compare(node[1], node[2], node[3], size) & self._live
+
+    def _compare(self, field: str, operator: str, value: Any, size: int) -> int:
+        if field == 'branch':
+            column = self._branch[:size]
+            code = self._branch_codes.get(self._normalize_branch(value), -2)
+            mask = column == code if operator == '=' else (column >= 0) & (column != code)
+            return _mask_to_bits(mask)
+
+        column = self._cgpa[:size] if field == 'cgpa' else self._backlogs[:size]
+        known = ~np.isnan(column) if field == 'cgpa' else column >= 0
+        if operator == '>=':
+            mask = column >= value
+        elif operator == '<=':
+            mask = column <= value
+        elif operator == '>':
+            mask = column > value
+        elif operator == '<':
+            mask = column < value
+        elif operator == '=':
+            mask = column == value
+        else:
+            mask = column != value
+        return _mask_to_bits(mask & known)
+
+    def _clear_postings(self, number: int) -> None:
+        keep = ~(1 << number)
+        for skill in self._student_skills[number]:
+            bits = self._postings[skill] & keep
+            if bits:
+                self._postings[skill] = bits
+            else:
+                del self._postings[skill]
+
+    @staticmethod
+    def _normalize_branch(branch: str) -> str:
+        return ' '.join(str(branch).lower().split())
+
+    def _branch_code(self, branch: str) -> int:
+        name = self._normalize_branch(branch)
+        code = self._branch_codes.get(name)
+        if code is None:
+            code = self._branch_codes[name] = len(self._branch_codes)
+        return code
+
+    def _ensure_capacity(self, size: int) -> None:
+        capacity = len(self._cgpa)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        self._cgpa = np.concatenate([self._cgpa, np.full(capacity - len(self._cgpa), np.nan, dtype=np.float64)])
+        self._backlogs = np.concatenate([self._backlogs, np.full(capacity - len(self._backlogs), -1, dtype=np.int32)])
+        self._branch = np.concatenate([self._branch, np.full(capacity - len(self._branch), -1, dtype=np.int32)])
@@ -0,0 +1,82 @@
+"""
+DocumentExtractor page workers: a page or page count that hangs times out
+and fails only its own request. The workers are forked with page counting
+and extraction patched, so no PDF library is needed.
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+import document_extractor
+from document_extractor import DocumentExtractor
+
+PAGE_TIMEOUT = 0.5
+
+
+def fake_count(path):
+    with open(path, 'rb') as f:
+        content = f.read().decode()
+    if 'count-hangs' in content:
+        time.sleep(60)
+    return content.count('page')
+
+
+def fake_page(path, page_number):
+    with open(path, 'rb') as f:
+        content = f.read().decode()
+    if f'hang{page_number}' in content:
+        time.sleep(60)
+    return f'text of page {page_number + 1}'
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    monkeypatch.setattr(document_extractor, 'count_pdf_pages', fake_count)
+    monkeypatch.setattr(document_extractor, 'extract_pdf_page', fake_page)
+    extractor = DocumentExtractor(processes=4, page_timeout=PAGE_TIMEOUT, max_pages=20, start_method='fork')
+    yield extractor
+    extractor.close()
+
+
+def test_pages_are_extracted_in_order(extractor):
+    result = extractor.extract_bytes(b'%PDF page page page', 'resume.pdf')
+
+    assert result['pageCount'] == 3
+    assert result['text'] == 'text of page 1\n\ntext of page 2\n\ntext of page 3'
+    assert result['timedOutPages'] == [] and result['failedPages'] == []
+
+
+def test_a_stuck_page_only_fails_its_own_request(extractor):
+    results = {}
+
+    def extract(name, data):
+        results[name] = extractor.extract_bytes(data, f'{name}.pdf')
+
+    threads = [
+        threading.Thread(target=extract, args=('stuck', b'%PDF page page hang1')),
+        threading.Thread(target=extract, args=('healthy', b'%PDF ' + b'page ' * 8))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results['stuck']['timedOutPages'] == [2]
+    assert results['stuck']['pagesExtracted'] == 1
+    assert results['healthy']['pagesExtracted'] == 8
+    assert results['healthy']['timedOutPages'] == [] and results['healthy']['failedPages'] == []
+
+    # The killed worker was replaced
+    assert extractor.extract_bytes(b'%PDF page page', 'again.pdf')['pagesExtracted'] == 2
+
+
+def test_counting_pages_is_bounded_by_the_page_timeout(extractor):
+    started = time.monotonic()
+    result = extractor.extract_bytes(b'%PDF page count-hangs', 'resume.pdf')
+
+    assert time.monotonic() - started < PAGE_TIMEOUT + 2
+    assert result['pageCount'] is None
+    assert result['text'] == ''
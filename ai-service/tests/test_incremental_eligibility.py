@@ -0,0 +1,57 @@
+"""
+IncrementalEligibility row compaction: removed students' rows are
+reclaimed and the remaining students keep their scores and deltas.
+"""
+
+import incremental_eligibility
+from benchmarks import corpus
+from incremental_eligibility import IncrementalEligibility
+
+
+def scores(engine):
+    return sorted(
+        (result['studentId'], result['jobId'], result['totalScore'], result['eligibilityLevel'])
+        for result in engine.get_scores()
+    )
+
+
+def test_remove_compact_and_rescore(monkeypatch):
+    monkeypatch.setattr(incremental_eligibility, 'COMPACT_MIN_DEAD', 10)
+    students = corpus.generate_students(7, 60)
+    engine = IncrementalEligibility(initial_capacity=8)
+    engine.upsert_students(students)
+    for seed in range(3):
+        engine.upsert_job(f'J{seed}', corpus.generate_job(seed))
+
+    removed = [student['studentId'] for student in students[:45]]
+    for student_id in removed:
+        assert engine.remove_student(student_id)
+
+    # Compacted once 31 of 60 rows were dead; the rest stay dead until the next one
+    assert engine.stats()['students'] == 15
+    assert engine.stats()['rows'] == 29
+    engine.compact()
+    assert engine.stats()['rows'] == 15
+
+    survivors = students[45:]
+    fresh = IncrementalEligibility()
+    fresh.upsert_students(survivors)
+    for seed in range(3):
+        fresh.upsert_job(f'J{seed}', corpus.generate_job(seed))
+    assert scores(engine) == scores(fresh)
+
+    # Deltas after compaction address the renumbered rows
+    student_id = survivors[0]['studentId']
+    change = {'cgpa': 5.0}
+    assert engine.update_student(student_id, change) == fresh.update_student(student_id, change)
+    job_change = {'minCGPA': 6.0}
+    assert engine.update_job('J1', job_change) == fresh.update_job('J1', job_change)
+    assert scores(engine) == scores(fresh)
+    assert engine.get_scores(student_id=student_id) == fresh.get_scores(student_id=student_id)
+
+    # Removed students are gone and can come back
+    assert engine.get_scores(student_id=survivors[1]['studentId'])
+    assert not engine.remove_student(removed[0])
+    report = engine.upsert_students(students[:1])
+    assert report['pairsRecomputed'] == 3
+    assert engine.stats()['students'] == 16
@@ -0,0 +1,116 @@
+"""
+OpenAIService against the local stub server (benchmarks/stub_openai.py):
+coalescing, deadline fallback, the concurrency bound and caching.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip('openai')
+pytest.importorskip('httpx')
+
+from benchmarks.stub_openai import start_stub_server
+from openai_service import OpenAIService
+from result_cache import ResultCache
+
+STUB_SUMMARY = 'Stub summary: python, sql, docker.'
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(delay):
+        server, _ = start_stub_server(delay=delay)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def make_service(monkeypatch, server, cache=None, deadline=5, concurrency=8):
+    monkeypatch.setenv('OPENAI_DEADLINE', str(deadline))
+    monkeypatch.setenv('OPENAI_MAX_CONCURRENCY', str(concurrency))
+    monkeypatch.setenv('OPENAI_MAX_RETRIES', '0')
+    return OpenAIService(api_key='test-key', cache=cache, base_url=server.base_url)
+
+
+def fallback(text):
+    return {'summary': 'fallback', 'notes': 'Local fallback analysis used'}
+
+
+def test_concurrent_requests_for_one_text_share_one_call(monkeypatch, stub):
+    server = stub(0.3)
+    service = make_service(monkeypatch, server)
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: service.analyze_resume('same resume', fallback), range(8)))
+
+    assert server.calls == 1
+    assert results == [{'summary': STUB_SUMMARY}] * 8
+
+
+def test_deadline_falls_back_to_local_analysis(monkeypatch, stub):
+    server = stub(2.0)
+    service = make_service(monkeypatch, server, deadline=0.3)
+
+    started = time.perf_counter()
+    result = service.analyze_resume('slow resume', fallback)
+
+    assert result == fallback('slow resume')
+    assert time.perf_counter() - started < 1.5
+
+
+def test_upstream_calls_are_bounded_by_max_concurrency(monkeypatch, stub):
+    server = stub(0.2)
+    service = make_service(monkeypatch, server, concurrency=2)
+
+    with ThreadPoolExecutor(6) as executor:
+        results = list(executor.map(lambda i: service.analyze_resume(f'resume {i}', fallback), range(6)))
+
+    assert server.calls == 6
+    assert server.max_active <= 2
+    assert all(result == {'summary': STUB_SUMMARY} for result in results)
+
+
+def test_results_are_cached_outside_the_event_loop(monkeypatch, stub):
+    server = stub(0.05)
+    cache = ResultCache(max_entries=16, disk_path='')
+    service = make_service(monkeypatch, server, cache=cache)
+
+    threads = []
+    original_get, original_set = cache.get, cache.set
+
+    def get(key):
+        threads.append(threading.current_thread().name)
+        return original_get(key)
+
+    def set_(key, value):
+        threads.append(threading.current_thread().name)
+        return original_set(key, value)
+
+    monkeypatch.setattr(cache, 'get', get)
+    monkeypatch.setattr(cache, 'set', set_)
+
+    first = service.analyze_resume('cached resume', fallback)
+    second = service.analyze_resume('cached resume', fallback)
+
+    assert first == second == {'summary': STUB_SUMMARY}
+    assert server.calls == 1
+    assert cache.stats()['memoryHits'] == 1
+    assert threads and 'openai-loop' not in threads
+
+
+def test_failed_calls_are_not_cached(monkeypatch, stub):
+    server = stub(2.0)
+    cache = ResultCache(max_entries=16, disk_path='')
+    service = make_service(monkeypatch, server, cache=cache, deadline=0.2)
+
+    assert service.analyze_resume('slow resume', fallback) == fallback('slow resume')
+    assert cache.stats()['writes'] == 0
@@ -0,0 +1,34 @@
+"""
+ResultCache tiers: values survive in SQLite across instances, and memory
+hits do not wait for the SQLite connection.
+"""
+
+import threading
+
+from result_cache import ResultCache
+
+
+def test_values_are_read_back_from_disk(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    ResultCache(max_entries=16, disk_path=path).set('key', {'skills': ['python']})
+
+    cache = ResultCache(max_entries=16, disk_path=path)
+    assert cache.get('key') == {'skills': ['python']}
+    assert cache.get('key') == {'skills': ['python']}
+    assert cache.stats()['diskHits'] == 1
+    assert cache.stats()['memoryHits'] == 1
+
+
+def test_memory_hits_do_not_wait_for_disk_io(tmp_path):
+    cache = ResultCache(max_entries=16, disk_path=str(tmp_path / 'cache.sqlite'))
+    cache.set('key', 'value')
+    results = []
+
+    # Another thread in the middle of a slow SQLite write or commit
+    with cache._disk_lock:
+        reader = threading.Thread(target=lambda: results.append(cache.get('key')))
+        reader.start()
+        reader.join(timeout=2)
+        assert not reader.is_alive()
+
+    assert results == ['value']
@@ -0,0 +1,49 @@
+"""
+ResumeIndex slot reuse: replaced and removed resumes free their slots at the
+next merge without changing the ranking.
+"""
+
+import random
+
+import resume_index
+from resume_index import ResumeIndex
+
+WORDS = ['python', 'django', 'docker', 'kubernetes', 'react', 'sql', 'java', 'aws', 'spark', 'go']
+
+
+def scores(index, query):
+    # Equal scores come back in insertion order, which differs between the two
+    return {result['resumeId']: result['score'] for result in index.search(query, top_k=100)['results']}
+
+
+def test_reparsing_one_resume_does_not_grow_the_index():
+    index = ResumeIndex()
+    for i in range(5000):
+        index.add('r1', f'python django version {i}')
+
+    stats = index.stats()
+    assert len(index) == 1
+    assert stats['slots'] <= resume_index.MERGE_MIN_DEAD + 1
+
+
+def test_renumbered_index_ranks_like_a_fresh_one(monkeypatch):
+    monkeypatch.setattr(resume_index, 'MERGE_MIN_POSTINGS', 50)
+    monkeypatch.setattr(resume_index, 'MERGE_MIN_DEAD', 10)
+    rng = random.Random(7)
+    index, texts = ResumeIndex(), {}
+    for _ in range(3000):
+        resume_id = f'r{rng.randrange(60)}'
+        if rng.random() < 0.3:
+            index.remove(resume_id)
+            texts.pop(resume_id, None)
+        else:
+            texts[resume_id] = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 20)))
+            index.add(resume_id, texts[resume_id])
+
+    fresh = ResumeIndex()
+    for resume_id, text in texts.items():
+        fresh.add(resume_id, text)
+
+    assert index.stats()['slots'] < 2 * len(texts) + 10
+    for query in ['python docker', 'react sql aws', 'go spark kubernetes java']:
+        assert scores(index, query) == scores(fresh, query)
@@ -0,0 +1,117 @@
+"""
+SkillIndex matching rules, through SkillMatcher.match_skills with the real
+skill dictionaries: typos are corrected towards known skills but never
+from one known skill to another, and version numbers are optional.
+"""
+
+import sys
+import threading
+
+import pytest
+
+from skill_index import SkillIndex, max_edits, split_version
+from skill_matcher import SkillMatcher
+
+
+@pytest.fixture(scope='module')
+def matcher(tmp_path_factory):
+    return SkillMatcher(taxonomy_path=str(tmp_path_factory.mktemp('taxonomy') / 'skill_taxonomy.bin'))
+
+
+def matches(matcher, required, candidate):
+    return len(matcher.match_skills([candidate], {'mandatory': [required]})['mandatory']['matched']) == 1
+
+
+DIFFERENT_SKILLS = [
+    ('mysql', 'mssql'),
+    ('next.js', 'nestjs'),
+    ('react', 'preact'),
+    ('scala', 'scalar'),
+    ('python3', 'python2'),
+    ('pandas', 'panda'),
+]
+
+SAME_SKILLS = [
+    ('html', 'html5'),
+    ('css', 'css3'),
+    ('python', 'python3'),
+    ('node.js', 'NodeJS'),
+    ('kubernetes', 'kubernets'),
+    ('javascript', 'javscript'),
+    ('mongodb', 'mongdb'),
+]
+
+
+@pytest.mark.parametrize('first, second', DIFFERENT_SKILLS)
+def test_different_skills_do_not_match_in_either_direction(matcher, first, second):
+    assert not matches(matcher, first, second)
+    assert not matches(matcher, second, first)
+
+
+@pytest.mark.parametrize('first, second', SAME_SKILLS)
+def test_versions_and_typos_match_in_either_direction(matcher, first, second):
+    assert matches(matcher, first, second)
+    assert matches(matcher, second, first)
+
+
+def test_compound_skills_satisfy_their_words_only():
+    index = SkillIndex(['machine learning', 'machine learning engineering'], {})
+    required = index.intern('machine learning')
+    assert index.matches(required, index.candidate_mask(['machine learning engineering']))
+    assert not index.matches(index.intern('machine learning engineering'), index.candidate_mask(['machine learning']))
+
+
+def test_vocabulary_skills_are_never_typos_of_each_other():
+    index = SkillIndex(['kubernetes', 'kubernates'], {})
+    assert not index.matches(index.intern('kubernetes'), index.candidate_mask(['kubernates']))
+    # An unknown spelling is corrected towards the vocabulary
+    assert index.matches(index.intern('kubernetes'), index.candidate_mask(['kubernets']))
+    assert index.matches(index.intern('kubernets'), index.candidate_mask(['kubernetes']))
+
+
+def test_split_version():
+    assert split_version('css3') == ('css', '3')
+    assert split_version('python310') == ('python', '310')
+    assert split_version('k8s') == ('k8s', '')
+    assert split_version('3d') == ('3d', '')
+    assert split_version('1234') == ('1234', '')
+
+
+def test_short_keys_tolerate_no_typos():
+    assert max_edits(5) == 0
+    assert max_edits(6) == 1
+    assert max_edits(10) == 2
+
+
+def test_concurrent_requests_interning_and_resetting(matcher, monkeypatch):
+    # Every request interns new skills and the index resets every few
+    # requests, while other threads still match with the IDs they hold
+    monkeypatch.setattr(matcher.skill_index, 'max_skills', len(matcher.skill_index) + 50)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    errors = []
+
+    def requests(thread):
+        try:
+            for i in range(300):
+                unknown = f'skill{thread}x{i}'
+                result = matcher.match_skills(
+                    ['python', unknown, 'docker'],
+                    {'mandatory': ['python', unknown], 'preferred': ['kubernetes']}
+                )
+                assert result['mandatory']['matched'] == ['python', unknown]
+                assert result['preferred']['missing'] == ['kubernetes']
+                assert matcher.match_cohort([[unknown], ['kubernetes']], {'mandatory': [unknown]})[0]['totalMatched'] == 1
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=requests, args=(thread,)) for thread in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
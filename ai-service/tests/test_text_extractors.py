@@ -0,0 +1,103 @@
+"""
+text_extractors against the regular expressions they replace: same results
+on sample and random inputs, and linear time on inputs that make the
+regular expressions backtrack.
+"""
+
+import random
+import re
+import time
+
+import pytest
+
+import text_extractors as te
+from benchmarks import corpus
+
+# The patterns the extractors replace, as the resume parser used them
+EMAIL = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+DATE_RANGE = re.compile(
+    r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s*\d{2,4}\s*[-–to]+\s*'
+    r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|present|current)[a-z]*\s*\d{0,4}',
+    re.IGNORECASE
+)
+GRADE = re.compile(r'(\d+\.?\d*)\s*(cgpa|gpa|%|percentage)')
+IMPACT = re.compile(r'\d+%|\$\d+|\d+\s*(users|customers|projects)')
+LINKEDIN = re.compile(r'linkedin\.com/in/[\w-]+')
+GITHUB = re.compile(r'github\.com/[\w-]+')
+
+SAMPLES = [
+    'Priya Sharma\npriya.sharma@example.co.in | +91 (987) 654-3210',
+    'Contact: john_doe-99@mail.server.org, 555.123.4567',
+    'linkedin.com/in/priya-sharma  GitHub.com/PriyaS_dev',
+    'Software Engineer, Acme Corp  Jan 2020 - Present',
+    'Intern  June 2019 to Aug 2021; Analyst Sept 2018 – Current',
+    'Developer 2019-oct 2020, dec 19 to jan 20',
+    'B.Tech, CGPA: 8.75 cgpa (2016-2020); 12th: 92% ; 10th 88 percentage',
+    'Grew revenue 35% and served 10000 users; cut costs by $200k across 12 projects',
+    'no contact, no dates, no numbers here',
+    'a@b a@b.c @x.y .@.. foo@bar.baz.qux',
+    '+1 234 5678 90123 (12) 3456-7890 1234567890123',
+    '',
+]
+
+PIECES = {
+    'email': ['a', 'B', '_', '.', '-', '@', ' ', '1', 'é', 'x.y', '@a.b', '..', '\n', '+'],
+    'phone': ['1', '23', '456', '7890', '+', '(', ')', '-', ' ', '.', 'a', '\t', '12345', '٣'],
+    'date': ['jan', 'Feb', 'sept', 'ember', ' ', '2020', '20', '1', '-', '–', 'to', 'TO', 'o', 't',
+             'present', 'Current', 'oct', 'x', '\n', '12345', 'may'],
+    'grade': ['1', '2.', '.', '5', ' ', 'cgpa', 'gpa', '%', 'percentage', 'x', 'g', '٣', '$',
+              'users', 'projects', 'customer'],
+    'profile': ['linkedin.com/in/', 'github.com/', 'LinkedIn.com/in/', 'a', '-', '_', ' ', '/', '.',
+                'İ', 'github.co'],
+}
+
+
+def first(pattern, text):
+    match = pattern.search(text)
+    return match.group(0) if match else ''
+
+
+def assert_equivalent(text):
+    assert te.find_email(text) == first(EMAIL, text)
+    assert te.find_phone(text) == first(te.PHONE_PATTERN, text)
+    assert te.find_date_ranges(text) == DATE_RANGE.findall(text)
+    assert te.find_grade(text) == first(GRADE, text)
+    assert te.has_quantified_impact(text) == bool(IMPACT.search(text))
+    assert te.find_linkedin(text) == first(LINKEDIN, text.lower())
+    assert te.find_github(text) == first(GITHUB, text.lower())
+    assert te.count_words(text, chunk_size=7) == len(text.split())
+
+
+@pytest.mark.parametrize('text', SAMPLES)
+def test_samples_match_the_regular_expressions(text):
+    assert_equivalent(text)
+
+
+@pytest.mark.parametrize('kind', sorted(PIECES))
+def test_random_inputs_match_the_regular_expressions(kind):
+    rng = random.Random(kind)
+    pieces = PIECES[kind]
+    for _ in range(3000):
+        assert_equivalent(''.join(rng.choice(pieces) for _ in range(rng.randint(0, 14))))
+
+
+# The replaced patterns need seconds to minutes on these inputs
+ADVERSARIAL_LENGTH = 200000
+TIME_BOUND = 2.0
+
+
+@pytest.mark.parametrize('kind', sorted(corpus.ADVERSARIAL_UNITS))
+def test_adversarial_inputs_run_in_bounded_time(kind):
+    text = corpus.generate_adversarial(kind, ADVERSARIAL_LENGTH)
+
+    started = time.perf_counter()
+    te.find_email(text)
+    te.find_phone(text)
+    te.find_date_ranges(text)
+    te.find_grade(text)
+    te.has_quantified_impact(text)
+    te.find_linkedin(text)
+    te.find_github(text)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < TIME_BOUND, f'{kind}: {elapsed:.2f}s for {ADVERSARIAL_LENGTH} characters'
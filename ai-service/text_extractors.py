@@ -0,0 +1,226 @@
+"""
+Text Extractors Module
+
+Linear-time extraction of contact details, date ranges and grades from
+resume text. These replace regular expressions such as
+[\\w.-]+@[\\w.-]+\\.\\w+ whose backtracking is quadratic (or worse) on long
+runs of word characters, digits or separators, which PDF dumps of tables
+produce.
+
+Each extractor returns what the original pattern's search()/findall()
+returned, but is built from steps that cannot backtrack: literal searches,
+and greedy matches of a single character class from a fixed position,
+which consume a run once and stop. Every run is scanned a bounded number
+of times, so the work is linear in the length of the text. The one
+exception is the phone number pattern, which can match at most
+PHONE_MAX_LENGTH characters: it is only tried at positions a few
+characters before a 4-digit group, and only within that window, so each
+try costs a bounded amount of work.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+# Single-class runs: matched greedily from a position, never backtracked
+_EMAIL_CHARS = re.compile(r'[\w.-]*')
+_WORD_CHARS = re.compile(r'\w*')
+_HANDLE_CHARS = re.compile(r'[\w-]*')
+_SPACES = re.compile(r'\s*')
+_DIGITS = re.compile(r'\d*')
+_LETTERS = re.compile(r'[a-z]*', re.IGNORECASE)
+_RANGE_SEPARATORS = re.compile(r'[-–to]*', re.IGNORECASE)
+_DIGIT_RUN = re.compile(r'\d+')
+
+# Fixed-length literal alternatives
+_MONTH = re.compile(r'jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec', re.IGNORECASE)
+_RANGE_END = re.compile(r'jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|present|current', re.IGNORECASE)
+_GRADE_UNIT = re.compile(r'cgpa|gpa|%|percentage')
+_IMPACT_UNIT = re.compile(r'users|customers|projects')
+
+# Phone numbers: +CC (AAA) NNNNNN-XXXX style, at most 25 characters long
+PHONE_PATTERN = re.compile(
+    r'[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{4,6}[-\s\.]?[0-9]{0,4}'
+)
+PHONE_MAX_LENGTH = 25
+# Characters a phone match can span before its mandatory 4-digit group
+_PHONE_MAX_PREFIX = 14
+_PHONE_GROUP = re.compile(r'[0-9]{4}')
+
+LINKEDIN_PREFIX = 'linkedin.com/in/'
+GITHUB_PREFIX = 'github.com/'
+
+
+def find_email(text: str) -> str:
+    """First e-mail address in text, as [\\w.-]+@[\\w.-]+\\.\\w+ would find it."""
+    at = text.find('@')
+    reversed_text = None
+
+    while at != -1:
+        if reversed_text is None:
+            reversed_text = text[::-1]
+
+        # The local part is the whole [\w.-] run ending at '@' (a shorter
+        # one would start inside the run, i.e. further right)
+        mirrored = len(text) - at
+        local_length = _EMAIL_CHARS.match(reversed_text, mirrored).end() - mirrored
+        domain_end = _EMAIL_CHARS.match(text, at + 1).end()
+
+        if local_length:
+            end = _email_domain_end(text, at + 1, domain_end)
+            if end:
+                return text[at - local_length:end]
+
+        # The domain run holds no '@', so runs are never rescanned
+        at = text.find('@', domain_end)
+
+    return ''
+
+
+def _email_domain_end(text: str, start: int, end: int) -> Optional[int]:
+    """End of [\\w.-]+\\.\\w+ within text[start:end], using the last usable dot."""
+    dot = text.rfind('.', start + 1, end - 1)
+    while dot != -1:
+        word_end = _WORD_CHARS.match(text, dot + 1).end()
+        if word_end > dot + 1:
+            return word_end
+        dot = text.rfind('.', start + 1, dot)
+    return None
+
+
+def find_phone(text: str) -> str:
+    """First phone number in text, as PHONE_PATTERN.search would find it."""
+    position = 0
+    group = None
+
+    while position < len(text):
+        # Every match contains 4 consecutive digits starting at most
+        # _PHONE_MAX_PREFIX characters after the match start
+        if group is None or group.start() < position:
+            group = _PHONE_GROUP.search(text, position)
+            if group is None:
+                return ''
+        position = max(position, group.start() - _PHONE_MAX_PREFIX)
+
+        match = PHONE_PATTERN.match(text, position, position + PHONE_MAX_LENGTH)
+        if match:
+            return match.group(0)
+        position += 1
+
+    return ''
+
+
+def _find_profile(text: str, prefix: str) -> str:
+    """First prefix + [\\w-]+ in lowercased text, or ''."""
+    lowered = text.lower()
+    start = lowered.find(prefix)
+    while start != -1:
+        end = _HANDLE_CHARS.match(lowered, start + len(prefix)).end()
+        if end > start + len(prefix):
+            return lowered[start:end]
+        start = lowered.find(prefix, start + 1)
+    return ''
+
+
+def find_linkedin(text: str) -> str:
+    """linkedin.com/in/<handle> (lowercased), or ''."""
+    return _find_profile(text, LINKEDIN_PREFIX)
+
+
+def find_github(text: str) -> str:
+    """github.com/<handle> (lowercased), or ''."""
+    return _find_profile(text, GITHUB_PREFIX)
+
+
+def find_date_ranges(text: str) -> List[Tuple[str, str]]:
+    """
+    Month-year ranges such as "Jan 2020 - Present" or "June 2019 to Aug 2021".
+
+    Returns:
+        (start month, end month or present/current) pairs, as the text
+        spells them (first three letters of a month), in order
+    """
+    ranges = []
+    position = 0
+    letters_end = -1
+    tail_start = -1
+    tail = None
+
+    while True:
+        month = _MONTH.search(text, position)
+        if month is None:
+            return ranges
+
+        # Candidates inside one letter run (e.g. "janjanjan...") share the
+        # rest of the match, so the run and its tail are scanned once
+        if month.end() > letters_end:
+            letters_end = _LETTERS.match(text, month.end()).end()
+        if letters_end != tail_start:
+            tail_start = letters_end
+            tail = _date_range_tail(text, letters_end)
+
+        if tail is None:
+            position = month.start() + 1
+        else:
+            ranges.append((month.group(0), tail[0]))
+            position = tail[1]
+
+
+def _date_range_tail(text: str, start: int) -> Optional[Tuple[str, int]]:
+    """Match \\s*\\d{2,4}\\s*[-–to]+\\s*(end month)[a-z]*\\s*\\d{0,4} at start."""
+    digits_start = _SPACES.match(text, start).end()
+    digits_end = _DIGITS.match(text, digits_start).end()
+    if not 2 <= digits_end - digits_start <= 4:
+        return None
+
+    separators_start = _SPACES.match(text, digits_end).end()
+    separators_end = _RANGE_SEPARATORS.match(text, separators_start).end()
+    if separators_end == separators_start:
+        return None
+
+    # The separator class contains 'o', so the end month may also be an
+    # "oct" whose 'o' the separators took (e.g. "2019-oct 2020")
+    candidates = [_SPACES.match(text, separators_end).end()]
+    if separators_end - 1 > separators_start:
+        candidates.append(separators_end - 1)
+
+    for start in candidates:
+        range_end = _RANGE_END.match(text, start)
+        if range_end:
+            year_start = _SPACES.match(text, _LETTERS.match(text, range_end.end()).end()).end()
+            return range_end.group(0), _DIGITS.match(text, year_start, year_start + 4).end()
+    return None
+
+
+def find_grade(text: str) -> str:
+    """First grade such as "8.5 cgpa" or "92%", as (\\d+\\.?\\d*)\\s*(cgpa|gpa|%|percentage) would find it."""
+    for digits in _DIGIT_RUN.finditer(text):
+        end = digits.end()
+        if text.startswith('.', end):
+            end = _DIGITS.match(text, end + 1).end()
+        unit = _GRADE_UNIT.match(text, _SPACES.match(text, end).end())
+        if unit:
+            return text[digits.start():unit.end()]
+    return ''
+
+
+def count_words(text: str, chunk_size: int = 65536) -> int:
+    """len(text.split()) without building the list of words."""
+    count = 0
+    for start in range(0, len(text), chunk_size):
+        chunk = text[start:start + chunk_size]
+        count += len(chunk.split())
+        # A word running across the chunk boundary was counted twice
+        if start and not chunk[0].isspace() and not text[start - 1].isspace():
+            count -= 1
+    return count
+
+
+def has_quantified_impact(text: str) -> bool:
+    """Whether text has \\d+%, $\\d+ or "<number> users/customers/projects"."""
+    for digits in _DIGIT_RUN.finditer(text):
+        start, end = digits.span()
+        if text.startswith('%', end) or (start and text[start - 1] == '$'):
+            return True
+        if _IMPACT_UNIT.match(text, _SPACES.match(text, end).end()):
+            return True
+    return False
@@ -83,40 +83,73 @@ async function parseResumeAsync(resumeId, fileUrl) {
     if (!resume) return;
 
     let rawText = '';
+    let aiResult = null;
+    let buffer = null;
 
-    // Download file and parse
+    // Download file
     try {
       const response = await axios.get(fileUrl, { responseType: 'arraybuffer' });
-      const buffer = Buffer.from(response.data);
-
-      if (resume.fileType === 'pdf') {
-        const pdfData = await pdfParse(buffer);
-        rawText = pdfData.text;
-      } else if (['doc', 'docx'].includes(resume.fileType)) {
-        const result = await mammoth.extractRawText({ buffer });
-        rawText = result.value;
-      }
+      buffer = Buffer.from(response.data);
     } catch (downloadError) {
-      console.error('Error downloading/parsing file:', downloadError);
+      console.error('Error downloading file:', downloadError);
+    }
+
+    // Let the AI service extract the text and parse it in one step, keeping
+    // PDF/DOCX extraction off this event loop
+    if (buffer && ['pdf', 'docx'].includes(resume.fileType)) {
+      try {
+        const aiResponse = await axios.post(`${process.env.AI_SERVICE_URL}/parse-resume-file`, buffer, {
+          params: { filename: `resume.${resume.fileType}`, resumeId: resumeId.toString() },
+          headers: { 'Content-Type': 'application/octet-stream' },
+          maxBodyLength: Infinity,
+          timeout: 60000
+        });
+
+        if (aiResponse.data.success) {
+          aiResult = aiResponse.data;
+          rawText = aiResult.rawText;
+        }
+      } catch (aiError) {
+        console.error('AI file parsing error:', aiError.message);
+      }
+    }
+
+    // Fallback: extract the text here and send it to /parse-resume
+    if (!aiResult) {
+      try {
+        if (buffer && resume.fileType === 'pdf') {
+          const pdfData = await pdfParse(buffer);
+          rawText = pdfData.text;
+        } else if (buffer && ['doc', 'docx'].includes(resume.fileType)) {
+          const result = await mammoth.extractRawText({ buffer });
+          rawText = result.value;
+        }
+      } catch (parseError) {
+        console.error('Error parsing file:', parseError);
+      }
+
+      try {
+        const aiResponse = await axios.post(`${process.env.AI_SERVICE_URL}/parse-resume`, {
+          text: rawText,
+          resumeId: resumeId.toString()
+        }, { timeout: 30000 });
+
+        if (aiResponse.data.success) {
+          aiResult = aiResponse.data;
+        }
+      } catch (aiError) {
+        console.error('AI parsing error:', aiError.message);
+      }
     }
 
     // Store raw text
     resume.parsedContent = { rawText };
 
-    // Try to extract skills using AI service
-    try {
-      const aiResponse = await axios.post(`${process.env.AI_SERVICE_URL}/parse-resume`, {
-        text: rawText,
-        resumeId: resumeId.toString()
-      }, { timeout: 30000 });
-
-      if (aiResponse.data.success) {
-        resume.extractedSkills = aiResponse.data.skills;
-        resume.parsedContent.structuredData = aiResponse.data.structuredData;
-        resume.aiAnalysis = aiResponse.data.analysis;
-      }
-    } catch (aiError) {
-      console.error('AI parsing error:', aiError.message);
+    if (aiResult) {
+      resume.extractedSkills = aiResult.skills;
+      resume.parsedContent.structuredData = aiResult.structuredData;
+      resume.aiAnalysis = aiResult.analysis;
+    } else {
       // Fallback to basic skill extraction
       resume.extractedSkills = extractSkillsBasic(rawText);
     }